@@ -777,6 +777,7 @@ from .data_classes.container import (
     ContainerBase,
     Container,
     add_ivy_container_instance_methods,
+    ContainerDataLoader,
 )
 from .nested_array import NestedArray
 from ivy.utils.backend import (
@@ -957,6 +958,7 @@ globals_vars = GlobalsDict(
         "array_mode_stack": general.array_mode_stack,
         "shape_array_mode_stack": general.shape_array_mode_stack,
         "nestable_mode_stack": general.nestable_mode_stack,
+        "array_registry_mode_stack": general.array_registry_mode_stack,
         "exception_trace_mode_stack": general.exception_trace_mode_stack,
         "default_dtype_stack": data_type.default_dtype_stack,
         "default_float_dtype_stack": data_type.default_float_dtype_stack,
@@ -29,6 +29,7 @@ from .sorting import _ArrayWithSorting
 from .statistical import _ArrayWithStatistical
 from .utility import _ArrayWithUtility
 from ivy.func_wrapper import handle_view_indexing
+from ivy.utils import array_registry
 from .experimental import (
     _ArrayWithSearchingExperimental,
     _ArrayWithActivationsExperimental,
@@ -53,6 +54,77 @@ from .experimental import (
 )
 
 
+def _numpy_view(data, backend):
+    """Return a numpy view of a cpu native array, or the native array otherwise."""
+    if backend not in _native_from_numpy:
+        return data
+    try:
+        np_data = np.asarray(data)
+    except Exception:
+        # arrays on accelerators, tensors requiring grad, etc.
+        return data
+    if np_data.dtype == object:
+        return data
+    return np_data
+
+
+def _torch_from_numpy(x):
+    import torch
+
+    return torch.from_numpy(x) if x.flags.writeable else torch.tensor(x)
+
+
+def _tensorflow_from_numpy(x):
+    import tensorflow as tf
+
+    return tf.convert_to_tensor(x)
+
+
+def _jax_from_numpy(x):
+    import jax.numpy as jnp
+
+    return jnp.asarray(x)
+
+
+def _paddle_from_numpy(x):
+    import paddle
+
+    return paddle.to_tensor(x)
+
+
+# the frameworks' own constructors, so that unpickling does not set any ivy backend
+_native_from_numpy = {
+    "numpy": lambda x: x,
+    "torch": _torch_from_numpy,
+    "tensorflow": _tensorflow_from_numpy,
+    "jax": _jax_from_numpy,
+    "paddle": _paddle_from_numpy,
+}
+
+
+def _init_from_native(x, data, backend, dynamic_backend):
+    if isinstance(data, np.ndarray) and backend in _native_from_numpy:
+        data = _native_from_numpy[backend](data)
+    x._data = data
+    x._size = None
+    x._itemsize = None
+    x._strides = None
+    x._dtype = None
+    x._device = None
+    x.backend = backend
+    x._dynamic_backend = (
+        ivy.get_dynamic_backend() if dynamic_backend is None else dynamic_backend
+    )
+    if array_registry.enabled:
+        array_registry.register_array(x)
+
+
+def _rebuild_array(data, backend, dynamic_backend):
+    x = Array.__new__(Array)
+    _init_from_native(x, data, backend, dynamic_backend)
+    return x
+
+
 class Array(
     _ArrayWithActivations,
     _ArrayWithCreation,
@@ -94,48 +166,33 @@ class Array(
     _ArrayWithStatisticalExperimental,
     _ArrayWithUtilityExperimental,
 ):
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_data",
+        "_dynamic_backend",
+        "_backend",
+        "backend",
+        "_size",
+        "_itemsize",
+        "_strides",
+        "_dtype",
+        "_device",
+    )
+
+    _pre_repr = "ivy.array"
+
+    # view tracking attributes, these are only set on the instance once the array
+    # is involved in a view, otherwise the class level defaults are used
+    _base = None
+    _view_refs = ()
+    _manipulation_stack = ()
+    _torch_base = None
+    _torch_view_refs = ()
+    _torch_manipulation = None
+
     def __init__(self, data, dynamic_backend=None):
-        _ArrayWithActivations.__init__(self)
-        _ArrayWithCreation.__init__(self)
-        _ArrayWithDataTypes.__init__(self)
-        _ArrayWithDevice.__init__(self)
-        _ArrayWithElementwise.__init__(self)
-        _ArrayWithGeneral.__init__(self)
-        _ArrayWithGradients.__init__(self)
-        _ArrayWithImage.__init__(self)
-        _ArrayWithLayers.__init__(self)
-        _ArrayWithLinearAlgebra.__init__(self)
-        _ArrayWithLosses.__init__(self)
-        _ArrayWithManipulation.__init__(self)
-        _ArrayWithNorms.__init__(self)
-        _ArrayWithRandom.__init__(self)
-        _ArrayWithSearching.__init__(self)
-        _ArrayWithSet.__init__(self)
-        _ArrayWithSorting.__init__(self)
-        _ArrayWithStatistical.__init__(self)
-        _ArrayWithUtility.__init__(self)
-        _ArrayWithActivationsExperimental.__init__(self),
-        _ArrayWithConversionsExperimental.__init__(self),
-        _ArrayWithCreationExperimental.__init__(self),
-        _ArrayWithData_typeExperimental.__init__(self),
-        _ArrayWithDeviceExperimental.__init__(self),
-        _ArrayWithElementWiseExperimental.__init__(self),
-        _ArrayWithGeneralExperimental.__init__(self),
-        _ArrayWithGradientsExperimental.__init__(self),
-        _ArrayWithImageExperimental.__init__(self),
-        _ArrayWithLayersExperimental.__init__(self),
-        _ArrayWithLinearAlgebraExperimental.__init__(self),
-        _ArrayWithLossesExperimental.__init__(self),
-        _ArrayWithManipulationExperimental.__init__(self),
-        _ArrayWithNormsExperimental.__init__(self),
-        _ArrayWithRandomExperimental.__init__(self),
-        _ArrayWithSearchingExperimental.__init__(self),
-        _ArrayWithSetExperimental.__init__(self),
-        _ArrayWithSortingExperimental.__init__(self),
-        _ArrayWithStatisticalExperimental.__init__(self),
-        _ArrayWithUtilityExperimental.__init__(self),
         self._init(data, dynamic_backend)
-        self._view_attributes(data)
 
     def _init(self, data, dynamic_backend=None):
         if ivy.is_ivy_array(data):
@@ -148,32 +205,31 @@ class Array(
             raise ivy.utils.exceptions.IvyException(
                 "data must be ivy array, native array or ndarray"
             )
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._itemsize = ivy.itemsize(self._data)
-        self._strides = ivy.strides(self._data)
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy.array"
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
-        else:
-            self._post_repr = ")"
+        # the metadata is computed on first access
+        self._size = None
+        self._itemsize = None
+        self._strides = None
+        self._dtype = None
+        self._device = None
         self.backend = ivy.current_backend_str()
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.get_dynamic_backend()
+        if array_registry.enabled:
+            array_registry.register_array(self)
+
+    def _view_attributes(self):
+        if isinstance(self._view_refs, tuple):
+            self._view_refs = []
+            self._manipulation_stack = []
+            self._torch_view_refs = []
 
-    def _view_attributes(self, data):
-        self._base = None
-        self._view_refs = []
-        self._manipulation_stack = []
-        self._torch_base = None
-        self._torch_view_refs = []
-        self._torch_manipulation = None
+    def _native_backend(self):
+        # the metadata is computed lazily, so it must be computed with the backend
+        # of the native array rather than whichever backend is set at access time
+        backend = ivy.utils.backend.handler._determine_backend_from_args(self._data)
+        return ivy if backend is None else backend
 
     # Properties #
     # ---------- #
@@ -207,6 +263,8 @@ class Array(
             else:
                 np_data = to_numpy(self.data)
                 self._data = ivy.array(np_data).data
+            if array_registry.enabled:
+                array_registry.register_array(self)
 
         self._dynamic_backend = value
 
@@ -218,11 +276,15 @@ class Array(
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements."""
+        if self._dtype is None:
+            self._dtype = self._native_backend().dtype(self._data)
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = self._native_backend().dev(self._data)
         return self._device
 
     @property
@@ -254,16 +316,23 @@ class Array(
     @property
     def size(self) -> Optional[int]:
         """Number of elements in the array."""
+        if self._size is None:
+            shape = self._data.shape
+            self._size = functools.reduce(mul, shape) if len(shape) > 0 else 0
         return self._size
 
     @property
     def itemsize(self) -> Optional[int]:
         """Size of array elements in bytes."""
+        if self._itemsize is None:
+            self._itemsize = self._native_backend().itemsize(self._data)
         return self._itemsize
 
     @property
     def strides(self) -> Optional[int]:
         """Get strides across each dimension."""
+        if self._strides is None:
+            self._strides = self._native_backend().strides(self._data)
         return self._strides
 
     @property
@@ -354,22 +423,20 @@ class Array(
             # from the currently set backend
             backend = ivy.with_backend(self.backend, cached=True)
         arr_np = backend.to_numpy(self._data)
-        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self._size > 0 else np.array(arr_np)
+        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self.size > 0 else np.array(arr_np)
+        dev_str = self._native_backend().as_ivy_dev(self.device)
+        post_repr = ", dev={})".format(dev_str) if "gpu" in dev_str else ")"
         with np.printoptions(precision=dec_vals):
             repr = rep.__repr__()[:-1].partition(", dtype")[0].partition(", dev")[0]
-            return (
-                self._pre_repr
-                + repr[repr.find("(") :]
-                + self._post_repr.format(ivy.current_backend_str())
-            )
+            return self._pre_repr + repr[repr.find("(") :] + post_repr
 
     def __dir__(self):
         return self._data.__dir__()
 
-    def __getattribute__(self, item):
-        return super().__getattribute__(item)
-
     def __getattr__(self, item):
+        if item == "_data":
+            # the array has not been initialized
+            raise AttributeError(item)
         try:
             attr = self._data.__getattribute__(item)
         except AttributeError:
@@ -389,41 +456,22 @@ class Array(
             self._data.__setitem__(query, val)
         except:
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._dtype = None
 
     def __contains__(self, key):
         return self._data.__contains__(key)
 
-    def __getstate__(self):
-        data_dict = dict()
-
-        # only pickle the native array
-        data_dict["data"] = self.data
-
-        # also store the local ivy framework that created this array
-        data_dict["backend"] = self.backend
-        data_dict["device_str"] = ivy.as_ivy_dev(self.device)
-
-        return data_dict
+    def __reduce_ex__(self, protocol):
+        # the data is pickled as a numpy array from protocol 5, which numpy writes
+        # as out-of-band PickleBuffers, the native array is pickled otherwise
+        data = self._data
+        if protocol >= 5 and not isinstance(data, np.ndarray):
+            data = _numpy_view(data, self.backend)
+        return _rebuild_array, (data, self.backend, self._dynamic_backend)
 
     def __setstate__(self, state):
-        # we can construct other details of ivy.Array
-        # just by re-creating the ivy.Array using the native array
-
-        # get the required backend
-        (
-            ivy.set_backend(state["backend"])
-            if state["backend"] is not None and len(state["backend"]) > 0
-            else ivy.current_backend(state["data"])
-        )
-        ivy_array = ivy.array(state["data"])
-        ivy.previous_backend()
-
-        self.__dict__ = ivy_array.__dict__
-
-        # TODO: what about placement of the array on the right device ?
-        # device = backend.as_native_dev(state["device_str"])
-        # backend.to_device(self, device)
+        # arrays pickled as a state dict by earlier versions
+        _init_from_native(self, state["data"], state["backend"], None)
 
     def __pos__(self):
         return ivy.positive(self._data)
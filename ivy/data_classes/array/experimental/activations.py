@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithActivationsExperimental(abc.ABC):
+    __slots__ = ()
+
     def logit(
         self, /, *, eps: Optional[float] = None, out: Optional[ivy.Array] = None
     ) -> ivy.Array:
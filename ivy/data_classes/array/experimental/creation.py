@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithCreationExperimental(abc.ABC):
+    __slots__ = ()
+
     def eye_like(
         self: ivy.Array,
         /,
@@ -3,4 +3,4 @@ import abc
 
 
 class _ArrayWithData_typeExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -3,4 +3,4 @@ import abc
 
 
 class _ArrayWithGeneralExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithLinearAlgebraExperimental(abc.ABC):
+    __slots__ = ()
+
     def eigh_tridiagonal(
         self: Union[ivy.Array, ivy.NativeArray],
         beta: Union[ivy.Array, ivy.NativeArray],
@@ -8,6 +8,8 @@ import ivy
 
 
 class _ArrayWithSortingExperimental(abc.ABC):
+    __slots__ = ()
+
     def msort(
         self: ivy.Array,
         /,
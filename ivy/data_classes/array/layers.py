@@ -12,6 +12,8 @@ import ivy
 
 
 class _ArrayWithLayers(abc.ABC):
+    __slots__ = ()
+
     def linear(
         self: ivy.Array,
         weight: Union[ivy.Array, ivy.NativeArray],
@@ -245,6 +247,8 @@ class _ArrayWithLayers(abc.ABC):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """
@@ -274,6 +278,11 @@ class _ArrayWithLayers(abc.ABC):
             The mask input array. The mask to apply to the query-key values.
             Default is None. The shape of mask input should be in
             *[batch_shape,num_queries,num_keys]*.
+        is_causal
+            Whether to only let query i attend to keys 0 to i. Default is ``False``.
+        chunk_size
+            The number of keys to process at a time. Default is ``None``, in which
+            case all keys are processed at once.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -313,6 +322,8 @@ class _ArrayWithLayers(abc.ABC):
             v,
             scale,
             mask=mask,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             out=out,
         )
 
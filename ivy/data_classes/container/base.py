@@ -27,6 +27,11 @@ from builtins import set
 
 # local
 import ivy
+from ivy.data_classes.container.packed import (
+    _pack,
+    _packed_state,
+    packed_map_in_function,
+)
 
 
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
@@ -47,10 +52,93 @@ def _repr(x):
         return str(x)
 
 
+def _h5_read(dataset, query, ivyh):
+    # h5py reads the selection straight into a freshly allocated numpy array,
+    # which the numpy backend then wraps without copying
+    return ivy.default(ivyh, ivy).asarray(dataset[query])
+
+
+def _compose_slices(outer, inner, length):
+    # express inner[outer-sliced axis] directly on the dataset, returns None when
+    # the composition is not a contiguous forward slice or an index
+    indices = range(*outer.indices(length))
+    if isinstance(inner, int):
+        return indices[inner]
+    if isinstance(inner, slice) and inner.step in (None, 1):
+        indices = indices[inner]
+        if indices.step == 1:
+            return slice(indices.start, max(indices.stop, indices.start))
+    return None
+
+
+_FLAT_MAGIC = b"IVYFLAT\x00"
+_FLAT_VERSION = 1
+
+
+def _flat_align(offset, alignment):
+    return -(-offset // alignment) * alignment
+
+
+class _LazyH5Dataset:
+    """
+    Leaf of a lazily loaded hdf5 container.
+
+    Only the dataset handle and the slice along the batch axis are stored, the
+    values are read from disk when the leaf is indexed, for example when the
+    container is sliced, and ``leaf[...]`` reads the whole (sliced) dataset.
+    """
+
+    __slots__ = ("_dataset", "_slice_obj", "_ivyh")
+
+    def __init__(self, dataset, slice_obj=slice(None), ivyh=None):
+        self._dataset = dataset
+        self._slice_obj = slice_obj
+        self._ivyh = ivyh
+
+    @property
+    def shape(self):
+        batch_size = len(range(*self._slice_obj.indices(self._dataset.shape[0])))
+        return (batch_size,) + tuple(self._dataset.shape[1:])
+
+    @property
+    def ndim(self):
+        return self._dataset.ndim
+
+    @property
+    def dtype(self):
+        return self._dataset.dtype
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, query):
+        if query is Ellipsis:
+            return _h5_read(self._dataset, self._slice_obj, self._ivyh)
+        first, rest = (
+            (query[0], query[1:]) if isinstance(query, tuple) and query else (query, ())
+        )
+        composed = _compose_slices(self._slice_obj, first, self._dataset.shape[0])
+        if composed is None:
+            return self[...][query]
+        return _h5_read(self._dataset, (composed,) + tuple(rest), self._ivyh)
+
+    def __array__(self, dtype=None, copy=None):
+        ret = self._dataset[self._slice_obj]
+        return ret if dtype is None else ret.astype(dtype, copy=False)
+
+    def __repr__(self):
+        return "<lazy hdf5 dataset {} shape={} dtype={}>".format(
+            self._dataset.name, self.shape, self.dtype
+        )
+
+
 # noinspection PyMissingConstructor
 
 
 class ContainerBase(dict, abc.ABC):
+    # (layout, buffers, leaves, leaf data) of containers returned by cont_pack
+    _cont_packed = None
+
     def __init__(
         self,
         dict_in=None,
@@ -161,6 +249,8 @@ class ContainerBase(dict, abc.ABC):
         )
         self._config = dict()
         self.cont_inplace_update(dict_in, **self._config_in)
+        if ivy.utils.array_registry.enabled:
+            ivy.utils.array_registry.register_container(self)
 
     # Class Methods #
     # --------------#
@@ -175,6 +265,11 @@ class ContainerBase(dict, abc.ABC):
         out=None,
         **kwargs,
     ) -> Union[Tuple[ivy.Container, ivy.Container], ivy.Container]:
+        if key_chains is None and to_apply and out is None:
+            # packed containers are computed with one call per flat buffer
+            ret = packed_map_in_function(fn, args, kwargs)
+            if ret is not None:
+                return ret
         inspect_fn = fn
         if isinstance(fn, str):
             inspect_fn = ivy.__dict__[fn]
@@ -1095,7 +1190,11 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """
         Load container object from disk, as an h5py file, at the specified hdf5
@@ -1113,6 +1212,12 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to defer reading the datasets. If ``True``, the leaves only keep
+            a handle to their dataset and read from disk when indexed, so slicing
+            the container only reads the requested rows, and ``leaf[...]`` reads
+            the full leaf. The file is kept open for as long as the leaves are
+            alive. Default is ``False``.
 
         Returns
         -------
@@ -1134,17 +1239,93 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh, lazy
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
-                )
+                if lazy and value.shape:
+                    container_dict[key] = _LazyH5Dataset(value, slice_obj, ivyh)
+                else:
+                    container_dict[key] = _h5_read(
+                        value, slice_obj if value.shape else (), ivyh
+                    )
             else:
                 raise ivy.utils.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
-        return ivy.Container(container_dict, ivyh=ivyh)
+        if type(h5_obj_or_filepath) is str and not lazy:
+            h5_obj.close()
+        return ivy.Container(
+            container_dict, ivyh=ivyh, alphabetical_keys=alphabetical_keys
+        )
+
+    @staticmethod
+    def cont_iter_from_disk_as_hdf5(
+        h5_obj_or_filepath,
+        batch_size,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        drop_last=False,
+    ):
+        """
+        Iterate over an hdf5 file in batches along the first axis, without loading
+        the whole file into memory. Each batch is read directly from disk into
+        arrays.
+
+        Parameters
+        ----------
+        h5_obj_or_filepath
+            Filepath where the container object is saved to disk, or h5 object.
+        batch_size
+            Number of entries along the first axis of every dataset to load per
+            batch.
+        slice_obj
+            slice object selecting the entries to iterate over.
+            (Default value = slice(None))
+        alphabetical_keys
+            Whether to sort the container keys alphabetically, or preserve the dict
+            order. Default is ``True``.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+        drop_last
+            Whether to skip the final batch if it holds fewer than ``batch_size``
+            entries. Default is ``False``.
+
+        Yields
+        ------
+            Containers holding consecutive batches of the file.
+        """
+        ivy.utils.assertions.check_exists(
+            h5py,
+            message=(
+                "You must install python package h5py in order to load hdf5 "
+                "files from disk into a container."
+            ),
+        )
+        if type(h5_obj_or_filepath) is str:
+            h5_obj = h5py.File(h5_obj_or_filepath, "r")
+        else:
+            h5_obj = h5_obj_or_filepath
+        try:
+            lazy_cont = ivy.Container.cont_from_disk_as_hdf5(
+                h5_obj, slice_obj, alphabetical_keys, ivyh, lazy=True
+            )
+            num_entries = min(
+                [
+                    len(v)
+                    for v in lazy_cont.cont_to_iterator_values()
+                    if isinstance(v, _LazyH5Dataset)
+                ],
+                default=0,
+            )
+            if drop_last:
+                num_entries -= num_entries % batch_size
+            for start in range(0, num_entries, batch_size):
+                yield lazy_cont[start : min(start + batch_size, num_entries)]
+        finally:
+            if type(h5_obj_or_filepath) is str:
+                h5_obj.close()
 
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
@@ -1169,6 +1350,69 @@ class ContainerBase(dict, abc.ABC):
             ivyh=ivyh,
         ).to_ivy()
 
+    @staticmethod
+    def cont_from_disk_as_flat(flat_filepath, mmap=True, ivyh=None):
+        """
+        Load container object from disk at the specified flat filepath, as written by
+        ``cont_to_disk_as_flat``.
+
+        Parameters
+        ----------
+        flat_filepath
+            Filepath where the container object is saved to disk.
+        mmap
+            Whether to memory map the file. If ``True``, only the header is read and
+            the leaves are copy-on-write ``numpy.memmap`` views, which are paged in
+            from disk when they are accessed. Otherwise the leaves are read into
+            memory. Default is ``True``.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+        """
+        with open(flat_filepath, "rb") as f:
+            magic = f.read(len(_FLAT_MAGIC))
+            if magic != _FLAT_MAGIC:
+                raise ivy.utils.exceptions.IvyException(
+                    "{} is not a flat container file.".format(flat_filepath)
+                )
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size).decode("utf-8"))
+            if header["version"] > _FLAT_VERSION:
+                raise ivy.utils.exceptions.IvyException(
+                    "flat container file version {} is not supported.".format(
+                        header["version"]
+                    )
+                )
+            buffer = None
+            if mmap and header["leaves"]:
+                buffer = np.memmap(f, dtype=np.uint8, mode="c")
+            _ivy = ivy.default(ivyh, ivy)
+            container_dict = dict()
+            for leaf in header["leaves"]:
+                dtype = np.dtype(leaf["dtype"])
+                shape = tuple(leaf["shape"])
+                count = int(np.prod(shape))
+                if buffer is not None:
+                    offset = leaf["offset"]
+                    value = (
+                        buffer[offset : offset + count * dtype.itemsize]
+                        .view(dtype)
+                        .reshape(shape)
+                    )
+                else:
+                    f.seek(leaf["offset"])
+                    value = np.fromfile(f, dtype=dtype, count=count).reshape(shape)
+                *keys, leaf_key = leaf["key_chain"].split("/")
+                sub_dict = container_dict
+                for key in keys:
+                    sub_dict = sub_dict.setdefault(key, dict())
+                sub_dict[leaf_key] = _ivy.asarray(value)
+        return ivy.Container(container_dict, ivyh=ivyh, alphabetical_keys=False)
+
     @staticmethod
     def cont_from_disk_as_json(json_filepath, ivyh=None):
         """
@@ -2015,7 +2259,66 @@ class ContainerBase(dict, abc.ABC):
         pickle_filepath
             Filepath for where to save the container to disk.
         """
-        pickle.dump(self.to_native().cont_to_dict(), open(pickle_filepath, "wb"))
+        # protocol 5 writes the array buffers without an intermediate bytes copy
+        pickle.dump(
+            self.to_native().cont_to_dict(), open(pickle_filepath, "wb"), protocol=5
+        )
+
+    def cont_to_disk_as_flat(self, flat_filepath, alignment=64):
+        """
+        Save container object to disk, as a flat file, at the specified filepath.
+
+        The file starts with a json header holding the key chain, dtype, shape and
+        byte offset of every leaf, followed by the raw leaf buffers, each aligned to
+        ``alignment`` bytes, so that ``cont_from_disk_as_flat`` can memory map them.
+
+        Parameters
+        ----------
+        flat_filepath
+            Filepath for where to save the container to disk.
+        alignment
+            The alignment in bytes of the leaf buffers in the file. Default is 64.
+        """
+        leaves = list()
+        arrays = list()
+        for key_chain, value in self.cont_to_iterator():
+            value = np.asarray(self._cont_ivy.to_numpy(value), order="C")
+            if value.dtype.hasobject:
+                raise ivy.utils.exceptions.IvyException(
+                    "the leaf at {} cannot be saved as a flat buffer.".format(key_chain)
+                )
+            leaves.append(
+                {
+                    "key_chain": key_chain,
+                    "dtype": value.dtype.str,
+                    "shape": list(value.shape),
+                    "offset": 0,
+                }
+            )
+            arrays.append(value)
+
+        # the offsets depend on the header size, which depends on the offsets
+        header_size = 0
+        while True:
+            offset = _flat_align(len(_FLAT_MAGIC) + 8 + header_size, alignment)
+            for leaf, value in zip(leaves, arrays):
+                leaf["offset"] = offset
+                offset = _flat_align(offset + value.nbytes, alignment)
+            header = json.dumps(
+                {"version": _FLAT_VERSION, "alignment": alignment, "leaves": leaves}
+            ).encode("utf-8")
+            if len(header) <= header_size:
+                break
+            header_size = len(header)
+        header = header.ljust(header_size)
+
+        with open(flat_filepath, "wb") as f:
+            f.write(_FLAT_MAGIC)
+            f.write(header_size.to_bytes(8, "little"))
+            f.write(header)
+            for leaf, value in zip(leaves, arrays):
+                f.write(b"\x00" * (leaf["offset"] - f.tell()))
+                f.write(memoryview(value.reshape(-1)).cast("B"))
 
     def cont_to_jsonable(self, return_dict=None):
         """
@@ -3133,6 +3436,39 @@ class ContainerBase(dict, abc.ABC):
     def __deepcopy__(self, memo):
         return self.cont_deep_copy()
 
+    def cont_pack(self, like=None):
+        """
+        Pack the leaves into one flat contiguous buffer per dtype and device.
+
+        The returned container holds the same values, with every leaf a view into
+        the buffer of its group. Elementwise operations between containers packed
+        with the same layout, such as arithmetic operators, ivy elementwise
+        functions and the optimizer updates, then run as one call per buffer rather
+        than one call per leaf. Replacing a leaf makes the container unpacked again.
+
+        Parameters
+        ----------
+        like
+            Packed container whose layout should be reused, so that the result can
+            be combined with it on the flat buffers. Default is ``None``, in which
+            case the leaves are grouped by dtype and device.
+
+        Returns
+        -------
+            Container with the same structure, whose leaves are views of the flat
+            buffers.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b=ivy.array([[3.], [4.]]))
+        >>> x = x.cont_pack()
+        >>> print(x.cont_packed_buffers)
+        [ivy.array([1., 2., 3., 4.])]
+        >>> print((x * 2).cont_packed_buffers)
+        [ivy.array([2., 4., 6., 8.])]
+        """
+        return _pack(self, like)
+
     def cont_map(
         self,
         func,
@@ -4145,6 +4481,7 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        state_dict.pop("_cont_packed", None)
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
@@ -4262,6 +4599,17 @@ class ContainerBase(dict, abc.ABC):
             return 0
         return max([len(kc.split("/")) for kc in kcs])
 
+    @property
+    def cont_packed_buffers(self):
+        """
+        The flat buffers holding the leaves of a container returned by cont_pack,
+        one per dtype and device.
+
+        None is returned if the container is not packed.
+        """
+        packed = _packed_state(self)
+        return None if packed is None else list(packed[1])
+
     @property
     def dynamic_backend(self):
         return self._dynamic_backend
@@ -3,6 +3,7 @@ import operator
 
 # local
 import ivy
+from .packed import packed_operator
 from .activations import _ContainerWithActivations
 from .base import ContainerBase
 from .conversions import _ContainerWithConversions
@@ -137,9 +138,11 @@ class Container(
     def __pos__(self):
         return self
 
+    @packed_operator(operator.neg)
     def __neg__(self):
         return self.cont_map(lambda x, kc: -x, map_sequences=True)
 
+    @packed_operator(operator.pow)
     def __pow__(self, power):
         """
         ivy.Container special method for the power operator, calling
@@ -186,9 +189,11 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x**power, map_sequences=True)
 
+    @packed_operator(operator.pow, reverse=True)
     def __rpow__(self, power):
         return self.cont_map(lambda x, kc: power**x, map_sequences=True)
 
+    @packed_operator(operator.pow, inplace=True)
     def __ipow__(self, power):
         if isinstance(power, ivy.Container):
             return ivy.Container.cont_multi_map(
@@ -196,6 +201,7 @@ class Container(
             )
         return self.cont_map(lambda x, _: operator.ipow(x, power), map_sequences=True)
 
+    @packed_operator(operator.add)
     def __add__(self, other):
         """ivy.Container special method for the add operator, calling
         :code:`operator.add` for each of the corresponding leaves of the two
@@ -261,6 +267,7 @@ class Container(
             lambda xs, _: operator.add(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @packed_operator(operator.add, reverse=True)
     def __radd__(self, other):
         """
         ivy.Container reverse special method for the add operator, calling
@@ -295,11 +302,13 @@ class Container(
             lambda xs, _: operator.add(xs[0], xs[1]), [other, self], map_nests=True
         )
 
+    @packed_operator(operator.add, inplace=True)
     def __iadd__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.iadd(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @packed_operator(operator.sub)
     def __sub__(self, other):
         """
         ivy.Container special method for the subtract operator, calling
@@ -365,11 +374,13 @@ class Container(
             lambda xs, _: operator.sub(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @packed_operator(operator.sub, inplace=True)
     def __isub__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.isub(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @packed_operator(operator.sub, reverse=True)
     def __rsub__(self, other):
         """
         ivy.Container reverse special method for the subtract operator, calling
@@ -404,16 +415,19 @@ class Container(
             lambda xs, _: operator.sub(xs[0], xs[1]), [other, self], map_nests=True
         )
 
+    @packed_operator(operator.mul)
     def __mul__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @packed_operator(operator.mul, reverse=True)
     def __rmul__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [other, self], map_nests=True
         )
 
+    @packed_operator(operator.mul, inplace=True)
     def __imul__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.imul(xs[0], xs[1]), [self, other], map_nests=True
@@ -452,6 +466,7 @@ class Container(
             map_nests=True,
         )
 
+    @packed_operator(operator.truediv)
     def __truediv__(self, other):
         """
         ivy.Container special method for the divide operator, calling
@@ -503,11 +518,13 @@ class Container(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @packed_operator(operator.truediv, reverse=True)
     def __rtruediv__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [other, self], map_nests=True
         )
 
+    @packed_operator(operator.truediv, inplace=True)
     def __itruediv__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.itruediv(xs[0], xs[1]), [self, other], map_nests=True
@@ -569,6 +586,7 @@ class Container(
             lambda x, kc: operator.imatmul(x, other), map_sequences=True
         )
 
+    @packed_operator(operator.abs)
     def __abs__(self):
         """
         ivy.Container special method for the abs operator, calling
@@ -0,0 +1,366 @@
+"""Multiprocess loading of container batches through shared memory."""
+
+# global
+import time
+import queue
+import traceback
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+# local
+import ivy
+
+_ALIGNMENT = 64
+
+
+def _align(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _flatten(batch, key_chain=""):
+    # containers are dicts, so nested dicts and containers are flattened alike
+    for key, value in batch.items():
+        child_key_chain = key_chain + "/" + key if key_chain else key
+        if isinstance(value, dict):
+            yield from _flatten(value, child_key_chain)
+        else:
+            yield child_key_chain, value
+
+
+def _unflatten(leaves):
+    ret = dict()
+    for key_chain, value in leaves:
+        *keys, leaf_key = key_chain.split("/")
+        sub_dict = ret
+        for key in keys:
+            sub_dict = sub_dict.setdefault(key, dict())
+        sub_dict[leaf_key] = value
+    return ret
+
+
+def _to_numpy(x):
+    if isinstance(x, np.ndarray):
+        return x
+    if ivy.is_array(x):
+        return ivy.to_numpy(x)
+    return np.asarray(x)
+
+
+def _worker_loop(batch_fn, slot_names, task_queue, result_queue):
+    # the workers share the resource tracker of the loader, which unlinks the slots
+    slots = [shared_memory.SharedMemory(name=name) for name in slot_names]
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            index, slot = task
+            try:
+                leaves = [(kc, _to_numpy(v)) for kc, v in _flatten(batch_fn(index))]
+                header = list()
+                offset = 0
+                for key_chain, value in leaves:
+                    header.append((key_chain, value.dtype.str, value.shape, offset))
+                    offset = _align(offset + value.nbytes)
+                if offset > slots[slot].size or any(
+                    v.dtype.hasobject for _, v in leaves
+                ):
+                    # does not fit in shared memory, sent through the queue instead
+                    result_queue.put(("pickled", index, slot, leaves))
+                    continue
+                buf = slots[slot].buf
+                for (_, dtype, shape, offset), (_, value) in zip(header, leaves):
+                    np.ndarray(shape, dtype, buffer=buf, offset=offset)[...] = value
+                result_queue.put(("shared", index, slot, header))
+            except Exception:
+                result_queue.put(("error", index, slot, traceback.format_exc()))
+    finally:
+        for shm in slots:
+            shm.close()
+
+
+class ContainerDataLoader:
+    """
+    Load batches of containers with worker processes, through shared memory.
+
+    Each worker calls ``batch_fn(index)`` for the batch indices it is given, and
+    writes the leaves of the returned (nested) dict or container into one of
+    ``prefetch`` shared memory slots. The consumer wraps the leaves of a slot as
+    container leaves without copying them. A slot is handed back to the workers when
+    the next batch is requested, so the leaves of a batch are only valid until then,
+    unless ``copy`` is ``True``. Batches which do not fit in a slot are sent through
+    the result queue instead. The loader can only be iterated once at a time, and
+    the batches prefetched by an iteration which is left early are discarded.
+
+    Parameters
+    ----------
+    batch_fn
+        Function returning the batch at a given index, as a nested dict or container
+        of arrays. It is called in the worker processes, so it must be picklable
+        for start methods other than fork.
+    num_batches
+        The number of batches in an epoch.
+    num_workers
+        The number of worker processes. Default is ``2``.
+    prefetch
+        The number of batches loaded ahead of the consumer, which is the number of
+        shared memory slots. Default is twice ``num_workers``.
+    ordered
+        Whether to yield the batches in index order, or as soon as they are loaded.
+        Default is ``True``.
+    slot_size
+        The size in bytes of each shared memory slot. Default is 64 MiB.
+    copy
+        Whether to copy the leaves out of shared memory, so that the batches stay
+        valid after the next one is requested. Default is ``False``.
+    timeout
+        The time in seconds to wait for a batch before raising, which must be
+        positive. Default is the global queue timeout.
+    start_method
+        The multiprocessing start method of the workers. Default is the platform
+        default.
+    ivyh
+        Handle to ivy module to use for the batches. Default is ``None``, which
+        results in the global ivy.
+
+    Examples
+    --------
+    >>> def batch_fn(i):
+    ...     return {"x": np.full((32, 8), i, dtype=np.float32)}
+    >>> with ivy.ContainerDataLoader(batch_fn, 100, num_workers=2) as loader:
+    ...     for batch in loader:
+    ...         train_step(batch)
+    ...     print(loader.stall_fraction)
+    """
+
+    def __init__(
+        self,
+        batch_fn,
+        num_batches,
+        /,
+        *,
+        num_workers=2,
+        prefetch=None,
+        ordered=True,
+        slot_size=64 * 2**20,
+        copy=False,
+        timeout=None,
+        start_method=None,
+        ivyh=None,
+    ):
+        ivy.utils.assertions.check_greater(num_workers, 0)
+        self._batch_fn = batch_fn
+        self._num_batches = num_batches
+        self._num_workers = num_workers
+        self._prefetch = ivy.default(prefetch, 2 * num_workers)
+        ivy.utils.assertions.check_greater(self._prefetch, 0)
+        self._ordered = ordered
+        self._slot_size = slot_size
+        self._copy = copy
+        self._timeout = ivy.default(timeout, ivy.get_queue_timeout())
+        ivy.utils.assertions.check_greater(
+            self._timeout,
+            0,
+            message="timeout must be positive, got {}".format(self._timeout),
+        )
+        self._context = multiprocessing.get_context(start_method)
+        self._ivy = ivy.default(ivyh, ivy)
+        self._slots = None
+        self._workers = None
+        self._iterating = False
+        self.stall_time = 0.0
+        self.num_loaded = 0
+        self._elapsed = 0.0
+
+    # Properties #
+    # -----------#
+
+    @property
+    def stall_fraction(self):
+        """The fraction of the iteration time spent waiting for batches."""
+        return self.stall_time / self._elapsed if self._elapsed else 0.0
+
+    @property
+    def stats(self):
+        """Loading statistics, to see whether the consumer is input bound."""
+        return {
+            "batches": self.num_loaded,
+            "stall_time": self.stall_time,
+            "elapsed_time": self._elapsed,
+            "stall_fraction": self.stall_fraction,
+        }
+
+    # Workers #
+    # --------#
+
+    def start(self):
+        """Allocate the shared memory slots and start the worker processes."""
+        if self._workers is not None:
+            return
+        self._slots = [
+            shared_memory.SharedMemory(create=True, size=self._slot_size)
+            for _ in range(self._prefetch)
+        ]
+        self._task_queue = self._context.Queue()
+        self._result_queue = self._context.Queue()
+        slot_names = [shm.name for shm in self._slots]
+        self._workers = [
+            self._context.Process(
+                target=_worker_loop,
+                args=(self._batch_fn, slot_names, self._task_queue, self._result_queue),
+                daemon=True,
+            )
+            for _ in range(self._num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def close(self):
+        """Stop the worker processes and release the shared memory slots."""
+        if self._workers is None:
+            return
+        for _ in self._workers:
+            self._task_queue.put(None)
+        # results left unread would block the workers from exiting, so drain them
+        deadline = time.perf_counter() + self._timeout
+        while any(w.is_alive() for w in self._workers):
+            if time.perf_counter() > deadline:
+                break
+            try:
+                self._result_queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        self._workers = None
+        for shm in self._slots:
+            try:
+                shm.close()
+            except BufferError:
+                # leaves of the last batches still reference the slot, the memory
+                # is released once they are garbage collected
+                pass
+            shm.unlink()
+        self._slots = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # Iteration #
+    # ----------#
+
+    def __len__(self):
+        return self._num_batches
+
+    def _get_result(self):
+        start = time.perf_counter()
+        deadline = start + self._timeout
+        while True:
+            try:
+                result = self._result_queue.get(timeout=min(1.0, self._timeout))
+                break
+            except queue.Empty:
+                dead = [w.exitcode for w in self._workers if not w.is_alive()]
+                if dead:
+                    raise ivy.utils.exceptions.IvyException(
+                        "data loader worker exited with code {}".format(dead[0])
+                    )
+                if time.perf_counter() > deadline:
+                    raise ivy.utils.exceptions.IvyException(
+                        "timed out waiting for a batch from the data loader workers"
+                    )
+        self.stall_time += time.perf_counter() - start
+        return result
+
+    def _to_container(self, kind, slot, payload):
+        if kind == "pickled":
+            leaves = payload
+        else:
+            buf = self._slots[slot].buf
+            leaves = [
+                (key_chain, np.ndarray(shape, dtype, buffer=buf, offset=offset))
+                for key_chain, dtype, shape, offset in payload
+            ]
+        if self._copy:
+            leaves = [(key_chain, value.copy()) for key_chain, value in leaves]
+        return ivy.Container(
+            _unflatten((kc, self._ivy.asarray(v)) for kc, v in leaves),
+            ivyh=self._ivy if self._ivy is not ivy else None,
+            alphabetical_keys=False,
+        )
+
+    def _drain(self, num_results):
+        # discard the results of an iteration which was left early, so that they
+        # are not taken for the batches of the next one
+        for _ in range(num_results):
+            try:
+                self._result_queue.get(timeout=self._timeout)
+            except queue.Empty:
+                # the workers are stuck, so they are restarted on the next iteration
+                self.close()
+                return
+
+    def __iter__(self):
+        if self._iterating:
+            raise ivy.utils.exceptions.IvyException(
+                "the data loader cannot be iterated while a previous iteration is "
+                "still in progress"
+            )
+        self.start()
+        self._iterating = True
+        start = time.perf_counter()
+        free_slots = list(range(self._prefetch))
+        next_index = 0
+        num_received = 0
+        next_to_yield = 0
+        pending = dict()
+        try:
+            while next_to_yield < self._num_batches:
+                while free_slots and next_index < self._num_batches:
+                    self._task_queue.put((next_index, free_slots.pop()))
+                    next_index += 1
+                if self._ordered and next_to_yield in pending:
+                    index = next_to_yield
+                    kind, slot, payload = pending.pop(index)
+                else:
+                    kind, index, slot, payload = self._get_result()
+                    num_received += 1
+                    if kind == "error":
+                        raise ivy.utils.exceptions.IvyException(
+                            "data loader worker failed on batch {}:\n{}".format(
+                                index, payload
+                            )
+                        )
+                    if self._ordered and index != next_to_yield:
+                        pending[index] = (kind, slot, payload)
+                        continue
+                batch = self._to_container(kind, slot, payload)
+                held_slot = kind == "shared" and not self._copy
+                if not held_slot:
+                    free_slots.append(slot)
+                next_to_yield += 1
+                self.num_loaded += 1
+                self._elapsed += time.perf_counter() - start
+                yield batch
+                start = time.perf_counter()
+                # the batch is done with once the next one is requested, so its slot
+                # can be refilled before waiting for the next result
+                if held_slot:
+                    free_slots.append(slot)
+            self._elapsed += time.perf_counter() - start
+        finally:
+            self._iterating = False
+            self._drain(next_index - num_received)
@@ -636,6 +636,8 @@ class _ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -669,6 +671,11 @@ class _ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        is_causal
+            Whether to only let query i attend to keys 0 to i. Default is ``False``.
+        chunk_size
+            The number of keys to process at a time. Default is ``None``, in which
+            case all keys are processed at once.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -731,6 +738,8 @@ class _ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -746,6 +755,8 @@ class _ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -779,6 +790,11 @@ class _ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        is_causal
+            Whether to only let query i attend to keys 0 to i. Default is ``False``.
+        chunk_size
+            The number of keys to process at a time. Default is ``None``, in which
+            case all keys are processed at once.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -839,6 +855,8 @@ class _ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -861,6 +879,8 @@ class _ContainerWithLayers(ContainerBase):
         to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -880,6 +900,8 @@ class _ContainerWithLayers(ContainerBase):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -901,6 +923,8 @@ class _ContainerWithLayers(ContainerBase):
         to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        is_causal: bool = False,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -919,6 +943,8 @@ class _ContainerWithLayers(ContainerBase):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            is_causal=is_causal,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -0,0 +1,411 @@
+"""Packing of container leaves into flat buffers, for fused leaf-wise math."""
+
+# global
+import functools
+import inspect
+
+# local
+import ivy
+
+
+# leaf-wise functions which can be applied to the flat buffers of packed containers
+# directly, as every output element only depends on the input elements at the same
+# position. The functions of ivy/functional/ivy/elementwise.py are added lazily.
+_ELEMENTWISE_FN_NAMES = {"stable_divide", "stable_pow", "stop_gradient"}
+_ELEMENTWISE_MODULE_ADDED = False
+
+# optimizer updates which are leaf-wise given scalar or per-leaf learning rates, and
+# are therefore applied to the flat buffers directly
+_FUSED_UPDATE_FN_NAMES = {
+    "adam_step",
+    "adam_update",
+    "gradient_descent_update",
+    "optimizer_update",
+}
+
+# optimizer updates which reduce over each leaf, and are therefore computed by running
+# their ivy implementation on the packed containers themselves
+_COMPOSITE_UPDATE_FN_NAMES = {"lamb_update", "lars_update"}
+
+_SCALAR_TYPES = (int, float, bool, complex)
+
+
+def _elementwise_fn_names():
+    global _ELEMENTWISE_MODULE_ADDED
+    if not _ELEMENTWISE_MODULE_ADDED:
+        from ivy.functional.ivy import elementwise
+
+        _ELEMENTWISE_FN_NAMES.update(
+            name
+            for name, fn in vars(elementwise).items()
+            if callable(fn)
+            and getattr(fn, "__module__", None) == elementwise.__name__
+            and not name.startswith("_")
+        )
+        _ELEMENTWISE_MODULE_ADDED = True
+    return _ELEMENTWISE_FN_NAMES
+
+
+class _PackedGroup:
+    """Leaves sharing one flat buffer, given by their positions in the layout."""
+
+    __slots__ = ("positions", "shapes", "sizes", "offsets", "numel", "_bounds")
+
+    def __init__(self, positions, shapes):
+        self.positions = tuple(positions)
+        self.shapes = tuple(shapes)
+        self.sizes = tuple(int(_numel(shape)) for shape in shapes)
+        offsets = [0]
+        for size in self.sizes:
+            offsets.append(offsets[-1] + size)
+        self.offsets = tuple(offsets[:-1])
+        self.numel = offsets[-1]
+        self._bounds = None
+
+    def bounds(self):
+        # start and end indices of each leaf within the zero-prefixed cumulative sum
+        # of the buffer, used for segment sums
+        if self._bounds is None:
+            self._bounds = (
+                ivy.array(list(self.offsets), dtype="int64"),
+                ivy.array(
+                    [o + s for o, s in zip(self.offsets, self.sizes)], dtype="int64"
+                ),
+            )
+        return self._bounds
+
+
+class _PackedLayout:
+    """
+    Structure of a packed container.
+
+    Layouts are shared by every container produced from the same packing, so
+    compatibility checks between packed containers are identity checks.
+    """
+
+    __slots__ = ("key_chains", "groups", "min_ndim", "_reduced")
+
+    def __init__(self, key_chains, groups):
+        self.key_chains = tuple(key_chains)
+        self.groups = tuple(groups)
+        self.min_ndim = min(
+            [len(shape) for group in self.groups for shape in group.shapes],
+            default=0,
+        )
+        self._reduced = None
+
+    @property
+    def reduced(self):
+        """Layout of the same leaves, each reduced to a scalar."""
+        if self._reduced is None:
+            self._reduced = _PackedLayout(
+                self.key_chains,
+                [
+                    _PackedGroup(group.positions, [()] * len(group.positions))
+                    for group in self.groups
+                ],
+            )
+        return self._reduced
+
+
+def _numel(shape):
+    ret = 1
+    for dim in shape:
+        ret *= dim
+    return ret
+
+
+def _native(x):
+    return x.data if isinstance(x, ivy.Array) else x
+
+
+def _build(template, layout, buffers):
+    """Return a packed container with the structure of template over buffers."""
+    backend = ivy.current_backend()
+    leaves = [None] * len(layout.key_chains)
+    for group, buffer in zip(layout.groups, buffers):
+        flat = _native(buffer)
+        for position, shape, offset, size in zip(
+            group.positions, group.shapes, group.offsets, group.sizes
+        ):
+            leaves[position] = ivy.Array(
+                backend.reshape(flat[offset : offset + size], shape)
+            )
+    leaf_iter = iter(leaves)
+    ret = template.cont_map(lambda x, kc: next(leaf_iter))
+    ret._cont_packed = (
+        layout,
+        tuple(buffers),
+        tuple(leaves),
+        tuple(leaf.data for leaf in leaves),
+    )
+    return ret
+
+
+def _pack(cont, like=None):
+    """Copy the leaves of cont into flat buffers, and return them as views."""
+    backend = ivy.current_backend()
+    items = list(cont.cont_to_iterator())
+    key_chains = [kc for kc, _ in items]
+    leaves = [ivy.to_native(v) for _, v in items]
+    for kc, leaf in zip(key_chains, leaves):
+        if not ivy.is_native_array(leaf):
+            raise ivy.utils.exceptions.IvyException(
+                "only containers of arrays can be packed, but found {} at {}".format(
+                    type(leaf), kc
+                )
+            )
+    if like is not None:
+        like_packed = _packed_state(like)
+        if like_packed is None:
+            raise ivy.utils.exceptions.IvyException(
+                "the container to take the layout from is not packed"
+            )
+        layout = like_packed[0]
+        if tuple(key_chains) != layout.key_chains or any(
+            tuple(leaves[p].shape) != tuple(shape)
+            for group in layout.groups
+            for p, shape in zip(group.positions, group.shapes)
+        ):
+            raise ivy.utils.exceptions.IvyException(
+                "the container does not have the structure of the packed container"
+            )
+    else:
+        positions = dict()
+        for position, leaf in enumerate(leaves):
+            key = (ivy.dtype(leaf), ivy.dev(leaf))
+            positions.setdefault(key, []).append(position)
+        layout = _PackedLayout(
+            key_chains,
+            [
+                _PackedGroup(ps, [tuple(leaves[p].shape) for p in ps])
+                for ps in positions.values()
+            ],
+        )
+    buffers = [
+        ivy.Array(
+            backend.concat(
+                [backend.reshape(leaves[p], (-1,)) for p in group.positions], axis=0
+            )
+        )
+        for group in layout.groups
+    ]
+    return _build(cont, layout, buffers)
+
+
+def _packed_state(cont):
+    """Return the packing of cont, or None if it is not packed or was modified."""
+    packed = cont._cont_packed
+    if packed is None:
+        return None
+    leaves = list(cont.cont_to_iterator_values())
+    if len(leaves) != len(packed[2]) or any(
+        leaf is not packed_leaf or leaf.data is not data
+        for leaf, packed_leaf, data in zip(leaves, packed[2], packed[3])
+    ):
+        # a leaf was replaced or updated out of place, the views are stale
+        cont._cont_packed = None
+        return None
+    return packed
+
+
+def _operands_layout(operands):
+    """
+    Return the layout of the packed containers among operands, and their packings.
+
+    None is returned if any container is not packed or the layouts differ, or if
+    any other operand cannot be broadcast to the flat buffers, in which case the
+    operation has to be mapped over the leaves.
+    """
+    layout, states = None, dict()
+    for i, operand in enumerate(operands):
+        if not isinstance(operand, ivy.Container):
+            continue
+        state = _packed_state(operand)
+        if state is None:
+            return None, None
+        states[i] = state
+        if layout is None or state[0] is layout or state[0] is layout.reduced:
+            layout = state[0] if layout is None else layout
+        elif layout is state[0].reduced:
+            # the containers seen so far hold one value per leaf of this one
+            layout = state[0]
+        else:
+            return None, None
+    if layout is None:
+        return None, None
+    for i, operand in enumerate(operands):
+        if i in states or isinstance(operand, _SCALAR_TYPES) or operand is None:
+            continue
+        if ivy.is_array(operand) and (
+            _numel(operand.shape) == 1 and len(operand.shape) <= layout.min_ndim
+        ):
+            continue
+        return None, None
+    return layout, states
+
+
+def _group_operands(operands, states, layout, group_idx):
+    group = layout.groups[group_idx]
+    ret = list()
+    for i, operand in enumerate(operands):
+        if i not in states:
+            ret.append(operand)
+            continue
+        op_layout, buffers = states[i][0], states[i][1]
+        buffer = buffers[group_idx]
+        if op_layout is not layout:
+            # one value per leaf, broadcast over the elements of each leaf
+            buffer = ivy.repeat(buffer, list(group.sizes), axis=0)
+        ret.append(buffer)
+    return ret
+
+
+def _apply_elementwise(fn, operands, kwargs=None):
+    layout, states = _operands_layout(operands)
+    if layout is None:
+        return None
+    kwargs = kwargs or dict()
+    buffers = list()
+    is_tuple = False
+    for group_idx, group in enumerate(layout.groups):
+        ret = fn(*_group_operands(operands, states, layout, group_idx), **kwargs)
+        is_tuple = isinstance(ret, tuple)
+        rets = ret if is_tuple else (ret,)
+        if not all(ivy.is_array(r) and tuple(r.shape) == (group.numel,) for r in rets):
+            return None
+        buffers.append(rets)
+    template = operands[min(states)]
+    ret = tuple(_build(template, layout, list(bufs)) for bufs in zip(*buffers))
+    return ret if is_tuple else ret[0]
+
+
+def _segment_sum(x, group):
+    # exclusive prefix sums taken at the leaf boundaries, accumulated in double
+    # precision where possible so that small leaves next to large ones stay exact
+    dtype = (
+        ivy.float64
+        if ivy.is_float_dtype(x) and ivy.float64 in ivy.valid_dtypes
+        else None
+    )
+    cumsum = ivy.concat(
+        [
+            ivy.zeros((1,), dtype=ivy.default(dtype, x.dtype), device=ivy.dev(x)),
+            ivy.cumsum(x, axis=0, dtype=dtype),
+        ]
+    )
+    starts, ends = group.bounds()
+    ret = ivy.gather(cumsum, ends) - ivy.gather(cumsum, starts)
+    return ivy.astype(ret, x.dtype)
+
+
+def _apply_vector_norm(x, axis=None, keepdims=False, ord=2, dtype=None):
+    if axis is not None or keepdims or ord != 2 or dtype is not None:
+        return None
+    state = _packed_state(x)
+    if state is None:
+        return None
+    layout, buffers = state[0], state[1]
+    norms = list()
+    for group, buffer in zip(layout.groups, buffers):
+        if ivy.is_complex_dtype(buffer):
+            return None
+        norms.append(ivy.sqrt(_segment_sum(buffer * buffer, group)))
+    return _build(x, layout.reduced, norms)
+
+
+def _apply_conversion(fn_name, x, dtype=None, device=None, copy=None, **kwargs):
+    # the leaves of packed containers are already ivy arrays, so converting them to
+    # ivy arrays on their own dtype and device leaves them unchanged
+    if not isinstance(x, ivy.Container) or dtype is not None or copy:
+        return None
+    state = _packed_state(x)
+    if state is None:
+        return None
+    if device is not None and fn_name == "asarray":
+        device = ivy.as_ivy_dev(device)
+        if any(ivy.dev(buffer) != device for buffer in state[1]):
+            return None
+    ret = x.cont_copy()
+    ret._cont_packed = state
+    return ret
+
+
+def packed_map_in_function(fn, args, kwargs):
+    """
+    Apply the ivy function fn, or the one named fn, to the flat buffers of packed
+    containers.
+
+    Returns None if the arguments are not packed containers sharing a layout, or
+    if fn is not known to be leaf-wise.
+    """
+    fn_name = fn if isinstance(fn, str) else getattr(fn, "__name__", None)
+    if fn_name == "vector_norm" and len(args) == 1:
+        if isinstance(args[0], ivy.Container):
+            return _apply_vector_norm(args[0], **kwargs)
+        return None
+    if fn_name in ("asarray", "to_ivy") and len(args) == 1:
+        return _apply_conversion(fn_name, args[0], **kwargs)
+    if any(isinstance(v, ivy.Container) or ivy.is_array(v) for v in kwargs.values()):
+        return None
+    if fn_name in _COMPOSITE_UPDATE_FN_NAMES:
+        layout, _ = _operands_layout(args)
+        if layout is None:
+            return None
+        # the reductions and updates called by the implementation dispatch to the
+        # flat buffers in turn
+        return inspect.unwrap(ivy.__dict__[fn_name])(*args, **kwargs)
+    if fn_name in _FUSED_UPDATE_FN_NAMES or fn_name in _elementwise_fn_names():
+        return _apply_elementwise(ivy.__dict__[fn_name], args, kwargs)
+    return None
+
+
+def _apply_inplace(op, operands):
+    # the leaves are views of the flat buffers, so writing into the native buffers
+    # updates the leaves, and any arrays aliasing them, in place
+    if not ivy.inplace_arrays_supported():
+        return None
+    layout, states = _operands_layout(operands)
+    if layout is None or states[0][0] is not layout:
+        return None
+    backend = ivy.current_backend()
+    buffers = states[0][1]
+    rets = list()
+    for group_idx, (group, buffer) in enumerate(zip(layout.groups, buffers)):
+        ret = op(*_group_operands(operands, states, layout, group_idx))
+        if (
+            backend.is_variable(_native(buffer))
+            or not ivy.is_array(ret)
+            or tuple(ret.shape) != (group.numel,)
+            or ret.dtype != buffer.dtype
+        ):
+            # the buffer would be replaced rather than written into
+            return None
+        rets.append(ret)
+    for buffer, ret in zip(buffers, rets):
+        ivy.inplace_update(buffer, ret)
+    return operands[0]
+
+
+def packed_operator(op, reverse=False, inplace=False):
+    """
+    Wrap a container operator method, so that packed operands are combined with one
+    operation per flat buffer instead of one per leaf.
+
+    In-place operators write into the flat buffers, and fall back to the method on
+    backends without in-place updates.
+    """
+
+    def _decorator(method):
+        @functools.wraps(method)
+        def _method(self, *other):
+            operands = (other[0], self) if reverse else (self,) + other
+            if inplace:
+                ret = _apply_inplace(op, operands)
+            else:
+                ret = _apply_elementwise(op, operands)
+            return method(self, *other) if ret is None else ret
+
+        return _method
+
+    return _decorator
@@ -63,24 +63,15 @@ def try_array_function_override(func, overloaded_args, types, args, kwargs):
 
 
 def _get_first_array(*args, **kwargs):
-    # ToDo: make this more efficient, with function ivy.nested_nth_index_where
-    arr = None
-    if args:
-        arr_idxs = ivy.nested_argwhere(args, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(args, arr_idxs[0])
-        else:
-            arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-            if arr_idxs:
-                arr = ivy.index_nest(kwargs, arr_idxs[0])
-    elif kwargs:
-        arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(kwargs, arr_idxs[0])
-    return arr
+    # flattening is cached by the structure of the arguments, see ivy.tree_flatten
+    for leaf in ivy.tree_flatten((args, kwargs), include_derived=True)[0]:
+        if ivy.is_array(leaf):
+            return leaf
+    return None
 
 
 def _build_view(original, view, fn, args, kwargs, index=None):
+    view._view_attributes()
     if ivy.exists(original._base):
         if ivy.backend in ("jax", "tensorflow"):
             warnings.warn(
@@ -92,6 +83,7 @@ def _build_view(original, view, fn, args, kwargs, index=None):
         view._manipulation_stack = python_copy.copy(original._manipulation_stack)
     else:
         base = original
+        base._view_attributes()
         view._base = base
     base._view_refs.append(weakref.ref(view))
     view._manipulation_stack.append((fn, args[1:], kwargs, index))
@@ -107,6 +99,7 @@ def _build_view(original, view, fn, args, kwargs, index=None):
         view._torch_base = base
     if fn in _torch_non_native_view_functions:
         view._torch_manipulation = (original, (fn, args[1:], kwargs))
+        view._torch_base._view_attributes()
         view._torch_base._torch_view_refs.append(weakref.ref(view))
     return view
 
@@ -204,42 +197,55 @@ def handle_array_function(func):
     return _handle_array_function
 
 
+def _array_like_parameters(fn: Callable):
+    """
+    Return the positional indices of the parameters of `fn` which are annotated as
+    single arrays, or None if the signature of `fn` cannot be inspected.
+    """
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return None
+    array_like = []
+    for i, (parameter, param) in enumerate(type_hints.items()):
+        annotation_str = str(param.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
+        ):
+            array_like.append(i)
+    return tuple(array_like)
+
+
 def handle_array_like_without_promotion(fn: Callable) -> Callable:
+    # the signature is only inspected once, on the first call
+    array_like_params = []
+
     @functools.wraps(fn)
     def _handle_array_like_without_promotion(*args, **kwargs):
+        if not array_like_params:
+            array_like_params.append(_array_like_parameters(fn))
+        params = array_like_params[0]
+        if params is None:
+            return fn(*args, **kwargs)
         args = list(args)
         num_args = len(args)
-        try:
-            type_hints = inspect.signature(fn).parameters
-        except (TypeError, ValueError):
-            return fn(*args, **kwargs)
-        parameters = list(type_hints.keys())
-        annotations = [param.annotation for param in type_hints.values()]
 
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
-        ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
-                if i < num_args:
-                    # Fix for ellipsis, slices for numpy's __getitem__
-                    # No need to try and convert them into arrays
-                    # since asarray throws unpredictable bugs
-                    if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
-                        continue
-                    if not ivy.is_array(arg):
-                        args[i] = ivy.array(arg)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if not ivy.is_array(kwarg):
-                        kwargs[parameter] = ivy.array(kwarg)
+        for i in params:
+            if i >= num_args:
+                break
+            arg = args[i]
+            # Fix for ellipsis, slices for numpy's __getitem__
+            # No need to try and convert them into arrays
+            # since asarray throws unpredictable bugs
+            if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
+                continue
+            if not ivy.is_array(arg):
+                args[i] = ivy.array(arg)
 
         return fn(*args, **kwargs)
 
@@ -678,7 +684,7 @@ def handle_out_argument(fn: Callable) -> Callable:
 
 
 def _update_torch_views(x, visited_view=None):
-    if x._torch_view_refs != []:
+    if x._torch_view_refs:
         _update_torch_references(x, visited_view)
     if ivy.exists(x._torch_manipulation):
         parent_tensor, fn_args_kwargs = x._torch_manipulation
@@ -702,7 +708,7 @@ def _update_torch_references(x, visited_view=None):
             fn, args, kwargs = fn_args_kwargs
             kwargs["copy"] = True
             view.data[()] = ivy.__dict__[fn](parent_tensor, *args, **kwargs).data
-            if view._torch_view_refs != []:
+            if view._torch_view_refs:
                 _update_torch_references(view)
 
 
@@ -735,17 +741,13 @@ def handle_nestable(fn: Callable) -> Callable:
         # if any of the arguments or keyword arguments passed to the function contains
         # a container, get the container's version of the function and call it using
         # the passed arguments.
-        if hasattr(ivy.Container, "_static_" + fn_name):
-            cont_fn = getattr(ivy.Container, "_static_" + fn_name)
-        else:
-            cont_fn = lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
-                fn, *args, **kwargs
-            )
         if ivy.get_nestable_mode() and (
             ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
             or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
         ):
-            return cont_fn(*args, **kwargs)
+            if hasattr(ivy.Container, "_static_" + fn_name):
+                return getattr(ivy.Container, "_static_" + fn_name)(*args, **kwargs)
+            return ivy.Container.cont_multi_map_in_function(fn, *args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
         # the passed arguments, returning an ivy or a native array.
@@ -828,12 +830,129 @@ def _wrap_function(
             for attr in to_replace[compositional]:
                 setattr(original, attr, True)
 
+        raw = to_wrap
+        applied = []
         for attr in FN_DECORATORS:
             if hasattr(original, attr) and not hasattr(to_wrap, attr):
                 to_wrap = getattr(ivy, attr)(to_wrap)
+                applied.append(attr)
+        if _supports_fast_dispatch(raw, original, applied):
+            to_wrap = _fast_dispatch(raw, to_wrap, applied)
     return to_wrap
 
 
+# Fast Path Dispatch #
+# -------------------#
+
+# decorators which are no-ops, or reduce to converting the top-level
+# ivy.Array arguments and the return, when all inputs are plain arrays
+_FAST_PATH_DECORATORS = {
+    "handle_array_function",
+    "outputs_to_ivy_arrays",
+    "inputs_to_native_arrays",
+    "handle_out_argument",
+    "handle_array_like_without_promotion",
+    "handle_nestable",
+    "handle_exceptions",
+}
+
+_FAST_PATH_SCALAR_TYPES = (int, float, bool, complex, str, type(None))
+
+
+def _supports_fast_dispatch(raw, original, applied):
+    if not applied or applied == ["handle_exceptions"]:
+        return False
+    if hasattr(original, "mixed_function") or hasattr(raw, "compos"):
+        return False
+    # the raw implementation must not carry any wrappers of its own, and every
+    # wrapper of the original must be one the fast path knows how to bypass
+    return not any(hasattr(raw, attr) for attr in FN_DECORATORS) and all(
+        attr in _FAST_PATH_DECORATORS
+        for attr in FN_DECORATORS
+        if hasattr(original, attr)
+    )
+
+
+def _fast_dispatch(raw: Callable, wrapped: Callable, applied) -> Callable:
+    """
+    Build a dispatcher which calls the raw backend implementation `raw` directly
+    whenever the call would pass unchanged through the wrappers in `applied`, and
+    falls back to the fully wrapped function `wrapped` otherwise.
+
+    The fast path is taken when every positional and keyword argument is either an
+    `ivy.Array` or `ivy.NativeArray` of exactly that type (so no subclass can
+    override `__ivy_array_function__`), a python scalar, or a flat list/tuple of
+    python scalars, and no `out` argument is given. Containers and nests of arrays
+    always go through the full wrapper stack.
+
+    Parameters
+    ----------
+    raw
+        the unwrapped backend implementation.
+    wrapped
+        `raw` with all of the decorators in `applied` already applied.
+    applied
+        the names of the decorators that were applied to `raw`.
+
+    Returns
+    -------
+    ret
+        the dispatcher, which carries all the attributes of `wrapped`.
+    """
+    to_native = "inputs_to_native_arrays" in applied
+    to_ivy = "outputs_to_ivy_arrays" in applied
+    fast_fn = ivy.handle_exceptions(raw) if "handle_exceptions" in applied else raw
+    array_like_params = (
+        _array_like_parameters(raw)
+        if "handle_array_like_without_promotion" in applied
+        else ()
+    )
+    if array_like_params is None:
+        return wrapped
+    scalar_types = _FAST_PATH_SCALAR_TYPES
+    array_cls = ivy.Array
+
+    def _convert(x):
+        x_type = type(x)
+        if x_type is array_cls:
+            return x._data if to_native else x
+        if x_type is ivy.NativeArray or x_type in scalar_types:
+            return x
+        if x_type in (list, tuple) and all(type(v) in scalar_types for v in x):
+            return x
+        raise _FastPathMiss
+
+    @functools.wraps(wrapped)
+    def _fast_dispatcher(*args, **kwargs):
+        if kwargs.get("out") is not None or not ivy.get_array_mode():
+            return wrapped(*args, **kwargs)
+        num_args = len(args)
+        try:
+            for i in array_like_params:
+                # array-likes passed as arrays need converting, so take the full path
+                if i < num_args and not (
+                    type(args[i]) is array_cls or type(args[i]) is ivy.NativeArray
+                ):
+                    raise _FastPathMiss
+            args = [_convert(arg) for arg in args]
+            kwargs = {k: _convert(v) for k, v in kwargs.items()}
+        except _FastPathMiss:
+            return wrapped(*args, **kwargs)
+        ret = fast_fn(*args, **kwargs)
+        if not to_ivy:
+            return ret
+        if type(ret) is ivy.NativeArray:
+            return array_cls(ret)
+        return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+
+    _fast_dispatcher.fast_dispatch = True
+    return _fast_dispatcher
+
+
+class _FastPathMiss(Exception):
+    pass
+
+
 # Gets dtype from a version dictionary
 def _dtype_from_version(dic, version):
     # if version is a string, it's a frontend function
@@ -1,6 +1,7 @@
 """Collection of Jax network layers, wrapped to fit Ivy syntax and signature."""
 
 # global
+import jax
 import jax.lax as jlax
 import jax.numpy as jnp
 
@@ -370,3 +371,48 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return jnp.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: JaxArray,
+    init_h: JaxArray,
+    init_c: JaxArray,
+    kernel: JaxArray,
+    recurrent_kernel: JaxArray,
+    /,
+    *,
+    bias: Optional[JaxArray] = None,
+    recurrent_bias: Optional[JaxArray] = None,
+) -> Tuple[JaxArray, JaxArray]:
+    batch_shape = x.shape[:-2]
+    timesteps = x.shape[-2]
+    output_channels = init_h.shape[-1]
+
+    # input kernel, applied to all timesteps at once, with both biases folded in
+    Wi_x = jnp.matmul(x.reshape((-1, timesteps, x.shape[-1])), kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+
+    def _lstm_step(carry, Wi_xt):
+        ht, ct = carry
+        gates = Wi_xt + jnp.matmul(ht, recurrent_kernel)
+        it, ft, gt, ot = jnp.split(gates, 4, axis=-1)
+        ct = jax.nn.sigmoid(ft) * ct + jax.nn.sigmoid(it) * jnp.tanh(gt)
+        ht = jax.nn.sigmoid(ot) * jnp.tanh(ct)
+        return (ht, ct), ht
+
+    # the recurrence is traced once and looped over the time-major projections
+    (_, ct), hts = jlax.scan(
+        _lstm_step,
+        (
+            init_h.reshape((-1, output_channels)),
+            init_c.reshape((-1, output_channels)),
+        ),
+        jnp.swapaxes(Wi_x, 0, 1),
+    )
+    return (
+        jnp.swapaxes(hts, 0, 1).reshape(batch_shape + (timesteps, output_channels)),
+        ct.reshape(batch_shape + (output_channels,)),
+    )
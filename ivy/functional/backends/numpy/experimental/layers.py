@@ -7,7 +7,10 @@ from typing import Optional, Union, Tuple, Literal
 # local
 import ivy
 from ivy.functional.ivy.layers import _handle_padding, _get_num_padded_values
-from ivy.functional.backends.numpy.layers import _add_dilations
+from ivy.functional.backends.numpy.layers import (
+    _conv_windows,
+    _dilated_kernel_shape,
+)
 from ivy.functional.ivy.experimental.layers import _padding_ceil_mode
 
 
@@ -107,21 +110,17 @@ def max_pool2d(
         x = np.transpose(x, (0, 2, 3, 1))
 
     x_shape = list(x.shape[1:3])
-    filters = np.ones((list(kernel)), dtype=x.dtype)
-    for j in range(2):
-        if dilation[j] > 1:
-            filters = _add_dilations(filters, dilation[j], axis=j, values=0)
-    kernel = list(filters.shape)
+    dilated_kernel = _dilated_kernel_shape(kernel, dilation)
     pad_list = padding
     if isinstance(padding, str):
-        pad_h = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-        pad_w = _handle_padding(x_shape[1], strides[1], kernel[1], padding)
+        pad_h = _handle_padding(x_shape[0], strides[0], dilated_kernel[0], padding)
+        pad_w = _handle_padding(x_shape[1], strides[1], dilated_kernel[1], padding)
         pad_list = [(pad_h // 2, pad_h - pad_h // 2), (pad_w // 2, pad_w - pad_w // 2)]
     pad_list = list(pad_list)
     if ceil_mode:
         for i in range(2):
             pad_list[i] = _padding_ceil_mode(
-                x_shape[i], kernel[i], pad_list[i], strides[i]
+                x_shape[i], dilated_kernel[i], pad_list[i], strides[i]
             )
 
     x = np.pad(
@@ -135,30 +134,12 @@ def max_pool2d(
         constant_values=-math.inf,
     )
 
-    x_shape = x.shape
-    new_h = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_w = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
+    # B x OH x OW x KH x KW x I, only the dilated positions are viewed
+    sub_matrices = _conv_windows(x, kernel, strides, 2, dilation)
 
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.where(
-        filters.reshape([1] * 3 + list(kernel) + [1]), sub_matrices, -math.inf
-    )
-
-    # B x OH x OW x O
-    res = sub_matrices.max(axis=(3, 4))
+    # B x OH x OW x O, reducing over leading kernel axes lets numpy iterate the
+    # overlapping windows in memory order
+    res = np.moveaxis(sub_matrices, (3, 4), (0, 1)).max(axis=(0, 1))
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
     return res
@@ -316,7 +297,7 @@ def avg_pool1d(
                 ivy.map(
                     _get_num_padded_values,
                     constant={
-                        "p": pad_specific[0],
+                        "p": 2 * padding[0][0],
                         "n": x.shape[1] - pad_specific[0],
                         "k": kernel[0],
                         "s": strides[0],
@@ -410,7 +391,7 @@ def avg_pool2d(
                     ivy.map(
                         _get_num_padded_values,
                         constant={
-                            "p": pad_specific[i],
+                            "p": 2 * padding[i][0],
                             "n": x.shape[i + 1] - pad_specific[i],
                             "k": kernel[i],
                             "s": strides[i],
@@ -522,7 +503,7 @@ def avg_pool3d(
                     ivy.map(
                         _get_num_padded_values,
                         constant={
-                            "p": pad_specific[i],
+                            "p": 2 * padding[i][0],
                             "n": x.shape[i + 1] - pad_specific[i],
                             "k": kernel[i],
                             "s": strides[i],
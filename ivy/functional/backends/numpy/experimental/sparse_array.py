@@ -1,5 +1,7 @@
 # global
 import logging
+from typing import Optional
+import numpy as np
 
 # local
 import ivy
@@ -10,6 +12,7 @@ from ivy.functional.ivy.experimental.sparse_array import (
     _verify_coo_components,
     _verify_csc_components,
     _verify_csr_components,
+    _verify_sparse_dense_matmul,
 )
 
 
@@ -98,3 +101,56 @@ def native_sparse_array_to_indices_values_and_shape(x):
         " indices, values and shape."
     )
     return None, None, None
+
+
+def _compressed_components(x, axis):
+    return tuple(ivy.to_native(a) for a in x._compressed_components(axis))
+
+
+def _segment_sum(data, compressed_indices):
+    # sums of the rows of data in each segment, which is zero for empty segments
+    starts = compressed_indices[:-1]
+    ret = np.zeros((starts.shape[0],) + data.shape[1:], dtype=data.dtype)
+    nonempty = starts < compressed_indices[1:]
+    if data.shape[0]:
+        ret[nonempty] = np.add.reduceat(data, starts[nonempty], axis=0)
+    return ret
+
+
+# the number of products computed at once, so that they stay in cache
+_matmul_chunk_size = 1 << 17
+
+
+def sparse_dense_matmul(x, y, /):
+    _verify_sparse_dense_matmul(x, y)
+    crow_indices, col_indices, values = _compressed_components(x, 0)
+    values, y = ivy.promote_types_of_inputs(values, y)
+    if y.ndim == 2:
+        values = values[:, None]
+    num_rows = crow_indices.shape[0] - 1
+    ret = np.empty((num_rows,) + y.shape[1:], dtype=y.dtype)
+    # chunks of whole rows, with about _matmul_chunk_size products each
+    step = max(_matmul_chunk_size // max(ret[0:1].size, 1), 1)
+    bounds = np.searchsorted(
+        crow_indices, np.arange(0, crow_indices[-1], step), side="right"
+    )
+    bounds = np.unique(np.concatenate([[0], bounds - 1, [num_rows]]))
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        begin, end = crow_indices[start], crow_indices[stop]
+        ret[start:stop] = _segment_sum(
+            values[begin:end] * y[col_indices[begin:end]],
+            crow_indices[start : stop + 1] - begin,
+        )
+    return ret
+
+
+def sparse_sum(x, /, *, axis: Optional[int] = None):
+    if axis is None:
+        values = ivy.to_native(x.values)
+        return np.asarray(np.sum(values, dtype=values.dtype))
+    ivy.utils.assertions.check_equal(
+        len(x.dense_shape), 2, message="only 2D sparse arrays can be summed by axis"
+    )
+    # the sums of the rows are segment sums of the values compressed by row
+    compressed_indices, _, values = _compressed_components(x, 1 - axis % 2)
+    return _segment_sum(values, compressed_indices)
@@ -5,6 +5,7 @@ from typing import Optional, Union, Sequence, Callable, Tuple
 import numpy as np
 from operator import mul
 from functools import reduce
+import inspect as _inspect
 import multiprocessing as _multiprocessing
 from numbers import Number
 
@@ -64,23 +65,24 @@ def gather(
     axis = axis % len(params.shape)
     batch_dims = batch_dims % len(params.shape)
     ivy.utils.assertions.check_gather_input_valid(params, indices, axis, batch_dims)
-    result = []
     if batch_dims == 0:
-        result = np.take(params, indices, axis)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = np.take(p, i, axis - batch_dims)
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
+        return _to_device(np.take(params, indices, axis))
+    batch_shape = params.shape[:batch_dims]
+    num_batches = reduce(mul, batch_shape, 1)
+    pre_shape = params.shape[batch_dims:axis]
+    post_shape = params.shape[axis + 1 :]
+    indices_shape = indices.shape[batch_dims:]
+    params = params.reshape((num_batches,) + params.shape[batch_dims:])
+    indices = indices.reshape((num_batches, -1))
+    # a single advanced indexing of every batch, the batch and index dimensions
+    # come first in the result, followed by the dimensions before and after axis
+    result = params[
+        (np.arange(num_batches)[:, None],)
+        + (slice(None),) * len(pre_shape)
+        + (indices,)
+    ]
+    result = np.moveaxis(result, 1, 1 + len(pre_shape))
+    result = result.reshape(batch_shape + pre_shape + indices_shape + post_shape)
     return _to_device(result)
 
 
@@ -228,6 +230,62 @@ def multiprocessing(context: Optional[str] = None):
     )
 
 
+# numpy 1.25 added a fast path to ufunc.at for one dimensional indices and operands
+_fast_ufunc_at = tuple(int(v) for v in np.__version__.split(".")[:2]) >= (1, 25)
+_scatter_ufuncs = {"sum": np.add, "min": np.minimum, "max": np.maximum}
+
+
+def _scatter_reduce(target, indices, updates, reduction):
+    """
+    Reduce the updates at the indices of the leading dimensions of target, in place.
+
+    The indices are converted to flat indices of the target elements, so that the
+    reduction is a single one dimensional ufunc.at, or a bincount or sort based
+    segment reduction where ufunc.at is slow.
+    """
+    ufunc = _scatter_ufuncs[reduction]
+    num_index_dims = indices.shape[-1]
+    index_shape = target.shape[:num_index_dims]
+    inner_size = reduce(mul, target.shape[num_index_dims:], 1)
+    updates = np.broadcast_to(
+        updates, indices.shape[:-1] + target.shape[num_index_dims:]
+    ).reshape(-1, inner_size)
+    indices = indices.reshape(-1, num_index_dims)
+    if not indices.size or not updates.size:
+        return target
+    row_indices = np.ravel_multi_index(
+        tuple(np.where(i < 0, i + d, i) for i, d in zip(indices.T, index_shape)),
+        index_shape,
+    )
+    flat_target = target.reshape(-1)
+    if _fast_ufunc_at or (
+        reduction == "sum" and np.issubdtype(updates.dtype, np.floating)
+    ):
+        flat_indices = row_indices[:, None] * inner_size + np.arange(inner_size)
+        flat_indices = flat_indices.reshape(-1)
+        if _fast_ufunc_at:
+            ufunc.at(flat_target, flat_indices, updates.reshape(-1))
+        else:
+            flat_target += np.bincount(
+                flat_indices, weights=updates.reshape(-1), minlength=flat_target.size
+            ).astype(flat_target.dtype)
+    else:
+        # segment reduction of the updates rows, sorted by their target row
+        order = np.argsort(row_indices, kind="stable")
+        row_indices = row_indices[order]
+        starts = np.flatnonzero(
+            np.concatenate([[True], row_indices[1:] != row_indices[:-1]])
+        )
+        rows = flat_target.reshape(-1, inner_size)
+        unique_rows = row_indices[starts]
+        rows[unique_rows] = ufunc(
+            rows[unique_rows], ufunc.reduceat(updates[order], starts, axis=0)
+        )
+    if not np.shares_memory(flat_target, target):
+        target[...] = flat_target.reshape(target.shape)
+    return target
+
+
 def scatter_flat(
     indices: np.ndarray,
     updates: np.ndarray,
@@ -244,18 +302,15 @@ def scatter_flat(
         ivy.utils.assertions.check_equal(target.shape[0], size)
     if not target_given:
         reduction = "replace"
-    if reduction == "sum":
-        np.add.at(target, indices, updates)
+    if reduction in _scatter_ufuncs:
+        updates = np.broadcast_to(updates, np.shape(indices)).reshape(-1)
+        _scatter_reduce(target, np.reshape(indices, (-1, 1)), updates, reduction)
     elif reduction == "replace":
         if not target_given:
             target = np.zeros([size], dtype=updates.dtype)
         target = np.asarray(target).copy()
         target.setflags(write=1)
         target[indices] = updates
-    elif reduction == "min":
-        np.minimum.at(target, indices, updates)
-    elif reduction == "max":
-        np.maximum.at(target, indices, updates)
     else:
         raise ivy.utils.exceptions.IvyException(
             "reduction is {}, but it must be one of "
@@ -303,18 +358,15 @@ def scatter_nd(
     indices_tuple = tuple(indices_flat) + (Ellipsis,)
     if not target_given:
         reduction = "replace"
-    if reduction == "sum":
-        np.add.at(target, indices_tuple, updates)
+    if reduction in _scatter_ufuncs:
+        target = ivy.to_native(target)
+        _scatter_reduce(target, indices, updates, reduction)
     elif reduction == "replace":
         if not target_given:
             target = np.zeros(shape, dtype=updates.dtype)
         target = np.asarray(target).copy()
         target.setflags(write=1)
         target[indices_tuple] = updates
-    elif reduction == "min":
-        np.minimum.at(target, indices_tuple, updates)
-    elif reduction == "max":
-        np.maximum.at(target, indices_tuple, updates)
     else:
         raise ivy.utils.exceptions.IvyException(
             "reduction is {}, but it must be one of "
@@ -340,11 +392,553 @@ def shape(
         return ivy.Shape(x.shape)
 
 
+# Batching #
+# ---------#
+
+# ivy functions computed independently at every position of their broadcast inputs
+_ELEMENTWISE_FN_NAMES = frozenset(
+    [
+        "abs",
+        "acos",
+        "acosh",
+        "add",
+        "asin",
+        "asinh",
+        "astype",
+        "atan",
+        "atan2",
+        "atanh",
+        "bitwise_and",
+        "bitwise_invert",
+        "bitwise_left_shift",
+        "bitwise_or",
+        "bitwise_right_shift",
+        "bitwise_xor",
+        "ceil",
+        "clip",
+        "cos",
+        "cosh",
+        "deg2rad",
+        "divide",
+        "equal",
+        "erf",
+        "exp",
+        "expm1",
+        "floor",
+        "floor_divide",
+        "fmod",
+        "gelu",
+        "greater",
+        "greater_equal",
+        "isfinite",
+        "isinf",
+        "isnan",
+        "isreal",
+        "leaky_relu",
+        "less",
+        "less_equal",
+        "log",
+        "log10",
+        "log1p",
+        "log2",
+        "logaddexp",
+        "logical_and",
+        "logical_not",
+        "logical_or",
+        "logical_xor",
+        "maximum",
+        "minimum",
+        "mish",
+        "multiply",
+        "negative",
+        "not_equal",
+        "positive",
+        "pow",
+        "rad2deg",
+        "reciprocal",
+        "relu",
+        "remainder",
+        "round",
+        "sigmoid",
+        "sign",
+        "sin",
+        "sinh",
+        "softplus",
+        "sqrt",
+        "square",
+        "stop_gradient",
+        "subtract",
+        "tan",
+        "tanh",
+        "trunc",
+        "trunc_divide",
+        "where",
+    ]
+)
+
+# reductions over the axes given by their `axis` argument, all axes if it is None
+_REDUCTION_FN_NAMES = frozenset(
+    [
+        "all",
+        "any",
+        "flip",
+        "log_softmax",
+        "max",
+        "mean",
+        "min",
+        "prod",
+        "softmax",
+        "std",
+        "sum",
+        "var",
+    ]
+)
+
+_SIGNATURES = dict()
+
+
+class _NoBatchingRule(ivy.utils.exceptions.IvyNotImplementedException):
+    """Raised when a vectorized function cannot run once on the whole batch."""
+
+
+class _NoBatchedAttribute(_NoBatchingRule, AttributeError):
+    """Raised for the array attributes which tracers do not have, such as ``.T``."""
+
+
+class _BatchTracer:
+    """
+    One example of a batch of arrays, as seen by the function vectorized by vmap.
+
+    The batch is held with the examples along its leading axis. Ivy functions called
+    on a tracer are intercepted through ``__ivy_array_function__`` and computed once
+    for the whole batch, using the batching rule of the function. Numpy ufuncs are
+    computed by the elementwise ivy function of the same name. Anything else raises,
+    after which vmap falls back to calling the function per example.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __ivy_array_function__(self, func, types, args, kwargs):
+        return _batch_call(func, args, kwargs)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # numpy operators such as ndarray + tracer also end up here
+        if (
+            method != "__call__"
+            or kwargs
+            or ufunc.__name__ not in _ELEMENTWISE_FN_NAMES
+        ):
+            raise _no_batching_rule("numpy.{}".format(ufunc.__name__))
+        return getattr(ivy, ufunc.__name__)(*inputs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        raise _no_batching_rule("numpy.{}".format(func.__name__))
+
+    def __array__(self, *args, **kwargs):
+        raise _NoBatchingRule("batched arrays cannot be converted inside vmap")
+
+    def __getattr__(self, name):
+        # only called for the attributes of arrays which tracers do not define
+        raise _NoBatchedAttribute(
+            "batched arrays have no attribute {} inside vmap".format(name)
+        )
+
+    def __bool__(self):
+        raise _NoBatchingRule(
+            "batched arrays cannot be used in control flow inside vmap"
+        )
+
+    def _to_scalar(self):
+        raise _NoBatchingRule("batched arrays cannot be converted inside vmap")
+
+    __complex__ = __float__ = __index__ = __int__ = _to_scalar
+
+    @property
+    def shape(self):
+        return self.value.shape[1:]
+
+    @property
+    def ndim(self):
+        return self.value.ndim - 1
+
+    @property
+    def dtype(self):
+        return self.value.dtype
+
+    @property
+    def size(self):
+        return reduce(mul, self.shape, 1)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, query):
+        return ivy.get_item(self, query)
+
+    def __neg__(self):
+        return ivy.negative(self)
+
+    def __abs__(self):
+        return ivy.abs(self)
+
+    def __add__(self, other):
+        return ivy.add(self, other)
+
+    def __radd__(self, other):
+        return ivy.add(other, self)
+
+    def __sub__(self, other):
+        return ivy.subtract(self, other)
+
+    def __rsub__(self, other):
+        return ivy.subtract(other, self)
+
+    def __mul__(self, other):
+        return ivy.multiply(self, other)
+
+    def __rmul__(self, other):
+        return ivy.multiply(other, self)
+
+    def __truediv__(self, other):
+        return ivy.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return ivy.divide(other, self)
+
+    def __floordiv__(self, other):
+        return ivy.floor_divide(self, other)
+
+    def __rfloordiv__(self, other):
+        return ivy.floor_divide(other, self)
+
+    def __mod__(self, other):
+        return ivy.remainder(self, other)
+
+    def __rmod__(self, other):
+        return ivy.remainder(other, self)
+
+    def __pow__(self, other):
+        return ivy.pow(self, other)
+
+    def __rpow__(self, other):
+        return ivy.pow(other, self)
+
+    def __matmul__(self, other):
+        return ivy.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return ivy.matmul(other, self)
+
+    def __lt__(self, other):
+        return ivy.less(self, other)
+
+    def __le__(self, other):
+        return ivy.less_equal(self, other)
+
+    def __gt__(self, other):
+        return ivy.greater(self, other)
+
+    def __ge__(self, other):
+        return ivy.greater_equal(self, other)
+
+    def __eq__(self, other):
+        return ivy.equal(self, other)
+
+    def __ne__(self, other):
+        return ivy.not_equal(self, other)
+
+    __hash__ = None
+
+
+def _no_batching_rule(fn_name):
+    return _NoBatchingRule("no batching rule for {}".format(fn_name))
+
+
+def _batch_call(func, args, kwargs):
+    fn_name = func.__name__
+    if fn_name in _ELEMENTWISE_FN_NAMES:
+        rule = _elementwise_rule
+    elif fn_name in _REDUCTION_FN_NAMES:
+        rule = _reduction_rule
+    else:
+        rule = _BATCHING_RULES.get(fn_name)
+    if rule is None:
+        raise _no_batching_rule(fn_name)
+    if fn_name not in _SIGNATURES:
+        _SIGNATURES[fn_name] = _inspect.signature(func)
+    bound = _SIGNATURES[fn_name].bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    if isinstance(bound.arguments.get("out"), _BatchTracer):
+        raise _no_batching_rule(fn_name)
+    return rule(func, bound)
+
+
+def _call(func, bound):
+    """Call func once on the batches bound to it, and return tracers of the result."""
+    for name, value in bound.arguments.items():
+        if isinstance(value, _BatchTracer):
+            bound.arguments[name] = value.value
+    ret = func(*bound.args, **bound.kwargs)
+    if isinstance(ret, tuple):
+        return tuple(_BatchTracer(ivy.to_native(r)) for r in ret)
+    return _BatchTracer(ivy.to_native(ret))
+
+
+def _batched_names(arguments):
+    return [n for n, v in arguments.items() if isinstance(v, _BatchTracer)]
+
+
+def _example_ndim(x):
+    if isinstance(x, _BatchTracer):
+        return x.ndim
+    if hasattr(x, "shape"):
+        return len(x.shape)
+    return np.ndim(x) if isinstance(x, (list, tuple)) else 0
+
+
+def _shift_axis(axis, ndim):
+    """Return the axis of the batch holding the given axis of an example."""
+    if isinstance(axis, (list, tuple)):
+        return tuple(_shift_axis(a, ndim) for a in axis)
+    if axis < -ndim:
+        raise ivy.utils.exceptions.IvyIndexError(
+            "axis {} is out of bounds for an example with {} dimensions".format(
+                axis, ndim
+            )
+        )
+    return axis + 1 if axis >= 0 else axis + ndim + 1
+
+
+def _align(arguments, names, ndim):
+    # insert unit axes after the batch axis, so that the examples broadcast against
+    # the unbatched operands exactly as a single example would
+    for name in names:
+        value = arguments[name].value
+        arguments[name] = _BatchTracer(
+            value.reshape(
+                value.shape[:1] + (1,) * (ndim + 1 - value.ndim) + value.shape[1:]
+            )
+        )
+
+
+def _only_batched(arguments, names, fn_name):
+    if _batched_names(arguments) != list(names):
+        raise _no_batching_rule(fn_name)
+
+
+def _elementwise_rule(func, bound):
+    arguments = bound.arguments
+    ndim = max(
+        _example_ndim(v)
+        for v in arguments.values()
+        if isinstance(v, _BatchTracer) or ivy.is_array(v)
+    )
+    _align(arguments, _batched_names(arguments), ndim)
+    return _call(func, bound)
+
+
+def _reduction_rule(func, bound):
+    arguments = bound.arguments
+    _only_batched(arguments, ["x"], func.__name__)
+    ndim = arguments["x"].ndim
+    axis = arguments["axis"]
+    if axis is None:
+        arguments["axis"] = tuple(range(1, ndim + 1))
+    else:
+        arguments["axis"] = _shift_axis(axis, ndim)
+    return _call(func, bound)
+
+
+def _arg_reduction_rule(func, bound):
+    arguments = bound.arguments
+    _only_batched(arguments, ["x"], func.__name__)
+    x = arguments["x"]
+    if arguments["axis"] is None:
+        if arguments["keepdims"]:
+            raise _no_batching_rule(func.__name__)
+        arguments["x"] = _BatchTracer(x.value.reshape(x.value.shape[0], -1))
+        arguments["axis"] = 1
+    else:
+        arguments["axis"] = _shift_axis(arguments["axis"], x.ndim)
+    return _call(func, bound)
+
+
+def _cumulative_rule(func, bound):
+    arguments = bound.arguments
+    _only_batched(arguments, ["x"], func.__name__)
+    arguments["axis"] = _shift_axis(arguments["axis"], arguments["x"].ndim)
+    return _call(func, bound)
+
+
+def _matmul_rule(func, bound):
+    arguments = bound.arguments
+    batched = _batched_names(arguments)
+    ndims = {name: _example_ndim(arguments[name]) for name in ("x1", "x2")}
+    transposed = any(
+        arguments.get(name)
+        for name in ("transpose_a", "transpose_b", "adjoint_a", "adjoint_b")
+    )
+    if transposed and min(ndims.values()) < 2:
+        raise _no_batching_rule(func.__name__)
+    # batched vectors become batched matrices, whose unit axis is removed afterwards
+    squeeze_axes = []
+    if "x1" in batched and ndims["x1"] == 1:
+        arguments["x1"] = _BatchTracer(arguments["x1"].value[:, None, :])
+        ndims["x1"] = 2
+        squeeze_axes.append(-2)
+    if "x2" in batched and ndims["x2"] == 1:
+        arguments["x2"] = _BatchTracer(arguments["x2"].value[..., None])
+        ndims["x2"] = 2
+        squeeze_axes.append(-1)
+    _align(arguments, batched, max(ndims.values()))
+    ret = _call(func, bound)
+    if squeeze_axes:
+        ret = _BatchTracer(np.squeeze(ret.value, axis=tuple(squeeze_axes)))
+    return ret
+
+
+def _trailing_rule(min_ndim):
+    # functions of the trailing axes of x, whose other inputs are shared by the batch
+    def _rule(func, bound):
+        arguments = bound.arguments
+        _only_batched(arguments, ["x"], func.__name__)
+        if arguments["x"].ndim < min_ndim:
+            raise _no_batching_rule(func.__name__)
+        return _call(func, bound)
+
+    return _rule
+
+
+def _reshape_rule(func, bound):
+    arguments = bound.arguments
+    _only_batched(arguments, ["x"], func.__name__)
+    x = arguments["x"]
+    arguments["shape"] = (x.value.shape[0],) + tuple(arguments["shape"])
+    return _call(func, bound)
+
+
+def _expand_dims_rule(func, bound):
+    arguments = bound.arguments
+    _only_batched(arguments, ["x"], func.__name__)
+    axis = arguments["axis"]
+    axes = tuple(axis) if isinstance(axis, (list, tuple)) else (axis,)
+    arguments["axis"] = _shift_axis(axes, arguments["x"].ndim + len(axes))
+    return _call(func, bound)
+
+
+def _squeeze_rule(func, bound):
+    arguments = bound.arguments
+    _only_batched(arguments, ["x"], func.__name__)
+    x = arguments["x"]
+    if arguments["axis"] is None:
+        arguments["axis"] = tuple(i + 1 for i, d in enumerate(x.shape) if d == 1)
+    else:
+        arguments["axis"] = _shift_axis(arguments["axis"], x.ndim)
+    return _call(func, bound)
+
+
+def _permute_dims_rule(func, bound):
+    arguments = bound.arguments
+    _only_batched(arguments, ["x"], func.__name__)
+    arguments["axes"] = (0,) + _shift_axis(
+        tuple(arguments["axes"]), arguments["x"].ndim
+    )
+    return _call(func, bound)
+
+
+def _swapaxes_rule(func, bound):
+    arguments = bound.arguments
+    _only_batched(arguments, ["x"], func.__name__)
+    ndim = arguments["x"].ndim
+    arguments["axis0"] = _shift_axis(arguments["axis0"], ndim)
+    arguments["axis1"] = _shift_axis(arguments["axis1"], ndim)
+    return _call(func, bound)
+
+
+def _asarray_rule(func, bound):
+    # tracers already stand for arrays, so only their dtype can change
+    arguments = bound.arguments
+    _only_batched(arguments, ["obj"], func.__name__)
+    obj, dtype = arguments["obj"], arguments.get("dtype")
+    if dtype is None or ivy.as_ivy_dtype(dtype) == ivy.as_ivy_dtype(obj.dtype):
+        return obj
+    return _BatchTracer(obj.value.astype(ivy.as_native_dtype(dtype)))
+
+
+def _get_item_rule(func, bound):
+    arguments = bound.arguments
+    _only_batched(arguments, ["x"], func.__name__)
+    query = arguments["query"]
+    query = query if isinstance(query, tuple) else (query,)
+    num_arrays = 0
+    for q in query:
+        if isinstance(q, _BatchTracer):
+            raise _no_batching_rule(func.__name__)
+        if ivy.is_array(q) or isinstance(q, (list, np.ndarray)):
+            num_arrays += 1
+        elif not isinstance(q, (int, slice, type(None), type(Ellipsis))):
+            raise _no_batching_rule(func.__name__)
+    if num_arrays > 1:
+        # several index arrays may move the indexed axes in front of the batch axis
+        raise _no_batching_rule(func.__name__)
+    arguments["query"] = (slice(None),) + query
+    return _call(func, bound)
+
+
+_BATCHING_RULES = {
+    "argmax": _arg_reduction_rule,
+    "array": _asarray_rule,
+    "asarray": _asarray_rule,
+    "argmin": _arg_reduction_rule,
+    "cumprod": _cumulative_rule,
+    "cumsum": _cumulative_rule,
+    "expand_dims": _expand_dims_rule,
+    "get_item": _get_item_rule,
+    "linear": _trailing_rule(1),
+    "matmul": _matmul_rule,
+    "matrix_transpose": _trailing_rule(2),
+    "permute_dims": _permute_dims_rule,
+    "reshape": _reshape_rule,
+    "squeeze": _squeeze_rule,
+    "swapaxes": _swapaxes_rule,
+}
+
+
+def _batched_result(ret, axis_size):
+    # tuples of results are stacked per example, as the per-example loop does, and
+    # results which do not depend on the batch are repeated for every example
+    if isinstance(ret, _BatchTracer):
+        return ret.value
+    if isinstance(ret, (tuple, list)):
+        return np.stack([_batched_result(r, axis_size) for r in ret], axis=1)
+    ret = np.asarray(ret)
+    return np.repeat(ret[None], axis_size, axis=0)
+
+
+def _vmap_batched(func, args, batched, axis_size):
+    """
+    Call func once on the batched args and return its batched result, or None if it
+    uses an operation without a batching rule. Any other error raised by func is
+    propagated.
+    """
+    try:
+        ret = func(*[_BatchTracer(arg) if b else arg for arg, b in zip(args, batched)])
+        return _batched_result(ret, axis_size)
+    except _NoBatchingRule:
+        return None
+
+
 def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: int = 0,
 ) -> Callable:
+    batchable = [True]
+
     @ivy.output_to_native_arrays
     @ivy.inputs_to_native_arrays
     def _vmap(*args):
@@ -388,19 +982,6 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped to index zero.
         if isinstance(in_axes, (tuple, list)):
             for i in range(len(in_axes)):
@@ -409,12 +990,30 @@ def vmap(
         elif isinstance(in_axes, int):
             args[0] = np.moveaxis(args[0], in_axes, 0)
 
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
+        # vectorisation, running every operation of func once on the whole batch
+        batched = [
+            not isinstance(in_axes, (tuple, list)) or in_axes[i] is not None
+            for i in range(len(args))
+        ]
+        res = None
+        if batchable[0]:
+            res = _vmap_batched(func, args, batched, next(iter(axis_size)))
+            # func uses an operation without a batching rule, so it is mapped over
+            # the examples from now on
+            batchable[0] = res is not None
+
+        if res is None:
+            # Handling None in in_axes by broadcasting the axis_size
+            for i, is_batched in enumerate(batched):
+                if not is_batched:
+                    args[i] = np.broadcast_to(
+                        args[i], (tuple(axis_size) + args[i].shape)
+                    )
+            arr_results = []
+            for arrays in zip(*args):
+                single_op = func(*arrays)
+                arr_results.append(single_op)
+            res = np.stack(arr_results)
 
         if out_axes:
             res = np.moveaxis(res, 0, out_axes)
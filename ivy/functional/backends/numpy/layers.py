@@ -23,13 +23,17 @@ def _add_dilations(x, dilations, axis, values=0):
     )
 
 
-def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
-    for j in range(dims):
-        if dilations[j] > 1:
-            filters = _add_dilations(filters, dilations[j], axis=j)
+def _dilated_kernel_shape(kernel_shape, dilations):
+    return [k + (k - 1) * (d - 1) for k, d in zip(kernel_shape, dilations)]
+
+
+def _pad_conv(x, filters, strides, padding, dims, dilations):
+    # the filters are dilated by the window view in `_conv`, only the effective
+    # kernel size is needed here
+    kernel_shape = _dilated_kernel_shape(filters.shape[:dims], dilations)
     if isinstance(padding, str):
         pad_specific = [
-            _handle_padding(x.shape[1 + i], strides[i], filters.shape[i], padding)
+            _handle_padding(x.shape[1 + i], strides[i], kernel_shape[i], padding)
             for i in range(dims)
         ]
         pad_list = [
@@ -48,12 +52,98 @@ def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
         pad_width=pad_width,
         mode="constant",
     )
-    return x, filters
+    return x
 
 
-def _dilate_pad_conv_tranpose(
-    x, filters, strides, padding, dims, dilations, output_shape
-):
+# upper bound on the number of elements of the patch matrix gathered at once by
+# `_conv`, larger convolutions are computed chunk by chunk along the batch and
+# first output dimension so that the peak memory stays bounded
+_IM2COL_MAX_ELEMENTS = 2**24
+
+
+def _conv_windows(x, kernel_shape, strides, dims, dilations=None):
+    # B x O1 x .. x Od x K1 x .. x Kd x I view of the padded input, no copy,
+    # dilated kernels simply step over the skipped elements
+    dilations = [1] * dims if dilations is None else dilations
+    dilated_shape = _dilated_kernel_shape(kernel_shape, dilations)
+    out_shape = [
+        (x.shape[i + 1] - dilated_shape[i]) // strides[i] + 1 for i in range(dims)
+    ]
+    new_shape = [x.shape[0], *out_shape, *kernel_shape, x.shape[-1]]
+    new_strides = (
+        x.strides[0],
+        *[x.strides[i + 1] * strides[i] for i in range(dims)],
+        *[x.strides[i + 1] * dilations[i] for i in range(dims)],
+        x.strides[-1],
+    )
+    return np.lib.stride_tricks.as_strided(x, new_shape, new_strides, writeable=False)
+
+
+def _conv_chunks(batch_size, rows, row_elements):
+    # yields (batch, row) slices of the output whose patch matrices hold at most
+    # _IM2COL_MAX_ELEMENTS elements, whole batch items are preferred over rows
+    item_elements = max(rows * row_elements, 1)
+    if item_elements <= _IM2COL_MAX_ELEMENTS:
+        step = _IM2COL_MAX_ELEMENTS // item_elements
+        for b in range(0, batch_size, step):
+            yield slice(b, b + step), slice(None)
+    else:
+        step = max(_IM2COL_MAX_ELEMENTS // max(row_elements, 1), 1)
+        for b in range(batch_size):
+            for r in range(0, rows, step):
+                yield slice(b, b + 1), slice(r, r + step)
+
+
+def _conv(x, filters, strides, dims, dilations=None, feature_group_count=1):
+    """
+    Convolve a padded channel-last input with optionally dilated filters.
+
+    The strided windows of `x` are gathered into a patch matrix (im2col) which is
+    multiplied with the filters reshaped to a matrix, so every output chunk is a
+    single BLAS call. `filters` has shape K1 x .. x Kd x (I / groups) x O.
+    """
+    kernel_shape = list(filters.shape[:dims])
+    input_dim, output_dim = filters.shape[-2], filters.shape[-1]
+    windows = _conv_windows(x, kernel_shape, strides, dims, dilations)
+    out_shape = list(windows.shape[1 : dims + 1])
+    res = np.empty(
+        [x.shape[0], *out_shape, output_dim], dtype=np.result_type(x, filters)
+    )
+    if res.size == 0:
+        return res
+    kernel_axes = tuple(range(dims + 1, 2 * dims + 2))
+    filter_axes = tuple(range(dims + 1))
+    group_dim = output_dim // feature_group_count
+    if feature_group_count > 1 and input_dim == 1:
+        # depthwise, each input channel only meets its own group of filters
+        out_idx, kernel_idx = "abc"[:dims], "def"[:dims]
+        equation = "n{}{}i,{}im->n{}im".format(out_idx, kernel_idx, kernel_idx, out_idx)
+        filters = filters.reshape(kernel_shape + [feature_group_count, group_dim])
+    row_elements = int(np.prod(out_shape[1:])) * int(np.prod(kernel_shape))
+    row_elements *= x.shape[-1]
+    for batch, rows in _conv_chunks(x.shape[0], out_shape[0], row_elements):
+        chunk = windows[batch, rows]
+        if feature_group_count == 1:
+            res[batch, rows] = np.tensordot(
+                chunk, filters, axes=(kernel_axes, filter_axes)
+            )
+        elif input_dim == 1:
+            res[batch, rows] = np.einsum(equation, chunk, filters).reshape(
+                chunk.shape[: dims + 1] + (output_dim,)
+            )
+        else:
+            for g in range(feature_group_count):
+                res[batch, rows, ..., g * group_dim : (g + 1) * group_dim] = (
+                    np.tensordot(
+                        chunk[..., g * input_dim : (g + 1) * input_dim],
+                        filters[..., g * group_dim : (g + 1) * group_dim],
+                        axes=(kernel_axes, filter_axes),
+                    )
+                )
+    return res
+
+
+def _pad_conv_tranpose(x, filters, strides, padding, dims, dilations, output_shape):
     strides = [strides] * dims if isinstance(strides, int) else strides
     dilations = [dilations] * dims if isinstance(dilations, int) else dilations
     if output_shape is None:
@@ -69,23 +159,22 @@ def _dilate_pad_conv_tranpose(
     for i in reversed(range(dims)):
         if strides[i] > 1:
             x = _add_dilations(x, strides[i], axis=i + 1)
-        if dilations[i] > 1:
-            filters = _add_dilations(filters, dilations[i], axis=i)
+    kernel_shape = _dilated_kernel_shape(filters.shape[:dims], dilations)
     pad_specific = [
-        _handle_padding(output_shape[i + 1], strides[i], filters.shape[i], padding)
+        _handle_padding(output_shape[i + 1], strides[i], kernel_shape[i], padding)
         for i in range(dims)
     ]
     extra_pad = [
         max(
             0,
             output_shape[i + 1]
-            - (x.shape[i + 1] + filters.shape[i] - 1 - pad_specific[i]),
+            - (x.shape[i + 1] + kernel_shape[i] - 1 - pad_specific[i]),
         )
         for i in range(dims)
     ]
-    pad_top = [filters.shape[i] - 1 - (pad_specific[i] // 2) for i in range(dims)]
+    pad_top = [kernel_shape[i] - 1 - (pad_specific[i] // 2) for i in range(dims)]
     pad_bot = [
-        filters.shape[i] - 1 - (pad_specific[i] - pad_specific[i] // 2)
+        kernel_shape[i] - 1 - (pad_specific[i] - pad_specific[i] // 2)
         for i in range(dims)
     ]
     pad_list = [(pad_top[i], pad_bot[i] + extra_pad[i]) for i in range(dims)]
@@ -98,7 +187,7 @@ def _dilate_pad_conv_tranpose(
         ],
         "constant",
     )
-    return x, filters
+    return x
 
 
 def conv1d(
@@ -117,34 +206,9 @@ def conv1d(
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
 
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
+    x = _pad_conv(x, filters, strides, padding, 1, dilations)
     # B x OW x O
-    res = np.sum(mult, (2, 3))
+    res = _conv(x, filters, strides, 1, dilations)
 
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -165,12 +229,10 @@ def conv1d_transpose(
 ) -> np.ndarray:
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
-    x, filters = _dilate_pad_conv_tranpose(
-        x, filters, strides, padding, 1, dilations, output_shape
-    )
+    x = _pad_conv_tranpose(x, filters, strides, padding, 1, dilations, output_shape)
     x = np.flip(x, (1,))
     res = np.flip(
-        conv1d(x, filters, 1, "VALID", data_format="NWC", dilations=1),
+        conv1d(x, filters, 1, "VALID", data_format="NWC", dilations=dilations),
         (1,),
     )
     if data_format == "NCW":
@@ -194,37 +256,9 @@ def conv2d(
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
 
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
+    x = _pad_conv(x, filters, strides, padding, 2, dilations)
     # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv(x, filters, strides, 2, dilations)
 
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
@@ -245,12 +279,10 @@ def conv2d_transpose(
 ):
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
-    x, filters = _dilate_pad_conv_tranpose(
-        x, filters, strides, padding, 2, dilations, output_shape
-    )
+    x = _pad_conv_tranpose(x, filters, strides, padding, 2, dilations, output_shape)
     x = np.flip(x, (1, 2))
     res = np.flip(
-        conv2d(x, filters, 1, "VALID", data_format="NHWC", dilations=1),
+        conv2d(x, filters, 1, "VALID", data_format="NHWC", dilations=dilations),
         (1, 2),
     )
     if data_format == "NCHW":
@@ -271,47 +303,17 @@ def depthwise_conv2d(
 ):
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    # KH x KW x 1 x C, a grouped convolution with one group per channel
+    filters = np.expand_dims(filters, -2)
+    x = _pad_conv(x, filters, strides, padding, 2, dilations)
+    res = _conv(x, filters, strides, 2, dilations, x.shape[-1])
+
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -330,40 +332,9 @@ def conv3d(
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
 
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
+    x = _pad_conv(x, filters, strides, padding, 3, dilations)
     # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _conv(x, filters, strides, 3, dilations)
 
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
@@ -384,12 +355,10 @@ def conv3d_transpose(
 ):
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
-    x, filters = _dilate_pad_conv_tranpose(
-        x, filters, strides, padding, 3, dilations, output_shape
-    )
+    x = _pad_conv_tranpose(x, filters, strides, padding, 3, dilations, output_shape)
     x = np.flip(x, (1, 2, 3))
     res = np.flip(
-        conv3d(x, filters, 1, "VALID", data_format="NDHWC", dilations=1),
+        conv3d(x, filters, 1, "VALID", data_format="NDHWC", dilations=dilations),
         (1, 2, 3),
     )
     if data_format == "NCDHW":
@@ -421,48 +390,9 @@ def conv_general_dilated(
     for j in range(dims):
         if x_dilations[j] > 1:
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
+    x = _pad_conv(x, filters, strides, padding, dims, dilations)
+    # B x O1 x .. x Od x O
+    res = _conv(x, filters, strides, dims, dilations, feature_group_count)
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
@@ -488,9 +418,7 @@ def conv_general_transpose(
     if data_format == "channel_first":
         x = np.transpose(x, (0, *range(2, dims + 2), 1))
 
-    x, filters = _dilate_pad_conv_tranpose(
-        x, filters, strides, padding, dims, dilations, output_shape
-    )
+    x = _pad_conv_tranpose(x, filters, strides, padding, dims, dilations, output_shape)
 
     x = np.flip(x, (*range(1, dims + 1),))
     res = np.concatenate(
@@ -503,7 +431,7 @@ def conv_general_transpose(
                     "VALID",
                     dims=dims,
                     data_format=_get_x_data_format(dims, "channel_last"),
-                    dilations=1,
+                    dilations=dilations,
                 ),
                 (*range(1, dims + 1),),
             )
@@ -518,3 +446,56 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: np.ndarray,
+    init_h: np.ndarray,
+    init_c: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    /,
+    *,
+    bias: Optional[np.ndarray] = None,
+    recurrent_bias: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    batch_shape = x.shape[:-2]
+    timesteps = x.shape[-2]
+    output_channels = init_h.shape[-1]
+    dtype = np.result_type(x, init_h, init_c, kernel, recurrent_kernel)
+
+    # input kernel, applied to all timesteps at once, with both biases folded in
+    Wi_x = np.matmul(x.reshape((-1, timesteps, x.shape[-1])), kernel).astype(
+        dtype, copy=False
+    )
+    if bias is not None:
+        Wi_x += bias
+    if recurrent_bias is not None:
+        Wi_x += recurrent_bias
+
+    # sigmoid(x) = tanh(x / 2) / 2 + 1 / 2, so all four gates are activated with one
+    # tanh, scaling and shifting the input, forget and output gates around it
+    scale = np.full((4, output_channels), 0.5, dtype=dtype)
+    scale[2] = 1
+    shift = np.full((4, output_channels), 0.5, dtype=dtype)
+    shift[2] = 0
+    scale, shift = scale.reshape(-1), shift.reshape(-1)
+
+    ht = init_h.reshape((-1, output_channels)).astype(dtype)
+    ct = init_c.reshape((-1, output_channels)).astype(dtype)
+    hts = np.empty(Wi_x.shape[:2] + (output_channels,), dtype=dtype)
+    gates = np.empty(Wi_x.shape[:1] + Wi_x.shape[2:], dtype=dtype)
+    for t in range(timesteps):
+        np.matmul(ht, recurrent_kernel, out=gates)
+        gates += Wi_x[:, t]
+        gates *= scale
+        np.tanh(gates, out=gates)
+        gates *= scale
+        gates += shift
+        it, ft, gt, ot = np.split(gates, 4, axis=-1)
+        ct = ft * ct + it * gt
+        ht = np.multiply(ot, np.tanh(ct), out=hts[:, t])
+    return (
+        hts.reshape(batch_shape + (timesteps, output_channels)),
+        ct.reshape(batch_shape + (output_channels,)),
+    )
@@ -112,7 +112,7 @@ def sum(
     keepdims: bool = False,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    if dtype is None and not ivy.is_bool_dtype(x):
+    if dtype is None and x.dtype != np.bool_:
         dtype = x.dtype
     axis = tuple(axis) if isinstance(axis, list) else axis
     return np.asarray(
@@ -54,13 +54,11 @@ def native_sparse_array(
             values,
             dense_shape,
         )
-        all_coordinates = []
-        for i in range(values.shape[0]):
-            coordinate = ivy.gather(coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
+        # a SparseTensor holds one row of int64 coordinates per value
         return tf.SparseTensor(
-            indices=all_coordinates, values=values, dense_shape=dense_shape
+            indices=tf.cast(tf.transpose(coo_indices), tf.int64),
+            values=values,
+            dense_shape=dense_shape,
         )
     elif format == "csr":
         _verify_csr_components(
@@ -100,5 +98,5 @@ def native_sparse_array(
 
 def native_sparse_array_to_indices_values_and_shape(x):
     if isinstance(x, tf.SparseTensor):
-        return {"coo_indices": x.indices}, x.values, x.dense_shape
+        return {"coo_indices": tf.transpose(x.indices)}, x.values, x.dense_shape
     raise ivy.utils.exceptions.IvyException("not a SparseTensor")
@@ -443,3 +443,49 @@ def conv_general_transpose(
     if data_format == "channel_first":
         res = tf.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+@with_unsupported_dtypes({"2.12.0 and below": ("bfloat16", "complex")}, backend_version)
+def lstm_update(
+    x: Union[tf.Tensor, tf.Variable],
+    init_h: Union[tf.Tensor, tf.Variable],
+    init_c: Union[tf.Tensor, tf.Variable],
+    kernel: Union[tf.Tensor, tf.Variable],
+    recurrent_kernel: Union[tf.Tensor, tf.Variable],
+    /,
+    *,
+    bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
+    recurrent_bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
+) -> Tuple[Union[tf.Tensor, tf.Variable], Union[tf.Tensor, tf.Variable]]:
+    batch_shape = list(x.shape[:-2])
+    timesteps = x.shape[-2]
+    output_channels = init_h.shape[-1]
+
+    # input kernel, applied to all timesteps at once, with both biases folded in
+    Wi_x = tf.matmul(tf.reshape(x, (-1, timesteps, x.shape[-1])), kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+
+    def _lstm_step(Wi_xt, states):
+        ht, ct = states
+        gates = Wi_xt + tf.matmul(ht, recurrent_kernel)
+        it, ft, gt, ot = tf.split(gates, 4, axis=-1)
+        ct = tf.sigmoid(ft) * ct + tf.sigmoid(it) * tf.tanh(gt)
+        ht = tf.sigmoid(ot) * tf.tanh(ct)
+        return ht, [ht, ct]
+
+    # the recurrent loop of the keras LSTM layer when cuDNN is not used
+    _, hts, (_, ct) = tf.keras.backend.rnn(
+        _lstm_step,
+        Wi_x,
+        [
+            tf.reshape(init_h, (-1, output_channels)),
+            tf.reshape(init_c, (-1, output_channels)),
+        ],
+    )
+    return (
+        tf.reshape(hts, batch_shape + [timesteps, output_channels]),
+        tf.reshape(ct, batch_shape + [output_channels]),
+    )
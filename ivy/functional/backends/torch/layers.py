@@ -479,3 +479,52 @@ def conv_general_transpose(
     if data_format == "channel_last":
         res = res.permute(0, *range(2, dims + 2), 1)
     return res
+
+
+@with_unsupported_dtypes(
+    {"2.0.1 and below": ("float16", "bfloat16", "complex")},
+    backend_version,
+)
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    batch_shape = tuple(x.shape[:-2])
+    timesteps = x.shape[-2]
+    output_channels = init_h.shape[-1]
+
+    # torch stores the gates in the same input, forget, cell, output order, with
+    # the kernels transposed
+    params = [kernel.t(), recurrent_kernel.t()]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        params += [
+            bias if bias is not None else torch.zeros_like(recurrent_bias),
+            (recurrent_bias if recurrent_bias is not None else torch.zeros_like(bias)),
+        ]
+    hx = (
+        init_h.reshape(1, -1, output_channels),
+        init_c.reshape(1, -1, output_channels),
+    )
+    hts, _, ct = torch._VF.lstm(
+        x.reshape(-1, timesteps, x.shape[-1]),
+        hx,
+        params,
+        has_biases,
+        1,
+        0.0,
+        False,
+        False,
+        True,
+    )
+    return (
+        hts.reshape(batch_shape + (timesteps, output_channels)),
+        ct.reshape(batch_shape + (output_channels,)),
+    )
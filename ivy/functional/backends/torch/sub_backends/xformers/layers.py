@@ -12,8 +12,18 @@ def scaled_dot_product_attention(
     /,
     *,
     mask=None,
+    is_causal=False,
+    chunk_size=None,
     out=None,
 ):
+    # memory_efficient_attention already tiles the keys, so chunk_size is unused
     if isinstance(mask, torch.Tensor):
         mask = torch.where(mask == 0, -torch.inf, 0)
+        if is_causal:
+            causal = torch.full(
+                (q.shape[-2], k.shape[-2]), -torch.inf, device=mask.device
+            )
+            mask = mask + torch.triu(causal, 1)
+    elif is_causal:
+        mask = xops.LowerTriangularMask()
     return xops.memory_efficient_attention(q, k, v, scale=scale, attn_bias=mask)
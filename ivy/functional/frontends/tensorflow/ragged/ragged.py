@@ -1,44 +1,62 @@
+import numpy as np
+
 import ivy
+from ivy.functional.frontends.tensorflow.func_wrapper import _to_ivy_array
 
 
 # TODO: Align behavior with tensorflow, modify so that the elements of the raggedTensor
 #  object are of type EagerTensor
 # ensure that the values and row_splits are of type EagerTensor too
-# add more initializer methods
+
+
+def _to_numpy_indices(x):
+    x = _to_ivy_array(x)
+    return np.asarray(ivy.to_numpy(x) if ivy.is_array(x) else x, dtype=np.int64)
+
+
+def _splits_from_lengths(row_lengths):
+    row_splits = np.zeros(len(row_lengths) + 1, dtype=np.int64)
+    np.cumsum(row_lengths, out=row_splits[1:])
+    return row_splits
 
 
 class RaggedTensor:
-    def __init__(self, values, row_partition, internal=False, data=None):
+    def __init__(self, values, row_splits, internal=False):
         if not internal:
             raise ivy.utils.exceptions.IvyException(
                 "RaggedTensor constructor is private; please use one of the "
                 "factory methods instead "
                 "(e.g., RaggedTensor.from_row_lengths())"
             )
+        # the rows are views into the values, delimited by the row splits
         self._values = values
-        self.data = data
-        self._row_partition = row_partition
+        self._row_splits = row_splits
+
+    @staticmethod
+    def _as_values(values):
+        if isinstance(values, RaggedTensor):
+            return values
+        return ivy.asarray(_to_ivy_array(values))
 
     @classmethod
     def from_row_splits(cls, values, row_splits, name=None, validate=True):
-        # TODO : modify this, if necessary, to accept raggedTensor inputs too
-
-        if values.shape[0] != row_splits[-1] or row_splits[0] != 0:
-            if values.shape[0] != row_splits[-1]:
-                ivy.utils.exceptions.IvyException(
+        values = cls._as_values(values)
+        row_splits = _to_numpy_indices(row_splits)
+        if validate:
+            if not len(row_splits) or row_splits[0] != 0:
+                raise ivy.utils.exceptions.IvyException(
+                    "first value of row_splits should be equal to zero."
+                )
+            if row_splits[-1] != len(values):
+                raise ivy.utils.exceptions.IvyException(
                     "first dimension of shape of values should be equal to the"
                     " last dimension of row_splits"
                 )
-            else:
-                ivy.utils.exceptions.IvyException(
-                    "first value of row_splits should be equal to zero."
+            if (np.diff(row_splits) < 0).any():
+                raise ivy.utils.exceptions.IvyException(
+                    "row_splits should be sorted in ascending order."
                 )
-        data = [
-            values[row_splits[i] : row_splits[i + 1], :]
-            for i in range(len(row_splits) - 1)
-        ]
-
-        return cls(values=values, row_partition=row_splits, internal=True, data=data)
+        return cls(values, row_splits, internal=True)
 
     @classmethod
     def from_row_lengths(
@@ -47,24 +65,13 @@ class RaggedTensor:
         row_lengths,
         name=None,
     ):
-        # TODO : modify this, if necessary, to accept raggedTensor inputs too
-        if sum(row_lengths) != values.shape[0]:
-            ivy.utils.exceptions.IvyException(
+        values = cls._as_values(values)
+        row_lengths = _to_numpy_indices(row_lengths)
+        if (row_lengths < 0).any() or row_lengths.sum() != len(values):
+            raise ivy.utils.exceptions.IvyException(
                 "first dimension of values should be equal to sum(row_lengths) "
             )
-        data = []
-        z = 0
-        for length in row_lengths:
-            temp = []
-            for i in range(length):
-                temp.append(values[z, :])
-                z += 1
-
-            data.append(ivy.asarray(temp))
-
-        # data =[[values[0+i,:] for i in range(length)]
-        #   for length in row_lengths]
-        return cls(values=values, row_partition=row_lengths, internal=True, data=data)
+        return cls(values, _splits_from_lengths(row_lengths), internal=True)
 
     @classmethod
     def from_value_rowids(
@@ -74,19 +81,25 @@ class RaggedTensor:
         nrows=None,
         name=None,
     ):
-        if not nrows:
-            nrows = value_rowids[-1] + 1
-        data = []
-        for row in range(nrows):
-            temp = []
-            for i in range(len(values)):
-                if value_rowids[i] == row:
-                    temp.append(values[i, :])
-            data.append(ivy.asarray(temp))
-
-        # data= [[values[i,:] for i in range(len(values)) if value_rowids[i] == row]
-        #   for row in range(nrows)]
-        return cls(values=values, row_partition=value_rowids, internal=True, data=data)
+        values = cls._as_values(values)
+        value_rowids = _to_numpy_indices(value_rowids)
+        if nrows is None:
+            nrows = int(value_rowids[-1]) + 1 if len(value_rowids) else 0
+        if len(value_rowids) != len(values):
+            raise ivy.utils.exceptions.IvyException(
+                "value_rowids should have one row id per value."
+            )
+        if len(value_rowids) and (
+            value_rowids[0] < 0
+            or value_rowids[-1] >= nrows
+            or (np.diff(value_rowids) < 0).any()
+        ):
+            raise ivy.utils.exceptions.IvyException(
+                "value_rowids should be sorted in ascending order and within"
+                " [0, nrows)."
+            )
+        row_lengths = np.bincount(value_rowids, minlength=nrows)
+        return cls(values, _splits_from_lengths(row_lengths), internal=True)
 
     @classmethod
     def from_row_starts(
@@ -95,11 +108,184 @@ class RaggedTensor:
         row_starts,
         name=None,
     ):
-        # TODO since row_starts will be a tensor try appending using concat after
-        #  ensuring row_starts
-        # is a tensor
-        row_starts.append(len(values))
-        return cls.from_row_splits(values, row_starts)
+        values = cls._as_values(values)
+        row_starts = _to_numpy_indices(row_starts)
+        return cls.from_row_splits(values, np.append(row_starts, len(values)))
+
+    @classmethod
+    def from_tensor(cls, tensor, lengths=None, padding=None, ragged_rank=1, name=None):
+        """
+        Build a ragged tensor from the rows of a dense tensor, without their padding.
+
+        Parameters
+        ----------
+        tensor
+            The dense tensor, with at least ``ragged_rank + 1`` dimensions.
+        lengths
+            The length of every row. Only supported for a ``ragged_rank`` of 1.
+        padding
+            The padding value. The trailing elements of the innermost rows which are
+            equal to it are removed. Ignored if ``lengths`` is given.
+        ragged_rank
+            The number of ragged dimensions of the result. Default is ``1``.
+
+        Returns
+        -------
+        ret
+            The ragged tensor.
+        """
+        tensor = ivy.asarray(_to_ivy_array(tensor))
+        shape = tuple(tensor.shape)
+        if not 0 < ragged_rank < len(shape):
+            raise ivy.utils.exceptions.IvyException(
+                "ragged_rank should be in [1, {}), got {}".format(
+                    len(shape), ragged_rank
+                )
+            )
+        num_rows, max_length = shape[:2]
+        flat = ivy.reshape(tensor, (num_rows * max_length,) + shape[2:])
+        uniform_splits = np.arange(num_rows + 1, dtype=np.int64) * max_length
+        if ragged_rank > 1:
+            if lengths is not None:
+                raise ivy.utils.exceptions.IvyException(
+                    "lengths are only supported for a ragged_rank of 1"
+                )
+            values = cls.from_tensor(flat, padding=padding, ragged_rank=ragged_rank - 1)
+            return cls(values, uniform_splits, internal=True)
+        if lengths is not None:
+            lengths = np.minimum(_to_numpy_indices(lengths), max_length)
+        elif padding is not None:
+            not_padding = ivy.to_numpy(ivy.not_equal(tensor, padding))
+            not_padding = not_padding.reshape(num_rows, max_length, -1).any(axis=-1)
+            # the rows end after their last element which is not padding
+            lengths = np.where(
+                not_padding.any(axis=1),
+                max_length - np.argmax(not_padding[:, ::-1], axis=1),
+                0,
+            )
+        else:
+            return cls(flat, uniform_splits, internal=True)
+        keep = np.flatnonzero(np.arange(max_length) < lengths[:, None])
+        values = ivy.gather(flat, ivy.asarray(keep), axis=0)
+        return cls(values, _splits_from_lengths(lengths), internal=True)
+
+    def _row(self, index):
+        return self._values[
+            int(self._row_splits[index]) : int(self._row_splits[index + 1])
+        ]
+
+    def _gather_rows(self, row_ids):
+        starts = self._row_splits[row_ids]
+        row_lengths = self._row_splits[row_ids + 1] - starts
+        row_splits = _splits_from_lengths(row_lengths)
+        # the index of every value of the gathered rows in self.values
+        value_ids = np.arange(row_splits[-1]) + np.repeat(
+            starts - row_splits[:-1], row_lengths
+        )
+        if isinstance(self._values, RaggedTensor):
+            values = self._values._gather_rows(value_ids)
+        else:
+            values = ivy.gather(self._values, ivy.asarray(value_ids), axis=0)
+        return self.__class__(values, row_splits, internal=True)
+
+    def _padded_values(self, default_value, shape=None):
+        # the values with their ragged dimensions padded, followed by one row of
+        # default values which the padding of the rows is gathered from
+        values = self._values
+        if isinstance(values, RaggedTensor):
+            values = values.to_tensor(
+                default_value, shape=None if shape is None else [None] + shape[2:]
+            )
+        elif shape is not None and any(
+            s is not None and s != v for s, v in zip(shape[2:], values.shape[1:])
+        ):
+            raise ivy.utils.exceptions.IvyException(
+                "shape {} is incompatible with the values of shape {}".format(
+                    shape, values.shape
+                )
+            )
+        default_value = ivy.astype(
+            ivy.asarray(ivy.default(default_value, 0)), values.dtype
+        )
+        default_value = ivy.broadcast_to(default_value, (1,) + tuple(values.shape[1:]))
+        return ivy.concat([values, default_value], axis=0)
+
+    def _pad_rows(self, padded_values, row_ids, num_rows, max_length):
+        starts = self._row_splits[row_ids]
+        row_lengths = self._row_splits[row_ids + 1] - starts
+        positions = np.arange(max_length)
+        default_id = padded_values.shape[0] - 1
+        index = np.full((num_rows, max_length), default_id, dtype=np.int64)
+        num_rows = min(num_rows, len(row_ids))
+        index[:num_rows] = np.where(
+            positions < row_lengths[:num_rows, None],
+            starts[:num_rows, None] + positions,
+            default_id,
+        )
+        return ivy.gather(padded_values, ivy.asarray(index), axis=0)
+
+    def to_tensor(self, default_value=None, name=None, shape=None):
+        """
+        Stack the rows into a dense tensor, padding the ragged dimensions.
+
+        Parameters
+        ----------
+        default_value
+            The value of the padding. Default is zero.
+        shape
+            The shape of the result, with ``None`` for the dimensions to infer. The
+            rows are truncated or padded to it along the ragged dimensions.
+
+        Returns
+        -------
+        ret
+            The dense tensor.
+        """
+        shape = None if shape is None else list(shape)
+        padded_values = self._padded_values(default_value, shape)
+        row_lengths = np.diff(self._row_splits)
+        num_rows = len(row_lengths)
+        max_length = int(row_lengths.max(initial=0))
+        if shape is not None:
+            num_rows = ivy.default(shape[0], num_rows)
+            max_length = ivy.default(shape[1], max_length)
+        return self._pad_rows(
+            padded_values, np.arange(len(row_lengths)), num_rows, max_length
+        )
+
+    def bucket_by_length(self, batch_size, default_value=None):
+        """
+        Split the rows into dense batches of similar lengths, to minimize padding.
+
+        The rows are sorted by length and every ``batch_size`` consecutive rows are
+        padded to the longest of them. The inner ragged dimensions, if any, are
+        padded to their longest row across all the batches.
+
+        Parameters
+        ----------
+        batch_size
+            The number of rows per batch. The last batch can be smaller.
+        default_value
+            The value of the padding. Default is zero.
+
+        Returns
+        -------
+        ret
+            The list of ``(row_ids, batch)`` pairs, with the indices of the rows of
+            every batch in self, and the batch as a dense tensor.
+        """
+        ivy.utils.assertions.check_greater(batch_size, 0)
+        padded_values = self._padded_values(default_value)
+        row_lengths = np.diff(self._row_splits)
+        order = np.argsort(row_lengths, kind="stable")
+        batches = []
+        for start in range(0, len(order), batch_size):
+            row_ids = order[start : start + batch_size]
+            batch = self._pad_rows(
+                padded_values, row_ids, len(row_ids), int(row_lengths[row_ids[-1]])
+            )
+            batches.append((ivy.asarray(row_ids), batch))
+        return batches
 
     def to_list(self):
         vals = []
@@ -110,6 +296,21 @@ class RaggedTensor:
                 vals.append(ivy.to_list(i))
         return vals
 
+    def nrows(self):
+        return len(self._row_splits) - 1
+
+    def row_lengths(self):
+        return ivy.asarray(np.diff(self._row_splits))
+
+    def value_rowids(self):
+        return ivy.asarray(
+            np.repeat(np.arange(self.nrows()), np.diff(self._row_splits))
+        )
+
+    @property
+    def data(self):
+        return list(self)
+
     @property
     def values(self):
         return self._values
@@ -123,7 +324,7 @@ class RaggedTensor:
 
     @property
     def row_splits(self):
-        return self._row_partition
+        return ivy.asarray(self._row_splits)
 
     @property
     def nested_row_splits(self):
@@ -133,3 +334,30 @@ class RaggedTensor:
             rt_nested_splits.append(rt_values.row_splits)
             rt_values = rt_values.values
         return tuple(rt_nested_splits)
+
+    def __len__(self):
+        return self.nrows()
+
+    def __iter__(self):
+        for i in range(self.nrows()):
+            yield self._row(i)
+
+    def __getitem__(self, query):
+        nrows = self.nrows()
+        if isinstance(query, slice):
+            start, stop, step = query.indices(nrows)
+            if step != 1:
+                return self._gather_rows(np.arange(start, stop, step))
+            # contiguous rows are a view into the values
+            stop = max(start, stop)
+            row_splits = self._row_splits[start : stop + 1]
+            return self.__class__(
+                self._values[int(row_splits[0]) : int(row_splits[-1])],
+                row_splits - row_splits[0],
+                internal=True,
+            )
+        if query < 0:
+            query += nrows
+        if not 0 <= query < nrows:
+            raise IndexError("ragged tensor index out of range")
+        return self._row(query)
@@ -2,6 +2,7 @@ import ivy
 from ivy.utils.exceptions import handle_exceptions
 
 # global
+import builtins
 from numbers import Number
 from typing import Union, Tuple, Iterable
 
@@ -240,30 +241,68 @@ def promote_types_of_torch_inputs(
     used as inputs only for those functions that expect an array-like or
     tensor-like objects, otherwise it might give unexpected results.
     """
+    # a python scalar of the same kind as the array it is paired with takes the
+    # dtype of that array, which only needs a single conversion
+    if _scalar_of_array_kind(x2, x1):
+        return x1, ivy.asarray(
+            x2, dtype=x1.dtype, device=ivy.default_device(item=x1, as_native=False)
+        )
+    if _scalar_of_array_kind(x1, x2):
+        return (
+            ivy.asarray(
+                x1, dtype=x2.dtype, device=ivy.default_device(item=x2, as_native=False)
+            ),
+            x2,
+        )
     # Ignore type of 0-dim arrays to mimic torch
-    x1 = ivy.asarray(x1)
-    x2 = ivy.asarray(x2)
-    type1 = ivy.default_dtype(item=x1).strip("u123456789")
-    type2 = ivy.default_dtype(item=x2).strip("u123456789")
+    x1 = _asarray(x1)
+    x2 = _asarray(x2)
+    type1 = x1.dtype.strip("u123456789")
+    type2 = x2.dtype.strip("u123456789")
     if not x1.shape == () and x2.shape == () and type1 == type2:
-        x1 = ivy.asarray(x1)
-        x2 = ivy.asarray(
+        x2 = _asarray(
             x2, dtype=x1.dtype, device=ivy.default_device(item=x1, as_native=False)
         )
     elif x1.shape == () and not x2.shape == () and type1 == type2:
-        x1 = ivy.asarray(
+        x1 = _asarray(
             x1, dtype=x2.dtype, device=ivy.default_device(item=x2, as_native=False)
         )
-        x2 = ivy.asarray(x2)
-    else:
-        x1 = ivy.asarray(x1)
-        x2 = ivy.asarray(x2)
+    elif x1.dtype != x2.dtype:
         promoted = promote_types_torch(x1.dtype, x2.dtype)
-        x1 = ivy.asarray(x1, dtype=promoted)
-        x2 = ivy.asarray(x2, dtype=promoted)
+        x1 = _asarray(x1, dtype=promoted)
+        x2 = _asarray(x2, dtype=promoted)
     return x1, x2
 
 
+# the builtin types, which are shadowed by the dtypes of this module
+_scalar_kinds = {
+    builtins.bool: "bool",
+    builtins.int: "int",
+    builtins.float: "float",
+    builtins.complex: "complex",
+}
+
+
+def _scalar_of_array_kind(scalar, x):
+    return (
+        type(x) is ivy.Array
+        and x.shape != ()
+        and _scalar_kinds.get(type(scalar)) == x.dtype.strip("u123456789")
+    )
+
+
+def _asarray(x, dtype=None, device=None):
+    # ivy arrays which already have the dtype and device are used as they are,
+    # rather than going through the wrappers of ivy.asarray
+    if (
+        type(x) is ivy.Array
+        and (dtype is None or x.dtype == dtype)
+        and (device is None or ivy.as_ivy_dev(x.device) == device)
+    ):
+        return x
+    return ivy.asarray(x, dtype=dtype, device=device)
+
+
 from . import nn
 from . import tensor
 from .tensor import *
@@ -5,10 +5,18 @@ from typing import Callable
 # local
 import ivy
 import ivy.functional.frontends.torch as torch_frontend
+from ivy.functional.ivy import data_type as _ivy_data_type
+
+
+_nest_types = (list, tuple, dict)
+_int64 = ivy.IntDtype("int64")
 
 
 def _from_ivy_array_to_torch_frontend_tensor(x, nested=False, include_derived=None):
     if nested:
+        # a single returned array does not need a nest traversal
+        if type(x) is ivy.Array:
+            return torch_frontend.Tensor(x, _init_overload=True)
         return ivy.nested_map(
             x, _from_ivy_array_to_torch_frontend_tensor, include_derived, shallow=False
         )
@@ -31,6 +39,51 @@ def _to_ivy_array(x):
     return x
 
 
+def _args_to_ivy_arrays(args):
+    # only the arguments which are nests need a traversal, the others are converted
+    # directly, which is the common case of tensors and python scalars
+    return [
+        ivy.nested_map(arg, _to_ivy_array, include_derived={tuple: True}, shallow=False)
+        if isinstance(arg, _nest_types)
+        else _to_ivy_array(arg)
+        for arg in args
+    ]
+
+
+def _is_array_arg(x):
+    return isinstance(x, (ivy.Array, ivy.NativeArray)) or hasattr(x, "ivy_array")
+
+
+def _set_frontend_default_dtypes():
+    """
+    Set the torch default int and float dtypes as the ivy ones, returning whether
+    they were set.
+
+    Nothing is set when an enclosing frontend call already set them. Otherwise the
+    dtypes are pushed on the ivy stacks directly, as the torch default dtype is
+    already validated by ``set_default_dtype``. Only jax needs the checks of
+    ``ivy.set_default_int_dtype`` and ``ivy.set_default_float_dtype``, for its x64
+    flag.
+    """
+    int_dtype_stack = _ivy_data_type.default_int_dtype_stack
+    float_dtype_stack = _ivy_data_type.default_float_dtype_stack
+    float_dtype = torch_frontend.get_default_dtype()
+    if (
+        int_dtype_stack
+        and float_dtype_stack
+        and int_dtype_stack[-1] == "int64"
+        and float_dtype_stack[-1] == float_dtype
+    ):
+        return False
+    if ivy.backend == "jax":
+        ivy.set_default_int_dtype("int64")
+        ivy.set_default_float_dtype(float_dtype)
+    else:
+        int_dtype_stack.append(_int64)
+        float_dtype_stack.append(ivy.FloatDtype(float_dtype))
+    return True
+
+
 def inputs_to_ivy_arrays(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def _inputs_to_ivy_arrays_torch(*args, **kwargs):
@@ -49,12 +102,8 @@ def inputs_to_ivy_arrays(fn: Callable) -> Callable:
                 "Out argument must be an ivy.frontends.torch.Tensor object"
             )
         # convert all input arrays to ivy.Array instances
-        new_args = ivy.nested_map(
-            args, _to_ivy_array, include_derived={tuple: True}, shallow=False
-        )
-        new_kwargs = ivy.nested_map(
-            kwargs, _to_ivy_array, include_derived={tuple: True}, shallow=False
-        )
+        new_args = _args_to_ivy_arrays(args)
+        new_kwargs = dict(zip(kwargs, _args_to_ivy_arrays(kwargs.values())))
         return fn(*new_args, **new_kwargs)
 
     return _inputs_to_ivy_arrays_torch
@@ -73,12 +122,8 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
         # ToDo: Remove this default dtype setting
         #  once frontend specific backend setting is added
         set_default_dtype = False
-        if not ("dtype" in kwargs and ivy.exists(kwargs["dtype"])) and all(
-            [not (ivy.is_array(i) or hasattr(i, "ivy_array")) for i in args]
-        ):
-            ivy.set_default_int_dtype("int64")
-            ivy.set_default_float_dtype(torch_frontend.get_default_dtype())
-            set_default_dtype = True
+        if kwargs.get("dtype") is None and not any(_is_array_arg(i) for i in args):
+            set_default_dtype = _set_frontend_default_dtypes()
         try:
             ret = fn(*args, **kwargs)
         finally:
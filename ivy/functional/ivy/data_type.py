@@ -1,7 +1,9 @@
 # global
 import ast
 import inspect
+import json
 import math
+import sys
 from numbers import Number
 from typing import Union, Tuple, List, Optional, Callable, Iterable, Any
 import numpy as np
@@ -78,6 +80,16 @@ def _lstrip_lines(source: str) -> str:
 
 # Get the list of function used the function
 def _get_function_list(func):
+    try:
+        hash(func)
+    except TypeError:
+        return _parse_function_list(func)
+    if func not in _FUNCTION_LISTS:
+        _FUNCTION_LISTS[func] = _parse_function_list(func)
+    return _FUNCTION_LISTS[func]
+
+
+def _parse_function_list(func):
     tree = ast.parse(_lstrip_lines(inspect.getsource(func)))
     names = {}
     # Extract all the call names
@@ -211,6 +223,49 @@ def _get_dtypes(fn, complement=True):
     return tuple(supported)
 
 
+# The supported and unsupported dtypes and devices of each queried function, indexed
+# by backend, backend version and frontend versions. Each entry is computed once, the
+# first time it is queried, and can be persisted with save_function_support_index.
+_SUPPORT_INDEX = dict()
+
+# The names called by each parsed function, shared by all the backends
+_FUNCTION_LISTS = dict()
+
+
+def _support_index_key():
+    frontends = sys.modules.get("ivy.functional.frontends")
+    return (
+        ivy.current_backend_str(),
+        str(getattr(current_backend(), "backend_version", {}).get("version")),
+        tuple(sorted(frontends.versions.items())) if frontends else (),
+    )
+
+
+def _support_fn_key(fn):
+    # functions with a stable qualified name are keyed by it, so that the wrapped and
+    # persisted variants share their entries
+    module = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    if isinstance(module, str) and isinstance(qualname, str) and "<" not in qualname:
+        return module + "." + qualname
+    return fn
+
+
+def _indexed_support(fn, query, recurse, compute):
+    key = (query, recurse, _support_fn_key(fn))
+    try:
+        hash(key)
+    except TypeError:
+        # unhashable callables, such as methods of unhashable instances
+        return compute()
+    index = _SUPPORT_INDEX.setdefault(_support_index_key(), dict())
+    if key not in index:
+        index[key] = compute()
+    ret = index[key]
+    # the dicts of devices and dtypes are mutable, so each query gets a copy
+    return dict(ret) if isinstance(ret, dict) else ret
+
+
 # Array API Standard #
 # -------------------#
 
@@ -1591,13 +1646,16 @@ def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
             "in a particular backend"
         ),
     )
-    supported_dtypes = set(_get_dtypes(fn, complement=False))
-    if recurse:
-        supported_dtypes = _nested_get(
-            fn, supported_dtypes, set.intersection, function_supported_dtypes
-        )
 
-    return tuple(supported_dtypes)
+    def _compute():
+        supported_dtypes = set(_get_dtypes(fn, complement=False))
+        if recurse:
+            supported_dtypes = _nested_get(
+                fn, supported_dtypes, set.intersection, function_supported_dtypes
+            )
+        return tuple(supported_dtypes)
+
+    return _indexed_support(fn, "supported_dtypes", recurse, _compute)
 
 
 @handle_nestable
@@ -1631,13 +1689,101 @@ def function_unsupported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
             "in a particular backend"
         ),
     )
-    unsupported_dtypes = set(_get_dtypes(fn, complement=True))
-    if recurse:
-        unsupported_dtypes = _nested_get(
-            fn, unsupported_dtypes, set.union, function_unsupported_dtypes
-        )
 
-    return tuple(unsupported_dtypes)
+    def _compute():
+        unsupported_dtypes = set(_get_dtypes(fn, complement=True))
+        if recurse:
+            unsupported_dtypes = _nested_get(
+                fn, unsupported_dtypes, set.union, function_unsupported_dtypes
+            )
+        return tuple(unsupported_dtypes)
+
+    return _indexed_support(fn, "unsupported_dtypes", recurse, _compute)
+
+
+@handle_exceptions
+def save_function_support_index(path: str, /) -> None:
+    """
+    Save the index of supported and unsupported dtypes and devices to a file.
+
+    The index holds every function_(un)supported_dtypes, function_(un)supported_devices
+    and function_(un)supported_devices_and_dtypes query answered so far, for each
+    backend, backend version and frontend versions. Only functions with a stable
+    qualified name are saved, together with the version of ivy.
+
+    Parameters
+    ----------
+    path
+        The path of the json file to write the index to.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> _ = ivy.function_unsupported_dtypes(ivy.acosh)
+    >>> ivy.save_function_support_index("/tmp/ivy_support_index.json")
+    """
+    indices = list()
+    for (backend, version, frontend_versions), index in _SUPPORT_INDEX.items():
+        entries = [
+            [query, recurse, fn_key, ret]
+            for (query, recurse, fn_key), ret in index.items()
+            if isinstance(fn_key, str)
+        ]
+        if entries:
+            indices.append(
+                {
+                    "backend": backend,
+                    "backend_version": version,
+                    "frontend_versions": frontend_versions,
+                    "entries": entries,
+                }
+            )
+    with open(path, "w") as f:
+        json.dump({"ivy_version": ivy.__version__, "indices": indices}, f)
+
+
+@handle_exceptions
+def load_function_support_index(path: str, /) -> bool:
+    """
+    Load an index of supported and unsupported dtypes and devices from a file.
+
+    The loaded entries answer the matching queries without parsing the functions,
+    for whichever backend and versions they were saved with.
+
+    Parameters
+    ----------
+    path
+        The path of a json file written by ivy.save_function_support_index.
+
+    Returns
+    -------
+    ret
+        Whether the index was loaded, which is ``False`` if it was saved with another
+        version of ivy.
+
+    Examples
+    --------
+    >>> ivy.load_function_support_index("/tmp/ivy_support_index.json")
+    True
+    """
+    with open(path) as f:
+        saved = json.load(f)
+    if saved["ivy_version"] != ivy.__version__:
+        return False
+    for saved_index in saved["indices"]:
+        index_key = (
+            saved_index["backend"],
+            saved_index["backend_version"],
+            tuple(tuple(v) for v in saved_index["frontend_versions"]),
+        )
+        index = _SUPPORT_INDEX.setdefault(index_key, dict())
+        for query, recurse, fn_key, ret in saved_index["entries"]:
+            if isinstance(ret, dict):
+                ret = {k: tuple(v) for k, v in ret.items()}
+            else:
+                ret = tuple(ret)
+            index[(query, recurse, fn_key)] = ret
+    return True
 
 
 @handle_exceptions
@@ -5,10 +5,13 @@ import os
 import gc
 import abc
 import math
+import time
 import psutil
+import tracemalloc
 import warnings
 import types
 from typing import Type, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 # noinspection PyUnresolvedReferences
 try:
@@ -42,6 +45,10 @@ default_device_stack = list()
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
+# (function, input shapes) -> (peak bytes per row, seconds per row)
+chunk_stats = dict()
+# below this estimated run time the remaining chunks are run sequentially
+_MIN_PARALLEL_SECONDS = 5e-3
 
 
 # Extra #
@@ -177,6 +184,13 @@ def get_all_ivy_arrays_on_dev(
     {139740789224448:ivy.array([1,0,2])},
     """
     device = ivy.as_ivy_dev(device)
+    if ivy.utils.array_registry.enabled:
+        all_arrays = [
+            x
+            for x in ivy.utils.array_registry.live_arrays(device=device)
+            if type(x) == ivy.data_classes.array.array.Array
+        ]
+        return ivy.Container(dict(zip([str(id(a)) for a in all_arrays], all_arrays)))
     all_arrays = list()
     for obj in gc.get_objects():
         if (
@@ -955,6 +969,180 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _nbytes(xs):
+    total = 0
+    for x in xs:
+        if isinstance(x, ivy.Container):
+            total += _nbytes(x.cont_to_flat_list())
+        elif isinstance(x, (tuple, list)):
+            total += _nbytes(x)
+        elif ivy.is_array(x):
+            total += math.prod(x.shape) * ivy.dtype_bits(x.dtype) // 8
+    return total
+
+
+def _measure_chunk(func, inps):
+    # numpy reports its allocations to tracemalloc, device memory which is not
+    # traced is estimated from the size of the chunk inputs and outputs
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        ret = func(*inps)
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        if not was_tracing:
+            tracemalloc.stop()
+    peak = max(peak, _nbytes(inps) + _nbytes([ret]))
+    return ret, peak, elapsed
+
+
+def _chunk_sizes(dim_size, chunk_size):
+    chunk_sizes = [chunk_size] * (dim_size // chunk_size)
+    if dim_size % chunk_size:
+        chunk_sizes.append(dim_size % chunk_size)
+    return chunk_sizes
+
+
+def _split_inputs(inputs, chunk_sizes, input_axes):
+    return [
+        (
+            ivy.split(
+                inp,
+                num_or_size_splits=chunk_sizes,
+                axis=input_axes[i],
+                with_remainder=True,
+            )
+            if ivy.is_array(inp)
+            else inp.split(
+                num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
+            )
+        )
+        for i, inp in enumerate(inputs)
+    ]
+
+
+def _map_chunks(func, chunks, num_workers, max_in_flight):
+    """Yield the returns of ``func`` for each chunk, in order."""
+    if num_workers <= 1:
+        for inps in chunks:
+            yield func(*inps)
+        return
+    with ThreadPoolExecutor(num_workers) as executor:
+        in_flight = list()
+        for inps in chunks:
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.pop(0).result()
+            in_flight.append(executor.submit(func, *inps))
+        for future in in_flight:
+            yield future.result()
+
+
+class _Unifier:
+    """
+    Unify the returns of the chunks, in order, into preallocated outputs.
+
+    Outputs of ``concat`` are written into an array allocated from the first chunk,
+    as long as each chunk returns as many rows as it was given, and ``sum`` and
+    ``mean`` accumulate inplace, the chunk means being weighted by the chunk sizes.
+    Containers, variables and backends without inplace support fall back to
+    concatenating and adding the returns.
+    """
+
+    def __init__(self, mode, chunk_sizes, output_axes, post_fn):
+        self._mode = mode
+        self._chunk_sizes = chunk_sizes
+        self._output_axes = output_axes
+        self._post_fn = post_fn
+        self._inplace = ivy.inplace_arrays_supported()
+        self._index = 0
+        self._outs = None
+        self._parts = dict()
+        self._offsets = dict()
+
+    def _can_preallocate(self, x):
+        return (
+            self._inplace
+            and ivy.is_array(x)
+            and not ivy.functional.ivy.gradients._is_variable(x, exclusive=True)
+        )
+
+    def add(self, ret):
+        ret = ret if isinstance(ret, tuple) else (ret,)
+        ret = [self._post_fn(r) for r in ret]
+        if self._mode == "mean":
+            # each chunk returns the mean over its rows
+            weight = self._chunk_sizes[self._index] / sum(self._chunk_sizes)
+            ret = [r * weight for r in ret]
+        if self._outs is None:
+            if isinstance(self._output_axes, int):
+                self._output_axes = [self._output_axes] * len(ret)
+            self._outs = [self._first(i, r) for i, r in enumerate(ret)]
+        else:
+            for i, r in enumerate(ret):
+                self._next(i, r)
+        self._index += 1
+
+    def _first(self, i, r):
+        if self._mode == "sum":
+            # the return may alias the inputs, so it is copied before accumulating
+            return ivy.copy_array(r) if self._can_preallocate(r) else r
+        if self._mode == "mean":
+            return r
+        axis = self._output_axes[i]
+        if not self._can_preallocate(r) or r.shape[axis] != self._chunk_sizes[0]:
+            self._parts[i] = [r]
+            return None
+        shape = list(r.shape)
+        shape[axis] = sum(self._chunk_sizes)
+        out = ivy.empty(shape, dtype=r.dtype, device=ivy.dev(r))
+        self._offsets[i] = 0
+        self._write(i, out, r)
+        return out
+
+    def _write(self, i, out, r):
+        axis = self._output_axes[i] % len(out.shape)
+        offset = self._offsets[i]
+        query = (slice(None),) * axis + (slice(offset, offset + r.shape[axis]),)
+        ivy.to_native(out)[query] = ivy.to_native(r)
+        self._offsets[i] = offset + r.shape[axis]
+
+    def _next(self, i, r):
+        out = self._outs[i]
+        if self._mode in ["sum", "mean"]:
+            if self._can_preallocate(out):
+                ivy.add(out, r, out=out)
+            else:
+                self._outs[i] = out + r
+            return
+        axis = self._output_axes[i]
+        if out is not None and r.shape[axis] == self._chunk_sizes[self._index]:
+            self._write(i, out, r)
+            return
+        if out is not None:
+            # the chunk returned a different number of rows, concatenate from here
+            written = (slice(None),) * (axis % len(out.shape)) + (
+                slice(0, self._offsets[i]),
+            )
+            self._parts[i] = [out[written]]
+            self._outs[i] = None
+        self._parts[i].append(r)
+
+    def result(self):
+        ret = list()
+        for i, out in enumerate(self._outs):
+            if out is None:
+                out = ivy.concat(self._parts[i], axis=self._output_axes[i])
+            ret.append(out)
+        if self._mode in ["sum", "mean"]:
+            return ret[0] if len(ret) == 1 else tuple(ret)
+        return ret[0] if len(ret) == 1 else ret
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -968,6 +1156,9 @@ def split_func_call(
     output_axes: Optional[Union[int, Iterable[int]]] = None,
     stop_gradients: bool = False,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    num_workers: int = 1,
+    max_in_flight: Optional[int] = None,
+    memory_budget: Optional[int] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
     Call a function by splitting its inputs along a given axis, and calling the function
@@ -998,6 +1189,21 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+    num_workers
+        The number of threads to call the function on. Backends such as numpy and
+        torch release the GIL in their kernels, so chunks then run in parallel.
+        Default is ``1``, which calls the function sequentially.
+    max_in_flight
+        The maximum number of chunks submitted to the threads and not yet unified,
+        which bounds the memory held by pending chunks. Default is twice
+        ``num_workers``.
+    memory_budget
+        The target peak memory in bytes of the chunks running at once. If specified
+        and ``chunk_size`` is not, the function is first called on a small chunk to
+        measure its peak memory and latency per row, and the remaining rows are split
+        into the largest chunks that fit the budget. The measurements are kept in
+        ``ivy.chunk_stats`` for later calls with the same function and input shapes.
+        Default is ``None``.
 
     Returns
     -------
@@ -1006,87 +1212,93 @@ def split_func_call(
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
-    if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
-        shape_key = "_".join([str(inp.shape) for inp in inputs])
-        if shape_key in max_chunk_sizes:
-            max_chunk_size = max_chunk_sizes[shape_key]
-        else:
-            max_chunk_size = 0
-        max_dim = max(
-            [inp.cont_shape[inp_ax] for inp, inp_ax in zip(inputs, input_axes)]
-        )
-        if max_dim > max_chunk_size:
-            max_chunk_sizes[shape_key] = max_dim
-            max_chunk_size = max_dim
-    chunk_size = ivy.default(
-        chunk_size,
-        default_val=lambda: 1
-        + int(
-            round((max_chunk_size - 1) * ivy.split_factor(ivy.default_device(device)))
-        ),
-        with_callable=True,
-    )
     dim_size = inputs[0].shape[input_axes[0]]
-    if chunk_size >= dim_size:
-        return func(*inputs)
-    num_chunks = dim_size / chunk_size
-    num_chunks_floored = math.floor(num_chunks)
-    num_chunks_ceiled = math.ceil(num_chunks)
-    chunk_sizes = [chunk_size] * num_chunks_floored
-    if num_chunks != num_chunks_floored:
-        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
-    inputs_split = [
-        (
-            ivy.split(
-                inp,
-                num_or_size_splits=chunk_sizes,
-                axis=input_axes[i],
-                with_remainder=True,
-            )
-            if ivy.is_array(inp)
-            else inp.split(
-                num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
+    shape_key = "_".join([str(inp.shape) for inp in inputs])
+    ivy.utils.assertions.check_greater(
+        num_workers, 1, allow_equal=True, message="num_workers must be at least 1"
+    )
+    max_in_flight = ivy.default(max_in_flight, 2 * num_workers)
+    ivy.utils.assertions.check_greater(
+        max_in_flight, 1, allow_equal=True, message="max_in_flight must be at least 1"
+    )
+    first_ret = None
+    if ivy.exists(memory_budget) and not ivy.exists(chunk_size):
+        stats_key = (getattr(func, "__code__", func), shape_key)
+        if stats_key in chunk_stats:
+            bytes_per_row, seconds_per_row = chunk_stats[stats_key]
+            first_sizes = []
+        else:
+            probe_size = max(1, dim_size // 8)
+            first_sizes = (
+                [probe_size, dim_size - probe_size]
+                if probe_size < dim_size
+                else [dim_size]
             )
+            first_inputs = [
+                x[0] for x in _split_inputs(inputs, first_sizes, input_axes)
+            ]
+            first_ret, peak, elapsed = _measure_chunk(func, first_inputs)
+            bytes_per_row, seconds_per_row = peak / probe_size, elapsed / probe_size
+            chunk_stats[stats_key] = (bytes_per_row, seconds_per_row)
+            first_sizes = first_sizes[:1]
+        remaining = dim_size - sum(first_sizes)
+        if remaining * seconds_per_row < _MIN_PARALLEL_SECONDS:
+            num_workers = 1
+        concurrent = min(num_workers, max_in_flight)
+        chunk_size = int(memory_budget // max(bytes_per_row * concurrent, 1))
+        if num_workers > 1:
+            # at least one chunk per worker
+            chunk_size = min(chunk_size, math.ceil(remaining / num_workers))
+        chunk_size = min(max(chunk_size, 1), max(remaining, 1))
+        chunk_sizes = first_sizes + (
+            _chunk_sizes(remaining, chunk_size) if remaining else []
         )
-        for i, inp in enumerate(inputs)
-    ]
-    is_mean = mode == "mean"
-    is_sum = mode == "sum"
-    post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
-    if is_mean or is_sum:
-        sums = None
-        for inps in zip(*inputs_split):
-            if not sums:
-                sums = func(*inps)
-                sums = (
-                    [post_fn(s) for s in sums]
-                    if isinstance(sums, tuple)
-                    else [post_fn(sums)]
-                )
+        if len(chunk_sizes) == 1 and first_ret is not None:
+            return first_ret
+    else:
+        if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
+            if shape_key in max_chunk_sizes:
+                max_chunk_size = max_chunk_sizes[shape_key]
             else:
-                ret = func(*inps)
-                if isinstance(ret, tuple):
-                    for i, r in enumerate(ret):
-                        sums[i] = sums[i] + post_fn(r)
-                else:
-                    sums[0] = sums[0] + post_fn(ret)
-        sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
-        return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
-    rets = [
-        tuple([post_fn(r) for r in ret]) if isinstance(ret, tuple) else (post_fn(ret),)
-        for ret in rets
-    ]
-    num_outputs = len(rets[0])
-    if output_axes is None:
-        output_axes = [input_axes[0]] * num_outputs
-    elif isinstance(output_axes, int):
-        output_axes = [output_axes] * num_outputs
-    ret = [
-        ivy.concat([r[i] for r in rets], axis=output_axes[i])
-        for i in range(num_outputs)
-    ]
-    return ret[0] if len(ret) == 1 else ret
+                max_chunk_size = 0
+            max_dim = max(
+                [
+                    (inp.shape if ivy.is_array(inp) else inp.cont_shape)[inp_ax]
+                    for inp, inp_ax in zip(inputs, input_axes)
+                ]
+            )
+            if max_dim > max_chunk_size:
+                max_chunk_sizes[shape_key] = max_dim
+                max_chunk_size = max_dim
+        chunk_size = ivy.default(
+            chunk_size,
+            default_val=lambda: 1
+            + int(
+                round(
+                    (max_chunk_size - 1) * ivy.split_factor(ivy.default_device(device))
+                )
+            ),
+            with_callable=True,
+        )
+        if chunk_size >= dim_size:
+            return func(*inputs)
+        chunk_sizes = _chunk_sizes(dim_size, chunk_size)
+    inputs_split = _split_inputs(inputs, chunk_sizes, input_axes)
+    chunks = zip(*inputs_split)
+    if first_ret is not None:
+        # the probe chunk has already been computed
+        next(chunks)
+    unifier = _Unifier(
+        mode,
+        chunk_sizes,
+        ivy.default(output_axes, input_axes[0]),
+        ivy.stop_gradient if stop_gradients else lambda x: x,
+    )
+    if first_ret is not None:
+        unifier.add(first_ret)
+    for ret in _map_chunks(func, chunks, num_workers, max_in_flight):
+        unifier.add(ret)
+    return unifier.result()
 
 
 def _is_valid_devices_attributes(fn: Callable) -> bool:
@@ -1174,14 +1386,18 @@ def function_supported_devices(fn: Callable, recurse: bool = True) -> Tuple:
             "exist in a particular backend"
         ),
     )
-    supported_devices = set(_get_devices(fn, complement=False))
 
-    if recurse:
-        supported_devices = ivy.functional.data_type._nested_get(
-            fn, supported_devices, set.intersection, function_supported_devices
-        )
+    def _compute():
+        supported_devices = set(_get_devices(fn, complement=False))
+        if recurse:
+            supported_devices = ivy.functional.data_type._nested_get(
+                fn, supported_devices, set.intersection, function_supported_devices
+            )
+        return tuple(supported_devices)
 
-    return tuple(supported_devices)
+    return ivy.functional.data_type._indexed_support(
+        fn, "supported_devices", recurse, _compute
+    )
 
 
 @handle_nestable
@@ -1215,14 +1431,18 @@ def function_unsupported_devices(fn: Callable, recurse: bool = True) -> Tuple:
             "exist in a particular backend"
         ),
     )
-    unsupported_devices = set(_get_devices(fn, complement=True))
 
-    if recurse:
-        unsupported_devices = ivy.functional.data_type._nested_get(
-            fn, unsupported_devices, set.union, function_unsupported_devices
-        )
+    def _compute():
+        unsupported_devices = set(_get_devices(fn, complement=True))
+        if recurse:
+            unsupported_devices = ivy.functional.data_type._nested_get(
+                fn, unsupported_devices, set.union, function_unsupported_devices
+            )
+        return tuple(unsupported_devices)
 
-    return tuple(unsupported_devices)
+    return ivy.functional.data_type._indexed_support(
+        fn, "unsupported_devices", recurse, _compute
+    )
 
 
 # Profiler #
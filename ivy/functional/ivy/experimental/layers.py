@@ -1625,9 +1625,10 @@ def _padding_ceil_mode(w, f, p, s, return_added_padding=False):
         input_size = w + sum(p)
         # making sure that the remaining pixels are supposed
         # to be covered by the window
-        # they won't be covered if stride is big enough to skip them
-        if input_size - remaining_pixels - (f - 1) + s > input_size:
-            return p
+        # they won't be covered if the extra window would start past the input,
+        # in the right padding only
+        if input_size - remaining_pixels - f + s >= w + p[0]:
+            return (p, added_padding) if return_added_padding else p
         output_shape = _output_ceil_shape(
             w,
             f,
@@ -1,6 +1,9 @@
+# global
+from typing import Optional, Union
+
 # local
 import ivy
-from ivy.func_wrapper import inputs_to_native_arrays
+from ivy.func_wrapper import inputs_to_native_arrays, to_native_arrays_and_back
 from ivy.utils.exceptions import handle_exceptions
 
 
@@ -247,6 +250,26 @@ def _verify_bsc_components(
     )
 
 
+def _expand_compressed_indices(compressed_indices):
+    # the row (or column) of every element of compressed row (or column) indices
+    counts = compressed_indices[1:] - compressed_indices[:-1]
+    return ivy.repeat(ivy.arange(counts.shape[0], dtype="int64"), counts)
+
+
+def _verify_sparse_dense_matmul(x, y):
+    ivy.utils.assertions.check_equal(
+        len(x.dense_shape), 2, message="only 2D sparse arrays can be multiplied"
+    )
+    ivy.utils.assertions.check_true(
+        len(y.shape) in (1, 2), message="the dense operand must be 1D or 2D"
+    )
+    ivy.utils.assertions.check_equal(
+        y.shape[0],
+        x.dense_shape[1],
+        message="the sparse and dense operands are not aligned",
+    )
+
+
 def _is_data_not_indices_values_and_shape(
     data=None,
     coo_indices=None,
@@ -375,23 +398,11 @@ class SparseArray:
                     crow_indices, col_indices, values, dense_shape, format
                 )
             else:
-                print(format)
                 self._init_compressed_column_components(
                     ccol_indices, row_indices, values, dense_shape, format
                 )
 
         else:
-            print(
-                format,
-                ccol_indices,
-                row_indices,
-                values,
-                dense_shape,
-                crow_indices,
-                col_indices,
-                values,
-            )
-
             raise ivy.utils.exceptions.IvyException(
                 "specify all coo components (coo_indices, values and "
                 " dense_shape), all csr components (crow_indices, "
@@ -547,6 +558,10 @@ class SparseArray:
     def dense_shape(self):
         return self._dense_shape
 
+    @property
+    def format(self):
+        return self._format
+
     # Setters #
     # --------#
 
@@ -657,99 +672,152 @@ class SparseArray:
     # Instance Methods #
     # ---------------- #
 
-    def _coo_to_dense_coordinates(self):
-        all_coordinates = []
-        for i in range(self._values.shape[0]):
-            coordinate = ivy.gather(self._coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (self._coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
-        return all_coordinates
-
-    def _csr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._col_indices.to_list()
-        all_cols = self._crow_indices.to_list()
-        for row in range(total_rows):
-            cols = all_rows[all_cols[row] : all_cols[row + 1]]
-            for col in cols:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
-    def _csc_to_dense_coordinates(self):
-        # CSC sparse array
-        all_coordinates = []
-        total_rows = self._dense_shape[1]
-        all_cols = self._row_indices.to_list()
-        all_rows = self._ccol_indices.to_list()
-        for col in range(total_rows):
-            rows = all_cols[all_rows[col] : all_rows[col + 1]]
-            for row in rows:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
-    def _bsr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._crow_indices.to_list()
-        all_cols = self._col_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
-
-        for row in range(total_rows // nblockrows):
-            cols = all_cols[all_rows[row] : all_rows[row + 1]]
-            for col in cols:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
-
-    def _bsc_to_dense_coordinates(self):
-        all_coordinates = []
-        total_cols = self._dense_shape[1]
-        all_rows = self._row_indices.to_list()
-        all_cols = self._ccol_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
-
-        for col in range(total_cols // nblockcols):
-            rows = all_rows[all_cols[col] : all_cols[col + 1]]
-            for row in rows:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
-
-    def to_dense_array(self, *, native=False):
+    def _coo_components(self):
+        # the coordinates of the elements, shaped (ndim, nnz), and their values
         if self._format == "coo":
-            all_coordinates = self._coo_to_dense_coordinates()
-        elif self._format == "csr":
-            all_coordinates = self._csr_to_dense_coordinates()
-        elif self._format == "csc":
-            all_coordinates = self._csc_to_dense_coordinates()
-        elif self._format == "bsc":
-            all_coordinates = self._bsc_to_dense_coordinates()
+            return self._coo_indices, self._values
+        if self._format in ("csr", "bsr"):
+            rows = _expand_compressed_indices(self._crow_indices)
+            cols = self._col_indices
         else:
-            all_coordinates = self._bsr_to_dense_coordinates()
+            rows = self._row_indices
+            cols = _expand_compressed_indices(self._ccol_indices)
+        if self._format in ("bsr", "bsc"):
+            # every block expands to its elements, in the order of the block values
+            nblocks, nblockrows, nblockcols = self._values.shape
+            block_shape = (nblocks, nblockrows, nblockcols)
+            rows = ivy.reshape(rows * nblockrows, (-1, 1, 1)) + ivy.reshape(
+                ivy.arange(nblockrows, dtype="int64"), (1, -1, 1)
+            )
+            cols = ivy.reshape(cols * nblockcols, (-1, 1, 1)) + ivy.reshape(
+                ivy.arange(nblockcols, dtype="int64"), (1, 1, -1)
+            )
+            rows = ivy.reshape(ivy.broadcast_to(rows, block_shape), (-1,))
+            cols = ivy.reshape(ivy.broadcast_to(cols, block_shape), (-1,))
+        return ivy.stack([rows, cols]), ivy.reshape(self._values, (-1,))
+
+    def _compressed_components(self, axis):
+        # the components compressed along axis, 0 for csr and 1 for csc
+        if axis == 0 and self._format == "csr":
+            return self._crow_indices, self._col_indices, self._values
+        if axis == 1 and self._format == "csc":
+            return self._ccol_indices, self._row_indices, self._values
+        ivy.utils.assertions.check_equal(
+            len(self._dense_shape),
+            2,
+            message="only 2D sparse arrays can be compressed",
+        )
+        indices, values = self._coo_components()
+        major, minor = indices[axis], indices[1 - axis]
+        num_major, num_minor = self._dense_shape[axis], self._dense_shape[1 - axis]
+        order = ivy.argsort(major * num_minor + minor, stable=True)
+        major = ivy.gather(major, order, axis=0)
+        compressed = ivy.searchsorted(
+            major, ivy.arange(num_major + 1, dtype="int64"), ret_dtype="int64"
+        )
+        return (
+            compressed,
+            ivy.gather(minor, order, axis=0),
+            ivy.gather(values, order, axis=0),
+        )
+
+    def _with_values(self, values):
+        # a sparse array of the same indices and format, with the given values
+        if self._format == "coo":
+            return SparseArray(
+                coo_indices=self._coo_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format=self._format,
+            )
+        if self._format in ("csr", "bsr"):
+            return SparseArray(
+                crow_indices=self._crow_indices,
+                col_indices=self._col_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format=self._format,
+            )
+        return SparseArray(
+            ccol_indices=self._ccol_indices,
+            row_indices=self._row_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+            format=self._format,
+        )
 
-        # make dense array
+    def to_dense_array(self, *, native=False):
+        indices, values = self._coo_components()
         ret = ivy.scatter_nd(
-            ivy.array(all_coordinates),
-            ivy.flatten(self._values),
+            ivy.permute_dims(indices, axes=(1, 0)),
+            values,
             ivy.array(self._dense_shape),
         )
         return ret.to_native() if native else ret
 
+    def to_coo(self):
+        indices, values = self._coo_components()
+        return SparseArray(
+            coo_indices=indices,
+            values=values,
+            dense_shape=self._dense_shape,
+            format="coo",
+        )
+
+    def to_csr(self):
+        crow_indices, col_indices, values = self._compressed_components(0)
+        return SparseArray(
+            crow_indices=crow_indices,
+            col_indices=col_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+            format="csr",
+        )
+
+    def to_csc(self):
+        ccol_indices, row_indices, values = self._compressed_components(1)
+        return SparseArray(
+            ccol_indices=ccol_indices,
+            row_indices=row_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+            format="csc",
+        )
+
+    def matmul(self, other):
+        return ivy.sparse_dense_matmul(self, other)
+
+    def multiply(self, other):
+        if not ivy.is_array(other):
+            return self._with_values(ivy.multiply(self._values, other))
+        # only the elements stored in self can be nonzero in the product
+        indices, values = self._coo_components()
+        other = ivy.broadcast_to(other, tuple(self._dense_shape))
+        other = ivy.gather_nd(other, ivy.permute_dims(indices, axes=(1, 0)))
+        values = ivy.reshape(ivy.multiply(values, other), self._values.shape)
+        return self._with_values(values)
+
+    def add(self, other):
+        return ivy.add(self.to_dense_array(), other)
+
+    def sum(self, *, axis=None):
+        return ivy.sparse_sum(self, axis=axis)
+
+    def __matmul__(self, other):
+        return self.matmul(other)
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    def __rmul__(self, other):
+        return self.multiply(other)
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __radd__(self, other):
+        return self.add(other)
+
 
 class NativeSparseArray:
     pass
@@ -795,3 +863,85 @@ def native_sparse_array(
 @handle_exceptions
 def native_sparse_array_to_indices_values_and_shape(x):
     return ivy.current_backend().native_sparse_array_to_indices_values_and_shape(x)
+
+
+@to_native_arrays_and_back
+@handle_exceptions
+def sparse_dense_matmul(
+    x: SparseArray, y: Union[ivy.Array, ivy.NativeArray], /
+) -> ivy.Array:
+    """
+    Multiply a 2D sparse array with a dense matrix or vector.
+
+    Parameters
+    ----------
+    x
+        The 2D sparse array, of any format.
+    y
+        The dense matrix or vector, with as many rows as ``x`` has columns.
+
+    Returns
+    -------
+    ret
+        The dense product of ``x`` and ``y``.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(crow_indices=[0, 1, 3], col_indices=[1, 0, 1],
+    ...                     values=[2., 3., 4.], dense_shape=[2, 2], format="csr")
+    >>> ivy.sparse_dense_matmul(x, ivy.array([1., 10.]))
+    ivy.array([20., 43.])
+    """
+    _verify_sparse_dense_matmul(x, y)
+    indices, values = x._coo_components()
+    if len(y.shape) == 2:
+        values = ivy.expand_dims(values, axis=-1)
+    products = ivy.multiply(values, ivy.gather(y, indices[1], axis=0))
+    shape = (x.dense_shape[0],) + tuple(y.shape[1:])
+    return ivy.scatter_nd(
+        ivy.expand_dims(indices[0], axis=-1),
+        products,
+        reduction="sum",
+        out=ivy.zeros(shape, dtype=products.dtype),
+    )
+
+
+@to_native_arrays_and_back
+@handle_exceptions
+def sparse_sum(x: SparseArray, /, *, axis: Optional[int] = None) -> ivy.Array:
+    """
+    Sum the elements of a sparse array, over all of them or along one axis.
+
+    Parameters
+    ----------
+    x
+        The sparse array, which must be 2D to sum along an axis.
+    axis
+        The axis to sum along, ``1`` for the sums of the rows. Default is ``None``,
+        which sums all the elements.
+
+    Returns
+    -------
+    ret
+        The dense sums, of the dtype of the values of ``x``.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(coo_indices=[[0, 1, 1], [1, 0, 1]], values=[2, 3, 4],
+    ...                     dense_shape=[3, 2], format="coo")
+    >>> ivy.sparse_sum(x, axis=1)
+    ivy.array([2, 7, 0])
+    """
+    indices, values = x._coo_components()
+    if axis is None:
+        return ivy.sum(values, dtype=values.dtype)
+    ivy.utils.assertions.check_equal(
+        len(x.dense_shape), 2, message="only 2D sparse arrays can be summed by axis"
+    )
+    axis = axis % 2
+    return ivy.scatter_nd(
+        ivy.expand_dims(indices[1 - axis], axis=-1),
+        values,
+        reduction="sum",
+        out=ivy.zeros((x.dense_shape[1 - axis],), dtype=values.dtype),
+    )
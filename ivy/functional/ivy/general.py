@@ -4,6 +4,9 @@
 import gc
 import inspect
 import math
+import threading
+import weakref
+from collections import OrderedDict
 from functools import wraps
 from numbers import Number
 from typing import (
@@ -48,6 +51,7 @@ queue_timeout_stack = list()
 array_mode_stack = list()
 shape_array_mode_stack = list()
 nestable_mode_stack = list()
+array_registry_mode_stack = list()
 exception_trace_mode_stack = list()
 trace_mode_dict = dict()
 trace_mode_dict["frontend"] = "ivy/functional/frontends"
@@ -386,6 +390,87 @@ def get_array_mode() -> bool:
     return array_mode_stack[-1]
 
 
+@handle_exceptions
+def set_array_registry_mode(mode: bool) -> None:
+    """
+    Set the mode of whether to keep a weak registry of the live ivy.Array and
+    ivy.Container instances, indexed by backend and device.
+
+    While the registry is enabled, the memory queries such as
+    ``ivy.get_all_arrays_in_memory`` and the dynamic backend conversion of
+    ``ivy.set_backend`` only visit the registered instances, instead of scanning every
+    object tracked by the garbage collector. Enabling the registry registers the
+    instances which are already alive.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to keep the registry of live arrays
+
+    Examples
+    --------
+    >>> ivy.set_array_registry_mode(True)
+    >>> ivy.get_array_registry_mode()
+    True
+
+    >>> ivy.set_array_registry_mode(False)
+    >>> ivy.get_array_registry_mode()
+    False
+    """
+    global array_registry_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    array_registry_mode_stack.append(mode)
+    if mode:
+        ivy.utils.array_registry.enable()
+    else:
+        ivy.utils.array_registry.disable()
+
+
+@handle_exceptions
+def unset_array_registry_mode() -> None:
+    """
+    Reset the mode of keeping a registry of the live ivy.Array and ivy.Container
+    instances to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_array_registry_mode(True)
+    >>> ivy.get_array_registry_mode()
+    True
+
+    >>> ivy.unset_array_registry_mode()
+    >>> ivy.get_array_registry_mode()
+    False
+    """
+    global array_registry_mode_stack
+    if array_registry_mode_stack:
+        array_registry_mode_stack.pop(-1)
+    if get_array_registry_mode():
+        ivy.utils.array_registry.enable()
+    else:
+        ivy.utils.array_registry.disable()
+
+
+@handle_exceptions
+def get_array_registry_mode() -> bool:
+    """
+    Get the current state of array_registry_mode.
+
+    Examples
+    --------
+    >>> ivy.get_array_registry_mode()
+    False
+
+    >>> ivy.set_array_registry_mode(True)
+    >>> ivy.get_array_registry_mode()
+    True
+    """
+    global array_registry_mode_stack
+    if not array_registry_mode_stack:
+        return False
+    return array_registry_mode_stack[-1]
+
+
 @handle_exceptions
 def set_nestable_mode(mode: bool) -> None:
     """
@@ -1690,23 +1775,157 @@ def match_kwargs(
     return split_kwargs
 
 
+class _IdentityKey:
+    """Cache key for an array, equal only to keys of the very same live object."""
+
+    __slots__ = ("ref", "version", "_hash")
+
+    def __init__(self, obj, referents):
+        try:
+            # a weak reference does not keep the array alive, and a dead reference
+            # is never equal to the key of a new array reusing its id
+            self.ref = weakref.ref(obj)
+            referents.append(obj)
+        except TypeError:
+            self.ref = lambda: obj
+        data = obj.data if isinstance(obj, ivy.Array) else obj
+        # backends which count in-place updates, such as torch, invalidate the key
+        self.version = getattr(data, "_version", None)
+        self._hash = hash((id(obj), self.version))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, _IdentityKey):
+            return False
+        obj = self.ref()
+        return obj is not None and obj is other.ref() and self.version == other.version
+
+
+def _cache_key(arg, array_key, referents):
+    if isinstance(arg, ivy.Array) or ivy.is_native_array(arg):
+        if array_key == "shape_dtype":
+            return "array", tuple(arg.shape), str(arg.dtype)
+        return _IdentityKey(arg, referents)
+    if isinstance(arg, dict):
+        return tuple(
+            (k, _cache_key(v, array_key, referents)) for k, v in sorted(arg.items())
+        )
+    if isinstance(arg, (list, tuple)):
+        return type(arg).__name__, tuple(
+            _cache_key(a, array_key, referents) for a in arg
+        )
+    # the type keeps equal values of different types, such as 1, 1.0 and True, apart
+    try:
+        hash(arg)
+    except TypeError:
+        return type(arg), str(arg)
+    return type(arg), arg
+
+
+_DEFAULT_CACHE_SIZE = 128
+
+
+class _FnCache:
+    """Least-recently-used store of the outputs of one cached function."""
+
+    def __init__(self, max_size=_DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # keys of collected arrays, queued by their finalizers and removed on the
+        # next access rather than from the garbage collector
+        self._dead_keys = list()
+
+    def _purge(self):
+        while self._dead_keys:
+            self._entries.pop(self._dead_keys.pop(), None)
+
+    def discard(self, key):
+        self._dead_keys.append(key)
+
+    def get(self, key):
+        with self._lock:
+            self._purge()
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self._lock:
+            self._purge()
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while self.max_size is not None and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def info(self):
+        with self._lock:
+            self._purge()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
 @handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def cache_fn(
+    func: Optional[Callable] = None,
+    /,
+    *,
+    max_size: Optional[int] = _DEFAULT_CACHE_SIZE,
+    array_key: Literal["identity", "shape_dtype"] = "identity",
+) -> Callable:
     """
     Cache function outputs.
 
     A decorator to wrap a function, such that computed outputs are cached to avoid
-    recalculating them later.
+    recalculating them later. The outputs are kept in a least-recently-used cache per
+    function, which is shared by all the wrappers of that function.
 
     Parameters
     ----------
     func
-        The function to wrap, whose output should be cached for later.
+        The function to wrap, whose output should be cached for later. If ``None``,
+        a decorator taking the function is returned instead.
+    max_size
+        The maximum number of outputs to cache for the function, evicting the least
+        recently used one when exceeded. ``None`` is for no limit. The cache is
+        shared by all the wrappers of the function, and takes the max_size of the
+        latest one. Default is ``128``.
+    array_key
+        How array arguments are keyed. ``"identity"`` only matches the very same
+        array object, and also its version for backends which count in-place
+        updates, such as torch. The arrays are referenced weakly, and their outputs
+        are dropped from the cache once they are garbage collected. On backends
+        without such a version, such as numpy, updating an array in place returns
+        the output cached before the update. ``"shape_dtype"`` matches any array
+        with the same shape and data type. Default is ``"identity"``. Other
+        arguments are keyed by type and value, falling back to their string for
+        unhashable ones.
 
     Returns
     -------
     ret
-        The newly cache wrapped function.
+        The newly cache wrapped function. Its ``cache_info()`` method returns a dict
+        of the hits, misses, evictions, size and max_size of the cache, and its
+        ``cache_clear()`` method empties the cache and resets these statistics.
 
     Examples
     --------
@@ -1746,25 +1965,44 @@ def cache_fn(func: Callable) -> Callable:
 
     >>> print(cached_line_eq(5)) # Output is re-computed
     10
+
+
+    With a bounded cache:
+
+    >>> @ivy.cache_fn(max_size=2)
+    ... def square(x): return x * x
+    >>> for x in [1, 2, 1, 3]:
+    ...     _ = square(x)
+    >>> print(square.cache_info())
+    {'hits': 1, 'misses': 3, 'evictions': 1, 'size': 2, 'max_size': 2}
     """
+    if func is None:
+        return lambda f: cache_fn(f, max_size=max_size, array_key=array_key)
     global FN_CACHE
     if func not in FN_CACHE:
-        FN_CACHE[func] = dict()
+        FN_CACHE[func] = _FnCache(max_size)
+    else:
+        FN_CACHE[func].max_size = max_size
+    cache = FN_CACHE[func]
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            [str(i) + ", " for i in args]
-            + [" kw, "]
-            + [str(i) + ", " for i in sorted(kwargs.items())]
+        referents = list()
+        key = (
+            _cache_key(args, array_key, referents),
+            _cache_key(kwargs, array_key, referents) if kwargs else None,
         )
-        cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
+        found, ret = cache.get(key)
+        if found:
+            return ret
         ret = func(*args, **kwargs)
-        cache[key] = ret
+        cache.put(key, ret)
+        for referent in referents:
+            weakref.finalize(referent, cache.discard, key)
         return ret
 
+    cached_fn.cache_info = cache.info
+    cached_fn.cache_clear = cache.clear
     return cached_fn
 
 
@@ -2302,6 +2540,14 @@ def get_all_arrays_in_memory() -> List[Union[ivy.Array, ivy.NativeArray]]:
     >>> x
     [ivy.array([0, 1, 2])]
     """
+    if ivy.utils.array_registry.enabled:
+        if ivy.current_backend_str() in ["", "numpy"]:
+            return ivy.utils.array_registry.live_arrays()
+        all_arrays = dict()
+        for x in ivy.utils.array_registry.live_arrays():
+            if ivy.is_native_array(x.data):
+                all_arrays[id(x.data)] = x.data
+        return list(all_arrays.values())
     all_arrays = list()
     for obj in gc.get_objects():
         try:
@@ -3649,18 +3895,21 @@ def function_supported_devices_and_dtypes(fn: Callable, recurse: bool = True) ->
             "attributes cannot both exist in a particular backend"
         ),
     )
-    supported_devices_dtype = _get_devices_and_dtypes(fn, complement=False)
-
-    if recurse:
-        supported_devices_dtype = ivy.functional.data_type._nested_get(
-            fn,
-            _all_dnd_combinations(),
-            _dnd_dict_intersection,
-            function_supported_devices_and_dtypes,
-            wrapper=lambda x: x,
-        )
 
-    return supported_devices_dtype
+    def _compute():
+        if recurse:
+            return ivy.functional.data_type._nested_get(
+                fn,
+                _all_dnd_combinations(),
+                _dnd_dict_intersection,
+                function_supported_devices_and_dtypes,
+                wrapper=lambda x: x,
+            )
+        return _get_devices_and_dtypes(fn, complement=False)
+
+    return ivy.functional.data_type._indexed_support(
+        fn, "supported_devices_and_dtypes", recurse, _compute
+    )
 
 
 @handle_nestable
@@ -3690,18 +3939,21 @@ def function_unsupported_devices_and_dtypes(fn: Callable, recurse: bool = True)
             "attributes cannot both exist in a particular backend"
         ),
     )
-    unsupported_devices_dtype = _get_devices_and_dtypes(fn, complement=True)
-
-    if recurse:
-        unsupported_devices_dtype = ivy.functional.data_type._nested_get(
-            fn,
-            {},
-            _dnd_dict_union,
-            function_unsupported_devices_and_dtypes,
-            wrapper=lambda x: x,
-        )
 
-    return unsupported_devices_dtype
+    def _compute():
+        if recurse:
+            return ivy.functional.data_type._nested_get(
+                fn,
+                {},
+                _dnd_dict_union,
+                function_unsupported_devices_and_dtypes,
+                wrapper=lambda x: x,
+            )
+        return _get_devices_and_dtypes(fn, complement=True)
+
+    return ivy.functional.data_type._indexed_support(
+        fn, "unsupported_devices_and_dtypes", recurse, _compute
+    )
 
 
 @handle_exceptions
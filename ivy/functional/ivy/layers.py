@@ -360,11 +360,17 @@ def scaled_dot_product_attention(
     /,
     *,
     mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    is_causal: bool = False,
+    chunk_size: Optional[int] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
     Apply scaled dot product attention to inputs x using optional mask.
 
+    When ``chunk_size`` is given, the keys and values are processed in blocks of
+    ``chunk_size`` keys with a running maximum and sum for the softmax, so that only
+    a *[batch_shape,num_queries,chunk_size]* block of similarities exists at a time.
+
     Parameters
     ----------
     q
@@ -384,7 +390,14 @@ def scaled_dot_product_attention(
         The scale float value is used to scale the query-key pairs before softmax.
     mask
         The mask input array. The mask to apply to the query-key values. Default is
-        None. The shape of mask input should be in *[batch_shape,num_queries,num_keys]*.
+        None. The shape of mask input should be in *[batch_shape,num_queries,num_keys]*,
+        or any shape that broadcasts to it.
+    is_causal
+        Whether to only let query i attend to keys 0 to i. The causal mask is built
+        block by block and never materialized in full. Default is ``False``.
+    chunk_size
+        The number of keys to process at a time. Default is ``None``, in which case
+        all keys are processed at once.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -536,16 +549,18 @@ def scaled_dot_product_attention(
                     [4.3, 5.3]]])
     }
     """
+    if ivy.exists(chunk_size):
+        return _chunked_scaled_dot_product_attention(
+            q, k, v, scale, mask, is_causal, chunk_size, out
+        )
+
     # BS x Q x K
     sim = ivy.einsum("... q f, ... k f -> ... q k", q, k) * scale
 
-    if ivy.exists(mask):
+    keep = _attention_keep(mask, is_causal, q.shape[-2], 0, k.shape[-2])
+    if ivy.exists(keep):
         # BS x Q x K
-        sim = ivy.where(
-            ivy.logical_not(mask),
-            -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
-            sim,
-        )
+        sim = ivy.where(keep, sim, -ivy.finfo(ivy.dtype(sim)).max)
 
     # BS x Q x K
     attn = ivy.softmax(sim, axis=-1)
@@ -575,6 +590,8 @@ def multi_head_attention(
     to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    is_causal: bool = False,
+    chunk_size: Optional[int] = None,
     out: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
@@ -608,6 +625,11 @@ def multi_head_attention(
         The variables for function to_kv_fn. Default is ``None``.
     to_out_v
         The variables for function to_out_fn. Default is ``None``.
+    is_causal
+        Whether to only let query i attend to keys 0 to i. Default is ``False``.
+    chunk_size
+        The number of keys to process at a time in the scaled dot-product attention.
+        Default is ``None``, in which case all keys are processed at once.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -770,12 +792,14 @@ def multi_head_attention(
 
     q, k, v = map(call_einops, (q, k, v))
 
-    # BS x H x Q x K
+    # BS x 1 x Q x K, broadcast across the heads
     if ivy.exists(mask):
-        mask = ivy.einops_repeat(mask, "... q k -> ... h q k", h=num_heads)
+        mask = ivy.expand_dims(mask, axis=-3)
 
     # BS x H x Q x F
-    sdpa = ivy.scaled_dot_product_attention(q, k, v, scale, mask=mask)
+    sdpa = ivy.scaled_dot_product_attention(
+        q, k, v, scale, mask=mask, is_causal=is_causal, chunk_size=chunk_size
+    )
 
     # BS x Q x (HxF)
     sdpa = ivy.einops_rearrange(sdpa, "... h q f -> ... q (h f)")
@@ -1902,6 +1926,10 @@ def lstm_update(
     """
     Perform long-short term memory update by unrolling time dimension of input array.
 
+    The gates are ordered as input, forget, cell and output gates, along the last
+    axis of the kernels. Backends may compute the whole sequence with a native
+    recurrent kernel.
+
     Parameters
     ----------
     x
@@ -1930,18 +1958,16 @@ def lstm_update(
     batch_shape = x_shape[:-2]
     timesteps = x_shape[-2]
     input_channels = x_shape[-1]
+    output_channels = init_h.shape[-1]
     x_flat = ivy.reshape(x, (-1, input_channels))
 
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
-    )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
-
-    # recurrent kernel
-    Wh = recurrent_kernel
+    # input kernel, applied to all timesteps at once, with both biases folded in
+    Wi_x = ivy.matmul(x_flat, kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+    Wi_x = ivy.reshape(Wi_x, batch_shape + [timesteps, -1])
 
     # lstm states
     ht = init_h
@@ -1950,38 +1976,79 @@ def lstm_update(
     # lstm outputs
     hts_list = list()
 
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
+    # unrolled time dimension with lstm steps, computing all four gates with one
+    # matmul and one sigmoid, the cell gate being recomputed with tanh
+    for Wi_xt in ivy.unstack(Wi_x, axis=-2):
+        gates = Wi_xt + ivy.matmul(ht, recurrent_kernel)
+        it, ft, _, ot = ivy.split(ivy.sigmoid(gates), num_or_size_splits=4, axis=-1)
+        gt = ivy.tanh(gates[..., 2 * output_channels : 3 * output_channels])
+        ct = ft * ct + it * gt
         ht = ot * ivy.tanh(ct)
+        hts_list.append(ht)
+
+    return ivy.stack(hts_list, axis=-2), ct
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
 
-    return ivy.concat(hts_list, axis=-2), ct
+lstm_update.mixed_function = True
 
 
 # Helpers #
 
 
+def _attention_keep(mask, is_causal, num_queries, start, end):
+    # boolean array broadcastable to BS x Q x (end - start), True for the keys
+    # start to end which each query may attend to, or None if all of them
+    keep = None
+    if ivy.exists(mask):
+        if mask.shape[-1] != 1:
+            mask = mask[..., start:end]
+        keep = ivy.astype(mask, ivy.bool, copy=False)
+    if is_causal:
+        # Q x (end - start)
+        causal = ivy.greater_equal(
+            ivy.expand_dims(ivy.arange(num_queries), axis=-1), ivy.arange(start, end)
+        )
+        keep = causal if keep is None else ivy.logical_and(keep, causal)
+    return keep
+
+
+def _chunked_scaled_dot_product_attention(
+    q, k, v, scale, mask, is_causal, chunk_size, out
+):
+    # online softmax over blocks of keys, rescaling the running sum and output
+    # whenever a block raises the running maximum
+    num_queries, num_keys = q.shape[-2], k.shape[-2]
+    running_max = running_sum = ret = None
+    for start in range(0, num_keys, chunk_size):
+        end = min(start + chunk_size, num_keys)
+
+        # BS x Q x C
+        sim = ivy.einsum("... q f, ... k f -> ... q k", q, k[..., start:end, :]) * scale
+        keep = _attention_keep(mask, is_causal, num_queries, start, end)
+        if ivy.exists(keep):
+            sim = ivy.where(keep, sim, -ivy.finfo(ivy.dtype(sim)).max)
+
+        # BS x Q x 1
+        chunk_max = ivy.max(sim, axis=-1, keepdims=True)
+        if running_max is not None:
+            chunk_max = ivy.maximum(running_max, chunk_max)
+        weights = ivy.exp(sim - chunk_max)
+
+        # BS x Q x F
+        chunk_ret = ivy.einsum(
+            "... q k, ... k f -> ... q f", weights, v[..., start:end, :]
+        )
+        chunk_sum = ivy.sum(weights, axis=-1, keepdims=True)
+        if running_max is None:
+            ret, running_sum = chunk_ret, chunk_sum
+        else:
+            correction = ivy.exp(running_max - chunk_max)
+            ret = ret * correction + chunk_ret
+            running_sum = running_sum * correction + chunk_sum
+        running_max = chunk_max
+    return ivy.divide(ret, running_sum, out=out)
+
+
 def _handle_padding(x, strides, filters, padding):
     if padding == "SAME":
         if x % strides == 0:
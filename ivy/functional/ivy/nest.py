@@ -2,6 +2,7 @@
 
 # global
 from builtins import map as _map
+from itertools import islice
 from typing import Callable, Any, Union, List, Tuple, Optional, Dict, Iterable, Sequence
 import copy
 from collections import UserDict
@@ -692,6 +693,22 @@ def nested_argwhere(
         ['c', 0]
     ]
     """
+    if (
+        _index is None
+        and not check_nests
+        and to_ignore is None
+        and extra_nest_types is None
+    ):
+        leaves, treedef = _tree_flatten(nest, _all_derived)
+        if treedef.is_leaf:
+            return [[]] if fn(nest) else False
+        _indices = list()
+        for path, leaf in zip(treedef.paths, leaves):
+            if fn(leaf):
+                _indices.append(list(path))
+                if len(_indices) == stop_after_n_found:
+                    break
+        return _indices
     to_ignore = ivy.default(to_ignore, ())
     extra_nest_types = ivy.default(extra_nest_types, ())
     _index = list() if _index is None else _index
@@ -739,7 +756,7 @@ def nested_argwhere(
                     break
             else:
                 _indices += [ind]
-            if stop_after_n_found is not None and len(_indices) >= stop_after_n_found:
+            if stop_after_n_found is not None and n >= stop_after_n_found:
                 break
         _indices = [idx for idxs in _indices if idxs for idx in idxs]
         if check_nests and fn(nest):
@@ -1056,6 +1073,23 @@ def nested_map(
         x following the applicable of fn to it's nested leaves, or x itself if x is not
         nested.
     """
+    if (
+        _depth == 0
+        and to_ignore is None
+        and extra_nest_types is None
+        and max_depth is None
+        and not to_mutable
+        and _tuple_check_fn is None
+        and _list_check_fn is None
+        and _dict_check_fn is None
+    ):
+        leaves, treedef = _tree_flatten(x, _derived_flags(include_derived))
+        # the fields of slices are mapped too, which the traversal below handles
+        if not any(isinstance(leaf, slice) for leaf in leaves):
+            leaves = [fn(leaf) for leaf in leaves]
+            if shallow and treedef.mutable:
+                return _update_nest(treedef._node, x, iter(leaves))
+            return treedef.unflatten(leaves)
     to_ignore = ivy.default(to_ignore, ())
     extra_nest_types = ivy.default(extra_nest_types, ())
     if include_derived is True:
@@ -1211,6 +1245,9 @@ def nested_any(
     ret
         A boolean, whether the function evaluates to true for any leaf node.
     """
+    if _base and not check_nests and extra_nest_types is None:
+        leaves = _tree_flatten(nest, _all_derived)[0]
+        return any(fn(leaf) for leaf in leaves)
     extra_nest_types = ivy.default(extra_nest_types, ())
     if isinstance(nest, (tuple, list)) or isinstance(nest, extra_nest_types):
         if isinstance(nest, (ivy.Array, ivy.NativeArray)):
@@ -1290,6 +1327,9 @@ def copy_nest(
     >>> print(copied_nest)
     {'first': [23.0, 24.0, 25], 'second': [46.0, 48.0, 50]}
     """
+    if not to_mutable and extra_nest_types is None:
+        leaves, treedef = _tree_flatten(nest, _derived_flags(include_derived))
+        return treedef.unflatten(leaves)
     extra_nest_types = ivy.default(extra_nest_types, ())
     class_instance = type(nest)
     check_fn = (
@@ -1565,3 +1605,244 @@ def prune_empty(nest):
     if not valid and not (ivy.is_array(nest) or isinstance(nest, (int, float, str))):
         return None
     return nest
+
+
+# Tree Flattening #
+# ----------------#
+
+# structure node -> TreeDef, so that nests of the same structure share one treedef
+_treedefs = dict()
+_max_treedefs = 4096
+_all_derived = (True, True, True)
+_none_derived = (False, False, False)
+
+
+def _derived_flags(include_derived):
+    if include_derived is True:
+        return _all_derived
+    if not include_derived:
+        return _none_derived
+    return (
+        bool(include_derived.get(tuple, False)),
+        bool(include_derived.get(list, False)),
+        bool(include_derived.get(dict, False)),
+    )
+
+
+def _flatten(x, leaves, derived):
+    # returns the structure node of x, None for a leaf, and appends its leaves
+    cls = type(x)
+    if cls is tuple or (derived[0] and isinstance(x, tuple)):
+        return (cls, len(x), tuple([_flatten(v, leaves, derived) for v in x]))
+    if cls is list or (derived[1] and isinstance(x, list)):
+        return (cls, len(x), tuple([_flatten(v, leaves, derived) for v in x]))
+    if cls is dict or (derived[2] and isinstance(x, dict)) or isinstance(x, UserDict):
+        # the key types keep equal keys such as 1, 1.0 and True in distinct nodes
+        return (
+            cls,
+            (tuple(x), tuple([type(k) for k in x])),
+            tuple([_flatten(v, leaves, derived) for v in x.values()]),
+        )
+    leaves.append(x)
+    return None
+
+
+def _dict_keys(keys):
+    return keys[0]
+
+
+def _tree_flatten(nest, derived):
+    leaves = list()
+    node = _flatten(nest, leaves, derived)
+    treedef = _treedefs.get(node)
+    if treedef is None:
+        if len(_treedefs) >= _max_treedefs:
+            # nests of ever changing structures, such as lists of any length
+            _treedefs.clear()
+        treedef = _treedefs.setdefault(node, TreeDef(node, len(leaves)))
+    return leaves, treedef
+
+
+def _builder(node):
+    # returns a function building the nest of node from an iterator over its leaves
+    if node is None:
+        return next
+    cls, keys, children = node
+    if not isinstance(keys, int):
+        keys = _dict_keys(keys)
+    if all(child is None for child in children):
+        num = len(children)
+        if cls is tuple:
+            return lambda it: tuple(islice(it, num))
+        if cls is list:
+            return lambda it: list(islice(it, num))
+        if cls is dict:
+            return lambda it: dict(zip(keys, it))
+    builders = [_builder(child) for child in children]
+    if issubclass(cls, tuple):
+        if cls is tuple:
+            return lambda it: tuple([b(it) for b in builders])
+        if hasattr(cls, "_fields"):
+            return lambda it: cls(*[b(it) for b in builders])
+        return lambda it: cls([b(it) for b in builders])
+    if issubclass(cls, list):
+        if cls is list:
+            return lambda it: [b(it) for b in builders]
+        return lambda it: cls([b(it) for b in builders])
+    if cls is dict:
+        return lambda it: {k: b(it) for k, b in zip(keys, builders)}
+    return lambda it: cls({k: b(it) for k, b in zip(keys, builders)})
+
+
+def _paths(node, path, paths):
+    if node is None:
+        paths.append(path)
+        return
+    cls, keys, children = node
+    keys = range(keys) if isinstance(keys, int) else _dict_keys(keys)
+    for key, child in zip(keys, children):
+        _paths(child, path + (key,), paths)
+
+
+def _is_mutable(node):
+    return node is not None and (
+        not issubclass(node[0], tuple) or any(_is_mutable(c) for c in node[2])
+    )
+
+
+def _update_nest(node, x, it):
+    # like the builder of node, but updates the lists and dicts of x inplace
+    if node is None:
+        return next(it)
+    cls, keys, children = node
+    if issubclass(cls, tuple):
+        values = [_update_nest(c, v, it) for c, v in zip(children, x)]
+        return cls(*values) if hasattr(cls, "_fields") else cls(values)
+    if issubclass(cls, list):
+        x[:] = [_update_nest(c, v, it) for c, v in zip(children, x)]
+        return x
+    x.update({k: _update_nest(c, x[k], it) for k, c in zip(_dict_keys(keys), children)})
+    return x
+
+
+class TreeDef:
+    """
+    The structure of a nest, as returned by :func:`ivy.tree_flatten`.
+
+    Treedefs are cached by structure, nests with the same structure share a treedef,
+    so the function rebuilding the nest from its leaves is only built once.
+    """
+
+    __slots__ = ("_node", "num_leaves", "mutable", "_build", "_paths", "__weakref__")
+
+    def __init__(self, node, num_leaves):
+        self._node = node
+        self.num_leaves = num_leaves
+        # whether the nest has lists or dicts, which can be updated inplace
+        self.mutable = _is_mutable(node)
+        self._build = _builder(node)
+        self._paths = None
+
+    @property
+    def is_leaf(self):
+        """Whether the nest is a single leaf."""
+        return self._node is None
+
+    @property
+    def paths(self):
+        """The nest indices of the leaves, in the order of the flattened leaves."""
+        if self._paths is None:
+            paths = list()
+            _paths(self._node, (), paths)
+            self._paths = tuple(paths)
+        return self._paths
+
+    def unflatten(self, leaves):
+        """Build the nest of this structure from its leaves."""
+        if len(leaves) != self.num_leaves:
+            raise ivy.utils.exceptions.IvyException(
+                "expected {} leaves, but got {}".format(self.num_leaves, len(leaves))
+            )
+        return self._build(iter(leaves))
+
+    def __repr__(self):
+        return "TreeDef({})".format(_node_repr(self._node))
+
+
+def _node_repr(node):
+    if node is None:
+        return "*"
+    cls, keys, children = node
+    children = [_node_repr(c) for c in children]
+    if isinstance(keys, int):
+        return "{}[{}]".format(cls.__name__, ", ".join(children))
+    return "{}{{{}}}".format(
+        cls.__name__,
+        ", ".join("{!r}: {}".format(k, c) for k, c in zip(_dict_keys(keys), children)),
+    )
+
+
+@handle_exceptions
+def tree_flatten(
+    nest: Any,
+    /,
+    *,
+    include_derived: Optional[Union[Dict[type, bool], bool]] = None,
+) -> Tuple[List, TreeDef]:
+    """
+    Flatten a nest into its leaves, and the structure to rebuild it from them.
+
+    The lists, tuples and dicts of the nest are traversed, everything else is a leaf.
+    The structure is cached, nests of the same structure return the same treedef.
+
+    Parameters
+    ----------
+    nest
+        The nest to flatten.
+    include_derived
+        Whether to also traverse classes derived from tuple, list and dict, either
+        for all of them or as a dict from each of these types to a bool.
+        Default is ``False``.
+
+    Returns
+    -------
+    ret
+        The leaves of the nest in depth first order, and its treedef.
+
+    Examples
+    --------
+    >>> leaves, treedef = ivy.tree_flatten({"a": [1, 2], "b": (3,)})
+    >>> print(leaves)
+    [1, 2, 3]
+    >>> print(treedef)
+    TreeDef(dict{'a': list[*, *], 'b': tuple[*]})
+    >>> ivy.tree_unflatten(treedef, [4, 5, 6])
+    {'a': [4, 5], 'b': (6,)}
+    """
+    return _tree_flatten(nest, _derived_flags(include_derived))
+
+
+@handle_exceptions
+def tree_unflatten(treedef: TreeDef, leaves: Sequence, /) -> Any:
+    """
+    Build a nest from the treedef returned by :func:`ivy.tree_flatten` and leaves.
+
+    Parameters
+    ----------
+    treedef
+        The structure of the nest.
+    leaves
+        The leaves of the nest, in depth first order.
+
+    Returns
+    -------
+    ret
+        The nest of the given structure, with the given leaves.
+
+    Examples
+    --------
+    >>> leaves, treedef = ivy.tree_flatten([ivy.array([1.]), (2, 3)])
+    >>> ivy.tree_unflatten(treedef, [x * 2 for x in leaves])
+    [ivy.array([2.]), (4, 6)]
+    """
+    return treedef.unflatten(leaves)
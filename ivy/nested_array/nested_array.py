@@ -1,124 +1,320 @@
 # global
 import abc
 from typing import List
+import numpy as np
 
 # local
 import ivy
 
 
+def _offsets_from_counts(counts):
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def _to_numpy_indices(x):
+    return np.asarray(ivy.to_numpy(x) if ivy.is_array(x) else x, dtype=np.int64)
+
+
 class NestedArray(abc.ABC):
-    """Base class for nested array objects."""
+    """
+    Base class for nested array objects.
 
-    def __init__(self, data, dtype, device, internal=False):
+    The rows are packed into one flat buffer of values. The shape of every row is
+    kept next to the buffer, along with the offset of every row in it. Elementwise
+    operations and per row reductions therefore run on the whole buffer at once,
+    and indexing a row returns a view into the buffer.
+    """
+
+    def __init__(self, values, row_shapes, internal=False):
         if not internal:
             raise RuntimeError(
                 "NestedArray is an abstract class "
                 "and should not be instantiated directly."
                 "Please use one of the factory methods instead"
             )
-        self._data = data
+        # the elements of all the rows, flattened and concatenated
+        self._values = values
+        # the shapes of the rows, one row of shape per row of self
+        self._row_shapes = row_shapes
+        self._offsets = _offsets_from_counts(np.prod(row_shapes, axis=1))
         self._shape = self._generate_shape()
-        self._dtype = dtype
-        self._device = device
+        self._row_ids = None
         self._pre_repr = "ivy."
 
     @classmethod
     def nested_array(cls, data, dtype=None, device=None):
-        dtype = ivy.default_dtype(dtype=dtype, item=data)
-        device = ivy.default_device(device, item=data)
-        if ivy.is_ivy_array(data):
-            data = [data]
-        elif isinstance(data, (list, tuple)):
-            data = ivy.to_ivy(data)
-        elif ivy.is_native_array(data):
-            data = [ivy.to_ivy(data)]
-        elif isinstance(data, cls):
-            data = data._data
+        if isinstance(data, NestedArray):
+            values = data._values
+            row_shapes = data._row_shapes
         else:
-            raise TypeError(
-                "Input data must be ivy.Array, ivy.NativeArray"
-                " or a list of either, got: {}".format(type(data))
-            )
-        for i in range(len(data)):
-            data[i] = ivy.astype(data[i], dtype)
-            data[i] = ivy.to_device(data[i], device)
-        return cls(data, dtype, device, internal=True)
+            if ivy.is_array(data):
+                rows = [data]
+            elif isinstance(data, (list, tuple)):
+                rows = [row if ivy.is_array(row) else ivy.asarray(row) for row in data]
+            else:
+                raise TypeError(
+                    "Input data must be ivy.Array, ivy.NativeArray"
+                    " or a list of either, got: {}".format(type(data))
+                )
+            ndims = set(len(row.shape) for row in rows)
+            if len(ndims) != 1:
+                raise RuntimeError(
+                    "All arrays in a nested array must have the same number of"
+                    " dimensions."
+                )
+            row_shapes = np.array(
+                [tuple(row.shape) for row in rows], dtype=np.int64
+            ).reshape(len(rows), ndims.pop())
+            if len(rows) and (row_shapes[:, 1:] == row_shapes[0, 1:]).all():
+                # rows of the same inner shape are concatenated without flattening
+                values = ivy.reshape(ivy.concat(rows, axis=0), (-1,))
+            else:
+                values = ivy.concat([ivy.reshape(row, (-1,)) for row in rows], axis=0)
+        # inferred from the packed values, rather than from every row
+        dtype = ivy.default_dtype(dtype=dtype, item=values)
+        device = ivy.default_device(device, item=values)
+        values = ivy.to_device(ivy.astype(values, dtype), device)
+        return cls(values, row_shapes, internal=True)
 
     @classmethod
     def from_row_lengths(cls, values, row_lengths):
-        ivy_arrays = list()
-        for i in range(len(row_lengths)):
-            ivy_arrays.append(values[: row_lengths[i]])
-            values = values[row_lengths[i] :]
-        return cls.nested_array(ivy_arrays)
+        values = values if ivy.is_array(values) else ivy.asarray(values)
+        row_lengths = _to_numpy_indices(row_lengths)
+        inner_shape = tuple(values.shape[1:])
+        row_shapes = np.empty((len(row_lengths), 1 + len(inner_shape)), dtype=np.int64)
+        row_shapes[:, 0] = row_lengths
+        row_shapes[:, 1:] = inner_shape
+        values = values[: int(row_lengths.sum())]
+        return cls(ivy.reshape(values, (-1,)), row_shapes, internal=True)
 
     @classmethod
     def from_row_split(cls, values, row_split):
-        row_lengths = list()
-        for i in range(1, len(row_split)):
-            row_lengths.append(row_split[i] - row_split[i - 1])
+        return cls.from_row_lengths(values, np.diff(_to_numpy_indices(row_split)))
+
+    @classmethod
+    def from_padded(cls, padded, row_lengths):
+        """
+        Build a nested array from the leading ``row_lengths`` entries of the rows of
+        a padded array, which is the inverse of :meth:`to_padded`.
+
+        Parameters
+        ----------
+        padded
+            The padded array, of shape ``(num_rows, max_length, *inner_shape)``.
+        row_lengths
+            The length of every row.
+
+        Returns
+        -------
+        ret
+            The nested array of the unpadded rows.
+        """
+        padded = padded if ivy.is_array(padded) else ivy.asarray(padded)
+        row_lengths = _to_numpy_indices(row_lengths)
+        mask = np.arange(padded.shape[1]) < row_lengths[:, None]
+        values = ivy.gather_nd(padded, ivy.asarray(np.argwhere(mask)))
         return cls.from_row_lengths(values, row_lengths)
 
     def _generate_shape(
         self,
     ):
-        final_shape = [len(self._data)]
-        shapes = list()
-        ndims = list()
-        for arr in self._data:
-            shapes.append(arr.shape)
-            ndims.append(arr.ndim)
-        if ndims.count(ndims[0]) != len(ndims):
-            raise RuntimeError(
-                "All arrays in a nested array must have the same number of dimensions."
-            )
-        for i in range(ndims[0]):
-            same_shape = True
-            current_shape = shapes[0][i]
-            for j in range(final_shape[0]):
-                if shapes[j][i] != current_shape:
-                    same_shape = False
-                    break
-            if same_shape:
-                final_shape.append(current_shape)
-            else:
-                final_shape.append(None)
+        final_shape = [len(self._row_shapes)]
+        for dim in self._row_shapes.T:
+            same_shape = len(dim) and (dim == dim[0]).all()
+            final_shape.append(int(dim[0]) if same_shape else None)
         return final_shape
 
+    def _with_values(self, values):
+        return self.__class__(values, self._row_shapes, internal=True)
+
+    def _full(self, shape, fill_value):
+        if ivy.is_float_dtype(self.dtype):
+            fill_value = float(fill_value)
+        return ivy.full(shape, fill_value, dtype=self.dtype, device=self.device)
+
+    def _element_row_ids(self):
+        # the row of every element of the values, computed on first use
+        if self._row_ids is None:
+            self._row_ids = np.repeat(
+                np.arange(len(self._row_shapes)), np.diff(self._offsets)
+            )
+        return self._row_ids
+
+    def _row(self, index):
+        start, stop = int(self._offsets[index]), int(self._offsets[index + 1])
+        return ivy.reshape(self._values[start:stop], tuple(self._row_shapes[index]))
+
     def unbind(self):
-        return tuple(self._data)
+        return tuple(self._row(i) for i in range(len(self._row_shapes)))
 
     def reshape(self, shape):
         assert shape[0] == self._shape[0], "batch dimension is not changeable"
-        for i in range(0, shape[0]):
-            new_shape = list()
-            for j in range(1, len(shape)):
-                if shape[j] == -1:
-                    new_shape.append(self._data[i].shape[j - 1])
-                else:
-                    new_shape.append(shape[j])
-            self._data[i] = self._data[i].reshape(new_shape)
-            print(self._data[i].shape)
+        row_shapes = np.empty((len(self._row_shapes), len(shape) - 1), dtype=np.int64)
+        for j in range(1, len(shape)):
+            # -1 keeps the size of the rows along that dimension
+            if shape[j] == -1:
+                row_shapes[:, j - 1] = self._row_shapes[:, j - 1]
+            else:
+                row_shapes[:, j - 1] = shape[j]
+        if not np.array_equal(np.prod(row_shapes, axis=1), np.diff(self._offsets)):
+            raise ivy.utils.exceptions.IvyException(
+                "cannot reshape the rows of shape {} to {}".format(self._shape, shape)
+            )
+        self._row_shapes = row_shapes
         self._shape = self._generate_shape()
         return self
 
+    def to_padded(self, pad_value=0):
+        """
+        Stack the rows into one dense array, padding them to the largest row size
+        along every dimension.
+
+        Parameters
+        ----------
+        pad_value
+            The value of the padding. Default is ``0``.
+
+        Returns
+        -------
+        ret
+            The padded array, of shape ``(num_rows, *max_row_shape)``.
+        """
+        row_ids = self._element_row_ids()
+        row_shapes = self._row_shapes[row_ids]
+        # the position of every element within its row, unravelled by the row shape
+        position = np.arange(len(row_ids)) - self._offsets[row_ids]
+        indices = np.empty((len(row_ids), 1 + row_shapes.shape[1]), dtype=np.int64)
+        indices[:, 0] = row_ids
+        for dim in reversed(range(row_shapes.shape[1])):
+            position, indices[:, dim + 1] = np.divmod(position, row_shapes[:, dim])
+        shape = (len(self._row_shapes),) + tuple(
+            int(d) for d in self._row_shapes.max(axis=0, initial=0)
+        )
+        ret = self._full(shape, pad_value)
+        return ivy.scatter_nd(
+            ivy.asarray(indices), self._values, reduction="replace", out=ret
+        )
+
+    # Reductions #
+    # -----------#
+
+    def _segment_reduce(self, reduction, initial):
+        ret = self._full((len(self._row_shapes),), initial)
+        return ivy.scatter_nd(
+            ivy.asarray(self._element_row_ids()[:, None]),
+            self._values,
+            reduction=reduction,
+            out=ret,
+        )
+
+    def row_sum(self):
+        """Sum the elements of every row."""
+        return self._segment_reduce("sum", 0)
+
+    def row_mean(self):
+        """Average the elements of every row, which is nan for empty rows."""
+        return ivy.divide(self.row_sum(), ivy.asarray(np.diff(self._offsets)))
+
+    def row_max(self):
+        """Maximum of the elements of every row, the lowest value for empty rows."""
+        if ivy.is_float_dtype(self.dtype):
+            return self._segment_reduce("max", -float("inf"))
+        return self._segment_reduce("max", ivy.iinfo(self.dtype).min)
+
+    def row_min(self):
+        """Minimum of the elements of every row, the highest value for empty rows."""
+        if ivy.is_float_dtype(self.dtype):
+            return self._segment_reduce("min", float("inf"))
+        return self._segment_reduce("min", ivy.iinfo(self.dtype).max)
+
+    # Elementwise #
+    # ------------#
+
+    def _elementwise(self, fn, other):
+        if isinstance(other, NestedArray):
+            if not np.array_equal(self._row_shapes, other._row_shapes):
+                raise ivy.utils.exceptions.IvyException(
+                    "nested arrays of shapes {} and {} do not have the same"
+                    " rows".format(self._shape, other._shape)
+                )
+            other = other._values
+        elif ivy.is_array(other) and len(other.shape):
+            raise ivy.utils.exceptions.IvyException(
+                "nested arrays only support elementwise operations with scalars and"
+                " nested arrays of the same rows"
+            )
+        return self._with_values(fn(self._values, other))
+
+    def astype(self, dtype):
+        return self._with_values(ivy.astype(self._values, dtype))
+
+    def __add__(self, other):
+        return self._elementwise(ivy.add, other)
+
+    def __radd__(self, other):
+        return self._elementwise(lambda x, y: ivy.add(y, x), other)
+
+    def __sub__(self, other):
+        return self._elementwise(ivy.subtract, other)
+
+    def __rsub__(self, other):
+        return self._elementwise(lambda x, y: ivy.subtract(y, x), other)
+
+    def __mul__(self, other):
+        return self._elementwise(ivy.multiply, other)
+
+    def __rmul__(self, other):
+        return self._elementwise(lambda x, y: ivy.multiply(y, x), other)
+
+    def __truediv__(self, other):
+        return self._elementwise(ivy.divide, other)
+
+    def __rtruediv__(self, other):
+        return self._elementwise(lambda x, y: ivy.divide(y, x), other)
+
+    def __pow__(self, other):
+        return self._elementwise(ivy.pow, other)
+
+    def __neg__(self):
+        return self._with_values(ivy.negative(self._values))
+
+    def __abs__(self):
+        return self._with_values(ivy.abs(self._values))
+
     # Properties #
     # ---------- #
 
     @property
-    def data(self) -> ivy.NativeArray:
-        """The native array being wrapped in self."""
-        return self._data
+    def data(self) -> List[ivy.Array]:
+        """The rows of self, as views into its values."""
+        return list(self.unbind())
+
+    @property
+    def values(self) -> ivy.Array:
+        """The flattened elements of all the rows, one row after the other."""
+        return self._values
+
+    @property
+    def row_offsets(self) -> ivy.Array:
+        """The offset of every row in the values, followed by their total size."""
+        return ivy.asarray(self._offsets)
+
+    @property
+    def row_lengths(self) -> ivy.Array:
+        """The size of every row along its first dimension."""
+        return ivy.asarray(self._row_shapes[:, 0])
 
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements."""
-        return self._dtype
+        return ivy.dtype(self._values)
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
-        return self._device
+        return ivy.dev(self._values)
 
     @property
     def shape(self) -> List:
@@ -133,12 +329,32 @@ class NestedArray(abc.ABC):
     # Built-ins #
     # ----------#
 
+    def __len__(self):
+        return len(self._row_shapes)
+
     def __repr__(self):
+        rows = self.unbind()
         arrays_repr = "\t"
         for i in range(self._shape[0] - 1):
-            arrays_repr += repr(self._data[i]) + "\n\t"
-        arrays_repr += repr(self._data[-1])
+            arrays_repr += repr(rows[i]) + "\n\t"
+        arrays_repr += repr(rows[-1])
         return self._pre_repr + self.__class__.__name__ + "([\n" + arrays_repr + "\n])"
 
     def __getitem__(self, query):
-        return self._data[query]
+        num_rows = len(self._row_shapes)
+        if isinstance(query, slice):
+            start, stop, step = query.indices(num_rows)
+            if step == 1:
+                # contiguous rows are a view into the values
+                stop = max(start, stop)
+                return self.__class__(
+                    self._values[int(self._offsets[start]) : int(self._offsets[stop])],
+                    self._row_shapes[start:stop],
+                    internal=True,
+                )
+            return self.nested_array([self._row(i) for i in range(start, stop, step)])
+        if query < 0:
+            query += num_rows
+        if not 0 <= query < num_rows:
+            raise IndexError("nested array index out of range")
+        return self._row(query)
@@ -199,6 +199,7 @@ class MultiHeadAttention(Module):
         with_to_q_fn=True,
         with_to_kv_fn=True,
         with_to_out_fn=True,
+        chunk_size=None,
         device=None,
         v=None,
         build_mode="on_init",
@@ -234,6 +235,10 @@ class MultiHeadAttention(Module):
             Whether to include fully connected mapping from output scaled dot-product
             attention to final output.
             Default is ``True``.
+        chunk_size
+            The number of keys to process at a time in the scaled dot-product
+            attention, bounding its memory by the chunk rather than the number of
+            keys. Default is ``None``, in which case all keys are processed at once.
         device
             device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. Default is cpu.
@@ -259,6 +264,7 @@ class MultiHeadAttention(Module):
         self._with_to_q_fn = with_to_q_fn
         self._with_to_kv_fn = with_to_kv_fn
         self._with_to_out_fn = with_to_out_fn
+        self._chunk_size = chunk_size
         ivy.Module.__init__(
             self,
             device=device,
@@ -312,7 +318,7 @@ class MultiHeadAttention(Module):
         else:
             return {}
 
-    def _forward(self, inputs, context=None, mask=None):
+    def _forward(self, inputs, context=None, mask=None, is_causal=False):
         """
         Perform forward pass of the MultiHeadAttention layer.
 
@@ -325,6 +331,8 @@ class MultiHeadAttention(Module):
             *[batch_shape,num_values,cont_feats]*.
         mask
             (Default value = None)
+        is_causal
+            Whether to only let query i attend to keys 0 to i. Default is ``False``.
 
         Returns
         -------
@@ -347,6 +355,8 @@ class MultiHeadAttention(Module):
             to_q_v=self.v.to_q if self._with_to_q_fn else None,
             to_kv_v=self.v.to_kv if self._with_to_kv_fn else None,
             to_out_v=self.v.to_out if self._with_to_out_fn else None,
+            is_causal=is_causal,
+            chunk_size=self._chunk_size,
         )
 
 
@@ -109,11 +109,9 @@ class Module(ModuleConverters, ModuleHelpers):
         self._track_submod_call_order = False
         self.expected_submod_rets = None
         self.submod_dict = dict()
-        with ivy.utils.backend.ContextManager("numpy") as backend:
-            self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
-            self.submod_call_order = ivy.Container(
-                alphabetical_keys=False, ivyh=backend
-            )
+        # created lazily, only when submodules are actually tracked
+        self._submod_rets = None
+        self._submod_call_order = None
         self._sub_mods = set()
         self._dtype = dtype
         self._args = args
@@ -493,11 +491,10 @@ class Module(ModuleConverters, ModuleHelpers):
             v = v if v else self.v
             return self._module_graph(*args, v=v, **kwargs)
 
-        with ivy.utils.backend.ContextManager("numpy") as backend:
-            self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
-            self.submod_call_order = ivy.Container(
-                alphabetical_keys=False, ivyh=backend
-            )
+        # reset the tracked submodule returns and call order, the containers are
+        # only created again if they are accessed
+        self._submod_rets = None
+        self._submod_call_order = None
         self._set_submod_flags(
             track_submod_rets,
             submod_depth,
@@ -512,7 +509,7 @@ class Module(ModuleConverters, ModuleHelpers):
         self._unset_submod_flags()
         return ret
 
-    def save_weights(self, weights_path, /):
+    def save_weights(self, weights_path, /, *, flat=False):
         """
         Save the weights on the Module.
 
@@ -520,13 +517,45 @@ class Module(ModuleConverters, ModuleHelpers):
         ----------
         weights_path
             The hdf5 file for saving the weights.
+        flat
+            Whether to save the weights in the flat format of
+            ``ivy.Container.cont_to_disk_as_flat`` instead of hdf5, which can be
+            memory mapped when loading. Default is ``False``.
 
         Returns
         -------
         None
         """
         os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        if flat:
+            self.v.cont_to_disk_as_flat(weights_path)
+        else:
+            self.v.cont_to_disk_as_hdf5(weights_path)
+
+    def load_weights(self, weights_path, /, *, flat=False, mmap=True):
+        """
+        Load the weights saved with ``save_weights`` onto the Module.
+
+        Parameters
+        ----------
+        weights_path
+            The file the weights were saved to.
+        flat
+            Whether the weights were saved in the flat format rather than hdf5.
+            Default is ``False``.
+        mmap
+            Whether to memory map the weights of a flat file, so that they are only
+            read from disk when accessed. Default is ``True``.
+
+        Returns
+        -------
+        None
+        """
+        if flat:
+            v = ivy.Container.cont_from_disk_as_flat(weights_path, mmap=mmap)
+        else:
+            v = ivy.Container.cont_from_disk_as_hdf5(weights_path)
+        self.v = self.v.cont_set_at_key_chains(v) if self.v else v
 
     def build(
         self,
@@ -657,6 +686,26 @@ class Module(ModuleConverters, ModuleHelpers):
     def built_(self):
         return self._built
 
+    @property
+    def submod_rets(self):
+        if self._submod_rets is None:
+            self._submod_rets = ivy.Container(alphabetical_keys=False)
+        return self._submod_rets
+
+    @submod_rets.setter
+    def submod_rets(self, submod_rets):
+        self._submod_rets = submod_rets
+
+    @property
+    def submod_call_order(self):
+        if self._submod_call_order is None:
+            self._submod_call_order = ivy.Container(alphabetical_keys=False)
+        return self._submod_call_order
+
+    @submod_call_order.setter
+    def submod_call_order(self, submod_call_order):
+        self._submod_call_order = submod_call_order
+
     def show_graph(
         self,
         randomness_factor: float = 0.1,
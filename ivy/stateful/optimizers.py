@@ -154,6 +154,18 @@ class Optimizer(abc.ABC):
         """
         self._count += 1
         self._initialized = True
+        if (
+            not ignore_missing
+            and isinstance(v, ivy.Container)
+            and v.cont_packed_buffers is not None
+            and grads.cont_packed_buffers is None
+        ):
+            # packing the gradients like the variables lets every update run once per
+            # flat buffer, rather than once per variable
+            try:
+                grads = grads.cont_pack(like=v)
+            except ivy.utils.exceptions.IvyException:
+                pass
         return self._step_fn(v, grads, ignore_missing)
 
 
@@ -1,3 +1,4 @@
+from . import array_registry
 from . import backend
 from . import dynamic_import
 from .dynamic_import import *
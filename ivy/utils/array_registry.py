@@ -0,0 +1,140 @@
+"""
+Weak registry of the live ivy.Array and ivy.Container instances.
+
+The registry is opt-in, see ``ivy.set_array_registry_mode``. While it is enabled,
+the arrays are indexed by their backend and device, so that the memory queries and
+the dynamic backend conversion of ``ivy.set_backend`` only visit the ivy arrays
+and containers rather than every object known to the garbage collector.
+"""
+
+import gc
+import weakref
+
+import ivy
+
+enabled = False
+
+# id -> (weak reference, index key)
+_arrays = dict()
+# (backend, device) -> ids of the arrays, the device is None until it is queried
+_index = dict()
+# id -> weak reference
+_containers = dict()
+
+
+def _unindex(key, entry):
+    ids = _index.get(entry[1])
+    if ids is not None:
+        ids.discard(key)
+        if not ids:
+            del _index[entry[1]]
+
+
+def _forget_array(key, ref):
+    entry = _arrays.get(key)
+    # the id may already have been reused by a newer array
+    if entry is not None and entry[0] is ref:
+        del _arrays[key]
+        _unindex(key, entry)
+
+
+def _forget_container(key, ref):
+    if _containers.get(key) is ref:
+        del _containers[key]
+
+
+def register_array(x, /):
+    """Add (or re-index) an ivy.Array, its device is resolved on the first query."""
+    key = id(x)
+    entry = _arrays.get(key)
+    if entry is not None and entry[0]() is x:
+        _unindex(key, entry)
+        ref = entry[0]
+    else:
+        ref = weakref.ref(x, lambda r, k=key: _forget_array(k, r))
+    index_key = (x.backend, None)
+    _arrays[key] = (ref, index_key)
+    _index.setdefault(index_key, set()).add(key)
+
+
+def register_container(x, /):
+    """Add an ivy.Container to the registry."""
+    key = id(x)
+    ref = _containers.get(key)
+    if ref is None or ref() is not x:
+        _containers[key] = weakref.ref(x, lambda r, k=key: _forget_container(k, r))
+
+
+def _resolve_devices():
+    for index_key in [k for k in _index if k[1] is None]:
+        for key in _index.pop(index_key):
+            ref = _arrays[key][0]
+            x = ref()
+            if x is None:
+                continue
+            device_key = (index_key[0], ivy.as_ivy_dev(x.device))
+            _arrays[key] = (ref, device_key)
+            _index.setdefault(device_key, set()).add(key)
+
+
+def live_arrays(*, backend=None, device=None):
+    """
+    Return the live ivy arrays, optionally only those of a backend and/or device.
+
+    Parameters
+    ----------
+    backend
+        The backend string the arrays were created with. Default is ``None``, which
+        returns the arrays of every backend.
+    device
+        The device the arrays are on. Default is ``None``, which returns the arrays
+        on every device.
+
+    Returns
+    -------
+    ret
+        The live arrays, in registration order within each index entry.
+    """
+    if device is not None:
+        _resolve_devices()
+        device = ivy.as_ivy_dev(device)
+    ret = list()
+    for (index_backend, index_device), ids in list(_index.items()):
+        if backend is not None and index_backend != backend:
+            continue
+        if device is not None and index_device != device:
+            continue
+        for key in list(ids):
+            x = _arrays[key][0]()
+            if x is not None:
+                ret.append(x)
+    return ret
+
+
+def live_containers():
+    """Return the live ivy containers."""
+    return [c for c in (ref() for ref in list(_containers.values())) if c is not None]
+
+
+def enable():
+    """Enable the registry, registering the arrays and containers already alive."""
+    global enabled
+    if enabled:
+        return
+    enabled = True
+    # a single scan to pick up the instances created before the registry was enabled
+    for obj in gc.get_objects():
+        if isinstance(obj, ivy.Array):
+            if hasattr(obj, "_data"):
+                register_array(obj)
+        elif isinstance(obj, ivy.Container):
+            register_container(obj)
+
+
+def disable():
+    """Disable the registry and drop its entries."""
+    global enabled
+    enabled = False
+    _arrays.clear()
+    _index.clear()
+    _containers.clear()
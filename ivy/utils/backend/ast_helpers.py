@@ -1,10 +1,12 @@
 import ast
+import hashlib
+import marshal
 import os
 import sys
 import traceback
 from ast import parse
 from string import Template
-from importlib.util import spec_from_file_location
+from importlib.util import spec_from_file_location, MAGIC_NUMBER
 from importlib.abc import Loader, MetaPathFinder
 
 
@@ -19,8 +21,16 @@ _local_import_template = Template(
     "$name = "
     "ivy.utils.backend.handler._compiled_backends_ids[$ivy_id].utils._importlib.$name"
 )
+# The id of the local ivy is bound in the module globals at execution time, so that
+# the transformed code does not depend on it and can be shared between instances
+_local_ivy_id_name = "__ivy_local_id__"
 _unmodified_ivy_path = sys.modules["ivy"].__path__[0].rpartition("/")[0]
+# (filename, is_local) -> (st_mtime_ns, st_size, code object)
 _compiled_modules_cache = {}
+# Bump whenever the code emitted by ImportTransformer changes, this invalidates the
+# code objects stored on disk
+_transform_version = 1
+_compiled_modules_cache_dir = os.environ.get("IVY_COMPILED_MODULES_CACHE_DIR")
 
 
 def _retrive_local_modules():
@@ -214,12 +224,12 @@ class ImportTransformer(ast.NodeTransformer):
         else:
             insert_import(
                 _local_import_template.substitute(
-                    name=importlib_abs_import_fn, ivy_id=local_ivy_id
+                    name=importlib_abs_import_fn, ivy_id=_local_ivy_id_name
                 )
             )
             insert_import(
                 _local_import_template.substitute(
-                    name=importlib_from_import_fn, ivy_id=local_ivy_id
+                    name=importlib_from_import_fn, ivy_id=_local_ivy_id_name
                 )
             )
             insert_import("import ivy")
@@ -257,24 +267,96 @@ class IvyPathFinder(MetaPathFinder):
         return None
 
 
+def set_compiled_modules_cache_dir(path):
+    """
+    Set the directory in which the transformed code of the modules imported by
+    ``ivy.with_backend`` is stored, ``None`` disables the on-disk cache.
+
+    Parameters
+    ----------
+    path
+        The directory to store the compiled code objects in. It is created if it
+        does not exist.
+    """
+    global _compiled_modules_cache_dir
+    if path is not None:
+        os.makedirs(path, exist_ok=True)
+    _compiled_modules_cache_dir = path
+
+
+def _clear_compiled_modules_cache():
+    _compiled_modules_cache.clear()
+
+
+def _transform_source(data, filename, is_local):
+    ast_tree = parse(data)
+    transformer = ImportTransformer()
+    transformer.visit(ast_tree)
+    transformer.impersonate_import(ast_tree, _local_ivy_id_name if is_local else None)
+    ast.fix_missing_locations(ast_tree)
+    return compile(ast_tree, filename=filename, mode="exec")
+
+
+def _source_digest(data, filename, is_local):
+    key = hashlib.sha256(MAGIC_NUMBER)
+    key.update(f"{_transform_version}:{is_local}:{filename}\0".encode())
+    key.update(data)
+    return key.hexdigest()
+
+
+def _load_cached_code(digest):
+    path = os.path.join(_compiled_modules_cache_dir, digest + ".ivyc")
+    try:
+        with open(path, "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_code(digest, code):
+    path = os.path.join(_compiled_modules_cache_dir, digest + ".ivyc")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump(code, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _get_compiled_code(filename, is_local):
+    stat = os.stat(filename)
+    key = (filename, is_local)
+    cached = _compiled_modules_cache.get(key)
+    if (
+        cached is not None
+        and cached[0] == stat.st_mtime_ns
+        and cached[1] == stat.st_size
+    ):
+        return cached[2]
+    with open(filename, "rb") as f:
+        data = f.read()
+    code = None
+    if _compiled_modules_cache_dir is not None:
+        digest = _source_digest(data, filename, is_local)
+        code = _load_cached_code(digest)
+    if code is None:
+        code = _transform_source(data, filename, is_local)
+        if _compiled_modules_cache_dir is not None:
+            _store_cached_code(digest, code)
+    _compiled_modules_cache[key] = (stat.st_mtime_ns, stat.st_size, code)
+    return code
+
+
 class IvyLoader(Loader):
     def __init__(self, filename):
         self.filename = filename
 
     def exec_module(self, module, local_ivy_id=None):
-        if self.filename in _compiled_modules_cache:
-            compiled_obj = _compiled_modules_cache[self.filename]
-        else:
-            with open(self.filename) as f:
-                data = f.read()
-
-            ast_tree = parse(data)
-            transformer = ImportTransformer()
-            transformer.visit(ast_tree)
-            transformer.impersonate_import(ast_tree, local_ivy_id)
-            ast.fix_missing_locations(ast_tree)
-            compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
-            _compiled_modules_cache[self.filename] = compiled_obj
+        is_local = local_ivy_id is not None
+        compiled_obj = _get_compiled_code(self.filename, is_local)
+        if is_local:
+            module.__dict__[_local_ivy_id_name] = local_ivy_id
         try:
             exec(compiled_obj, module.__dict__)
         except Exception as e:
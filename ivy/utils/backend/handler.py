@@ -19,6 +19,8 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
+# wrapped ivy namespace of each backend, built once from `ivy_original_dict`
+_wrapped_namespaces = dict()
 
 
 class ContextManager:
@@ -252,8 +254,8 @@ def _set_backend_as_ivy(
     for k, v in original_dict.items():
         compositional = k not in backend.__dict__
         if k not in backend.__dict__:
-            if k in invalid_dtypes and k in target.__dict__:
-                del target.__dict__[k]
+            if k in invalid_dtypes:
+                target.__dict__.pop(k, None)
                 continue
             backend.__dict__[k] = v
         target.__dict__[k] = _wrap_function(
@@ -273,6 +275,47 @@ def _set_backend_as_ivy(
             )
 
 
+def _wrapped_backend_namespace(backend):
+    """
+    Return the ivy namespace of `backend`, with all of its functions wrapped, along
+    with the keys of `ivy_original_dict` which are invalid for `backend`.
+
+    The namespace is only built on the first request for each backend, every later
+    request returns the cached namespace.
+    """
+    backend_str = backend.current_backend_str()
+    if backend_str not in _wrapped_namespaces:
+        set_backend_to_specific_version(backend)
+        target = types.SimpleNamespace()
+        _set_backend_as_ivy(ivy_original_dict, target, backend)
+        namespace = target.__dict__
+        invalid_keys = [k for k in ivy_original_dict if k not in namespace]
+        _wrapped_namespaces[backend_str] = (namespace, invalid_keys)
+    return _wrapped_namespaces[backend_str]
+
+
+def _set_wrapped_namespace_as_ivy(backend):
+    namespace, invalid_keys = _wrapped_backend_namespace(backend)
+    for k in invalid_keys:
+        ivy.__dict__.pop(k, None)
+    ivy.__dict__.update(namespace)
+
+
+def _refresh_ivy_original_dict():
+    global ivy_original_dict
+    current_dict = ivy.__dict__
+    if len(current_dict) == len(ivy_original_dict) and all(
+        ivy_original_dict.get(k, _missing) is v for k, v in current_dict.items()
+    ):
+        return
+    # ivy has been modified since the namespaces were wrapped
+    ivy_original_dict = current_dict.copy()
+    _wrapped_namespaces.clear()
+
+
+_missing = object()
+
+
 def _handle_backend_specific_vars(target, backend):
     if backend.current_backend_str() == "numpy":
         target.set_default_device("cpu")
@@ -328,13 +371,17 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
         return list(new_objs.values())
 
     # get all ivy array and container instances in the project scope
-    array_list, container_list = [
-        [obj for obj in gc.get_objects() if isinstance(obj, obj_type)]
-        for obj_type in (ivy.Array, ivy.Container)
-    ]
+    if ivy.utils.array_registry.enabled:
+        array_list = ivy.utils.array_registry.live_arrays()
+        container_list = ivy.utils.array_registry.live_containers()
+    else:
+        array_list, container_list = [
+            [obj for obj in gc.get_objects() if isinstance(obj, obj_type)]
+            for obj_type in (ivy.Array, ivy.Container)
+        ]
 
     # filter uninitialized arrays
-    array_list = [arr for arr in array_list if arr.__dict__]
+    array_list = [arr for arr in array_list if hasattr(arr, "_data")]
 
     # remove numpy intermediate objects
     new_objs = _remove_intermediate_arrays(array_list, container_list)
@@ -437,9 +484,8 @@ def set_backend(backend: str, dynamic: bool = False):
 
     # update the global dict with the new backend
     with ivy.locks["backend_setter"]:
-        global ivy_original_dict
         if not backend_stack:
-            ivy_original_dict = ivy.__dict__.copy()
+            _refresh_ivy_original_dict()
 
         _clear_current_sub_backends()
         if isinstance(backend, str):
@@ -454,8 +500,7 @@ def set_backend(backend: str, dynamic: bool = False):
         elif backend.current_backend_str() == "jax":
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
-        set_backend_to_specific_version(backend)
-        _set_backend_as_ivy(ivy_original_dict, ivy, backend)
+        _set_wrapped_namespace_as_ivy(backend)
 
         if dynamic:
             convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
@@ -568,16 +613,12 @@ def previous_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+        # add the cached wrapped functions of the backend if there still is one,
+        # otherwise the original functions, to the ivy namespace
+        if backend_stack:
+            _set_wrapped_namespace_as_ivy(backend_stack[-1])
+        else:
+            ivy.__dict__.update(ivy_original_dict)
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
@@ -0,0 +1,82 @@
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+import ivy.functional.frontends.tensorflow as tf_frontend
+
+
+def _rows():
+    return [[0, 1, 2], [], [3, 4, 5, 6], [7, 8, 9]]
+
+
+def _ragged():
+    return tf_frontend.ragged.RaggedTensor.from_row_lengths(
+        ivy.arange(10), [3, 0, 4, 3]
+    )
+
+
+# Tests #
+# ------#
+
+
+def test_tensorflow_ragged_factories():
+    ragged_tensor = tf_frontend.ragged.RaggedTensor
+    values = ivy.arange(10)
+    for rt in [
+        _ragged(),
+        ragged_tensor.from_row_splits(values, [0, 3, 3, 7, 10]),
+        ragged_tensor.from_row_starts(values, [0, 3, 3, 7]),
+        ragged_tensor.from_value_rowids(values, [0, 0, 0, 2, 2, 2, 2, 3, 3, 3]),
+    ]:
+        assert rt.to_list() == _rows()
+        assert np.array_equal(ivy.to_numpy(rt.row_splits), [0, 3, 3, 7, 10])
+    rt = ragged_tensor.from_value_rowids(values, [0] * 10, nrows=3)
+    assert np.array_equal(ivy.to_numpy(rt.row_lengths()), [10, 0, 0])
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ragged_tensor.from_row_lengths(values, [3, 4])
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ragged_tensor.from_row_splits(values, [1, 10])
+
+
+def test_tensorflow_ragged_rows():
+    rt = _ragged()
+    assert len(rt) == 4
+    assert ivy.to_list(rt[2]) == [3, 4, 5, 6]
+    assert ivy.to_list(rt[-1]) == [7, 8, 9]
+    assert rt[1:].to_list() == _rows()[1:]
+    assert rt[::2].to_list() == _rows()[::2]
+    with pytest.raises(IndexError):
+        rt[4]
+
+
+def test_tensorflow_ragged_to_tensor_and_from_tensor():
+    ragged_tensor = tf_frontend.ragged.RaggedTensor
+    rt = _ragged()
+    dense = rt.to_tensor(default_value=-1)
+    assert ivy.to_list(dense) == [
+        [0, 1, 2, -1],
+        [-1, -1, -1, -1],
+        [3, 4, 5, 6],
+        [7, 8, 9, -1],
+    ]
+    assert ivy.to_list(rt.to_tensor(shape=[2, 2])) == [[0, 1], [0, 0]]
+    assert ragged_tensor.from_tensor(dense, padding=-1).to_list() == _rows()
+    assert ragged_tensor.from_tensor(dense, lengths=[3, 0, 4, 3]).to_list() == _rows()
+    # nested ragged dimensions
+    inner = ragged_tensor.from_row_lengths(ivy.arange(6), [1, 2, 0, 3])
+    rt = ragged_tensor.from_row_lengths(inner, [2, 2])
+    assert tuple(rt.to_tensor().shape) == (2, 2, 3)
+    rows = ragged_tensor.from_tensor(rt.to_tensor(-1), padding=-1, ragged_rank=2)
+    assert rows.to_list() == rt.to_list()
+
+
+def test_tensorflow_ragged_bucket_by_length():
+    rt = _ragged()
+    batches = rt.bucket_by_length(2, default_value=-1)
+    assert [ivy.to_list(row_ids) for row_ids, _ in batches] == [[1, 0], [3, 2]]
+    assert [tuple(batch.shape) for _, batch in batches] == [(2, 3), (2, 4)]
+    for row_ids, batch in batches:
+        for row_id, row in zip(ivy.to_list(row_ids), ivy.to_list(batch)):
+            assert row[: len(_rows()[row_id])] == _rows()[row_id]
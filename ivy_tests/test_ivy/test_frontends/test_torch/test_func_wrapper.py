@@ -142,3 +142,25 @@ def test_to_ivy_arrays_and_back(dtype_and_x, dtype):
     assert ivy.all(input_frontend.ivy_array == output.ivy_array)
 
     assert ivy.default_float_dtype_stack == ivy.default_int_dtype_stack == []
+
+
+def test_to_ivy_arrays_and_back_nested_calls():
+    int_dtype_stacks = list()
+
+    @to_ivy_arrays_and_back
+    def _inner(x):
+        int_dtype_stacks.append(list(ivy.default_int_dtype_stack))
+        return x
+
+    @to_ivy_arrays_and_back
+    def _outer(x, ys):
+        int_dtype_stacks.append(list(ivy.default_int_dtype_stack))
+        assert all(isinstance(y, ivy.Array) for y in ys)
+        return _inner(x), ys
+
+    ret = _outer(1, [Tensor([1.0]), Tensor([2.0])])
+    # the inner call reuses the default dtypes set by the outer one
+    assert int_dtype_stacks == [["int64"], ["int64"]]
+    assert ivy.default_float_dtype_stack == ivy.default_int_dtype_stack == []
+    assert ret[0] == 1
+    assert all(isinstance(y, Tensor) for y in ret[1])
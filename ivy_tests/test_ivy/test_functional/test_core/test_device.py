@@ -11,6 +11,7 @@ import warnings
 
 import numpy as np
 import psutil
+import pytest
 from hypothesis import strategies as st, assume
 
 try:
@@ -373,6 +374,78 @@ def test_split_func_call_with_cont_input(
     helpers.assert_all_close(ivy.to_numpy(c.cont_key), ivy.to_numpy(c_true.cont_key))
 
 
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    array_shape=helpers.lists(
+        x=helpers.ints(min_value=1, max_value=8),
+        min_size=2,
+        max_size=2,
+    ),
+    chunk_size=helpers.ints(min_value=1, max_value=3),
+    num_workers=helpers.ints(min_value=1, max_value=3),
+    memory_budget=st.one_of(st.none(), helpers.ints(min_value=1, max_value=256)),
+    mode=st.sampled_from(["concat", "sum", "mean"]),
+)
+def test_split_func_call_with_workers(
+    *,
+    array_shape,
+    chunk_size,
+    num_workers,
+    memory_budget,
+    mode,
+):
+    x = ivy.asarray(np.random.uniform(size=array_shape).astype("float32"))
+    if ivy.exists(memory_budget):
+        chunk_size = None
+
+    # function
+    if mode == "concat":
+
+        def func(t):
+            return ivy.exp(t), t
+
+    else:
+
+        def func(t):
+            return ivy.mean(t, axis=0) if mode == "mean" else ivy.sum(t, axis=0)
+
+    # predictions
+    ret = ivy.split_func_call(
+        func,
+        [x],
+        mode,
+        chunk_size=chunk_size,
+        num_workers=num_workers,
+        memory_budget=memory_budget,
+    )
+
+    # true
+    ret_true = func(x)
+
+    # value test
+    if mode == "concat":
+        helpers.assert_all_close(ivy.to_numpy(ret[0]), ivy.to_numpy(ret_true[0]))
+        helpers.assert_all_close(ivy.to_numpy(ret[1]), ivy.to_numpy(ret_true[1]))
+    else:
+        helpers.assert_all_close(ivy.to_numpy(ret), ivy.to_numpy(ret_true))
+
+
+@pytest.mark.parametrize(
+    ("num_workers", "max_in_flight"), [(0, None), (-1, None), (2, 0), (2, -1)]
+)
+def test_split_func_call_w_invalid_workers(num_workers, max_in_flight):
+    x = ivy.ones((8, 2))
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.split_func_call(
+            ivy.exp,
+            [x],
+            "concat",
+            chunk_size=2,
+            num_workers=num_workers,
+            max_in_flight=max_in_flight,
+        )
+
+
 # profiler
 @handle_test(
     fn_tree="functional.ivy.Profiler",
@@ -3,6 +3,8 @@
 # global
 import numpy as np
 import importlib
+import os
+import tempfile
 from hypothesis import strategies as st
 import typing
 
@@ -941,6 +943,23 @@ def test_function_unsupported_dtypes(*, func):
     assert set(tuple(exp)) == set(res)
 
 
+# save_function_support_index and load_function_support_index
+@handle_test(
+    fn_tree="functional.ivy.save_function_support_index",
+    func=st.sampled_from([_composition_1, _composition_2]),
+)
+def test_function_support_index(*, func):
+    res = ivy.function_unsupported_dtypes(func)
+    # repeated queries are answered from the index
+    assert ivy.function_unsupported_dtypes(func) is res
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "index.json")
+        ivy.save_function_support_index(path)
+        ivy.functional.ivy.data_type._SUPPORT_INDEX.clear()
+        assert ivy.load_function_support_index(path)
+    assert set(ivy.function_unsupported_dtypes(func)) == set(res)
+
+
 # function_dtype_versioning
 @handle_test(
     fn_tree="functional.ivy.function_unsupported_dtypes",  # dummy fn_tree
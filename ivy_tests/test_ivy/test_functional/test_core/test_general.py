@@ -1,6 +1,7 @@
 """Collection of tests for unified general functions."""
 
 # global
+import gc
 import time
 import math
 from types import SimpleNamespace
@@ -700,6 +701,26 @@ def test_scatter_nd(
     )
 
 
+@pytest.mark.parametrize("reduction", ["sum", "min", "max"])
+@pytest.mark.parametrize("dtype", ["float32", "int32"])
+def test_numpy_scatter_reduce_fallback(reduction, dtype, monkeypatch):
+    numpy_general = pytest.importorskip("ivy.functional.backends.numpy.general")
+    rng = np.random.default_rng(0)
+    target = rng.integers(-5, 5, (6, 3)).astype(dtype)
+    # duplicate and negative indices, into the rows of the target
+    indices = np.array([[0], [2], [-1], [2], [0], [5], [3], [-4]])
+    updates = rng.integers(-10, 10, (8, 3)).astype(dtype)
+    expected = target.copy()
+    ufunc = {"sum": np.add, "min": np.minimum, "max": np.maximum}[reduction]
+    ufunc.at(expected, indices[:, 0], updates)
+
+    # the bincount and segment reductions used before numpy 1.25
+    monkeypatch.setattr(numpy_general, "_fast_ufunc_at", False)
+    ret = numpy_general._scatter_reduce(target.copy(), indices, updates, reduction)
+    assert ret.dtype == expected.dtype
+    assert np.array_equal(ret, expected)
+
+
 # gather
 @handle_test(
     fn_tree="functional.ivy.gather",
@@ -982,6 +1003,65 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_max_size():
+    @ivy.cache_fn(max_size=2)
+    def func(_):
+        return ivy.random_uniform()
+
+    ret0 = func(0)
+    func(1)
+    assert func(0) is ret0
+    # 1 is now the least recently used, and is evicted
+    func(2)
+    assert func(0) is ret0
+    assert func.cache_info() == {
+        "hits": 2,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "max_size": 2,
+    }
+
+    func.cache_clear()
+    assert func(0) is not ret0
+    assert func.cache_info()["misses"] == 1
+
+
+@pytest.mark.parametrize("array_key", ["identity", "shape_dtype"])
+def test_cache_fn_array_key(array_key):
+    def func(x):
+        return ivy.random_uniform()
+
+    cached_fn = ivy.cache_fn(func, array_key=array_key)
+    x = ivy.array([1.0, 2.0])
+    ret = cached_fn(x)
+    assert cached_fn(x) is ret
+    # an equal array is only a hit when keyed by shape and dtype
+    assert (cached_fn(ivy.array([3.0, 4.0])) is ret) == (array_key == "shape_dtype")
+    assert cached_fn(ivy.array([1.0, 2.0, 3.0])) is not ret
+
+
+def test_cache_fn_keys():
+    @ivy.cache_fn
+    def func(x):
+        return x + 1 if isinstance(x, int) else None
+
+    # equal values of different types are cached apart
+    assert func(3) == 4
+    assert func(3.0) is None
+    assert func(True) == 2
+    assert func.cache_info()["max_size"] == 128
+
+    cached_fn = ivy.cache_fn(lambda x: ivy.random_uniform())
+    x = ivy.array([1.0, 2.0])
+    cached_fn(x)
+    assert cached_fn.cache_info()["size"] == 1
+    # the arrays are not kept alive by the cache, and their outputs are dropped
+    del x
+    gc.collect()
+    assert cached_fn.cache_info()["size"] == 0
+
+
 def test_framework_setting_with_threading():
     if ivy.current_backend_str() == "jax":
         # Numpy is the conflicting framework being tested against
@@ -1969,6 +2049,30 @@ def test_print_all_arrays_in_memory():
     return
 
 
+# array_registry_mode
+def test_array_registry_mode():
+    assert not ivy.get_array_registry_mode()
+    before = ivy.array([0.0])
+    ivy.set_array_registry_mode(True)
+    try:
+        assert ivy.get_array_registry_mode()
+        after = ivy.array([1.0, 2.0])
+        cont = ivy.Container(a=ivy.array([3.0]))
+        live_ids = [id(x) for x in ivy.utils.array_registry.live_arrays()]
+        assert id(before) in live_ids and id(after) in live_ids
+        assert id(cont) in [id(c) for c in ivy.utils.array_registry.live_containers()]
+        device = ivy.dev(after)
+        on_dev = ivy.get_all_ivy_arrays_on_dev(device)
+        assert str(id(after)) in on_dev and str(id(cont.a)) in on_dev
+        num_before = ivy.num_ivy_arrays_on_dev(device)
+        del after, on_dev
+        assert ivy.num_ivy_arrays_on_dev(device) == num_before - 1
+    finally:
+        ivy.unset_array_registry_mode()
+    assert not ivy.get_array_registry_mode()
+    assert not ivy.utils.array_registry.live_arrays()
+
+
 # set_queue_timeout
 @given(
     x=st.floats(allow_nan=False, allow_infinity=False),
@@ -2143,6 +2247,113 @@ def test_vmap(func, dtype_and_arrays_and_axes, in_axes_as_cont):
         assert False, "One of the results is None while other isn't"
 
 
+@pytest.mark.parametrize(
+    ("func", "in_axes", "batched"),
+    [
+        (lambda x, y: ivy.matmul(x, y), [0, None], True),
+        (lambda x, y: ivy.matmul(x, y), [None, 0], True),
+        (lambda x, y: ivy.softmax(x @ y + 1.0, axis=-1), [0, 0], True),
+        (lambda x, y: ivy.sum(ivy.relu(x - ivy.mean(y, axis=0))), [1, 0], True),
+        (lambda x, y: ivy.argmax(ivy.reshape(x[1:], (-1,)) * y[0, 0]), [0, 0], True),
+        (lambda x, y: ivy.permute_dims(ivy.expand_dims(x, axis=0), (2, 1, 0)), 0, True),
+        (lambda x, y: ivy.concat([x, y], axis=0), [0, 0], False),
+    ],
+)
+def test_vmap_numpy_batching(func, in_axes, batched):
+    ivy.set_backend("numpy")
+    x = np.random.uniform(size=(5, 5, 3)).astype(np.float32)
+    y = np.random.uniform(size=(5, 3, 3)).astype(np.float32)
+    calls = []
+
+    def counted(*args):
+        calls.append(None)
+        return func(*args)
+
+    ret = ivy.vmap(counted, in_axes=in_axes)(x, y)
+    # the function is traced once on the whole batch when it only uses operations
+    # with batching rules, and called per example otherwise
+    assert (len(calls) == 1) is batched
+    in_axes = in_axes if isinstance(in_axes, list) else [in_axes, 0]
+    xs = np.moveaxis(x, in_axes[0], 0) if in_axes[0] is not None else [x] * 5
+    ys = np.moveaxis(y, in_axes[1], 0) if in_axes[1] is not None else [y] * 5
+    expected = np.stack([ivy.to_numpy(func(xi, yi)) for xi, yi in zip(xs, ys)])
+    assert ret.shape == expected.shape
+    assert np.allclose(ivy.to_numpy(ret), expected, rtol=1e-5, atol=1e-6)
+    ivy.previous_backend()
+
+
+def test_vmap_numpy_batching_w_error():
+    ivy.set_backend("numpy")
+    calls = []
+
+    def failing(x):
+        calls.append(None)
+        raise ValueError("failing")
+
+    # errors of the function are raised, rather than falling back to the examples
+    with pytest.raises(ValueError, match="failing"):
+        ivy.vmap(failing)(np.ones((4, 3), dtype=np.float32))
+    assert len(calls) == 1
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    ("func", "batched"),
+    [
+        (lambda a: np.sin(a), True),
+        (lambda a: np.ones(3) + a, True),
+        (lambda a: a.reshape((3, 1)), False),
+        (lambda a: a.T, False),
+        (lambda a: a * float(ivy.sum(a)), False),
+        (lambda a: np.stack([a, a]), False),
+    ],
+)
+def test_vmap_numpy_batching_w_numpy_functions(func, batched):
+    ivy.set_backend("numpy")
+    x = ivy.array(np.arange(6.0).reshape(2, 3))
+    calls = []
+
+    def counted(a):
+        calls.append(None)
+        return func(a)
+
+    # numpy functions and array methods without a batching rule are mapped over the
+    # examples, instead of failing on the tracers
+    ret = ivy.vmap(counted)(x)
+    assert (len(calls) == 1) is batched
+    expected = np.stack([ivy.to_numpy(func(xi)) for xi in ivy.to_numpy(x)])
+    assert ret.shape == expected.shape
+    assert np.allclose(ivy.to_numpy(ret), expected)
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda a: ivy.zeros(3),
+        lambda a: (a, a * 2.0),
+        lambda a: [ivy.ones(3), ivy.exp(a)],
+    ],
+)
+def test_vmap_numpy_batching_w_unbatched_result(func):
+    ivy.set_backend("numpy")
+    x = ivy.array(np.arange(6.0).reshape(2, 3))
+    calls = []
+
+    def counted(a):
+        calls.append(None)
+        return func(a)
+
+    # results which are not a single batch are reused, rather than calling the
+    # function again per example
+    ret = ivy.vmap(counted)(x)
+    assert len(calls) == 1
+    expected = np.stack([np.asarray(ivy.to_numpy(func(xi))) for xi in ivy.to_numpy(x)])
+    assert ret.shape == expected.shape
+    assert np.allclose(ivy.to_numpy(ret), expected)
+    ivy.previous_backend()
+
+
 @st.composite
 def _isin_data_generation_helper(draw):
     assume_unique = draw(st.booleans())
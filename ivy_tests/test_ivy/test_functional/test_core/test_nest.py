@@ -500,3 +500,51 @@ def test_duplicate_array_index_chains(nest, x, y):
 def test_prune_empty(nest):
     ret = ivy.prune_empty(ivy.copy_nest(nest))
     assert ret == {"b": {"c": [1]}}
+
+
+# nested_argwhere_w_stop_after_n_found
+@pytest.mark.parametrize("nest", [[0, 6, [1, 7], 8], {"a": 0, "b": (6, 1, 7)}])
+def test_nested_argwhere_w_stop_after_n_found(nest):
+    indices = ivy.nested_argwhere(nest, lambda x: x > 5)
+    assert ivy.nested_argwhere(nest, lambda x: x > 5, stop_after_n_found=2) == (
+        indices[:2]
+    )
+
+
+# tree_flatten
+@pytest.mark.parametrize(
+    "nest", [{"a": [0, 1], "b": ({"c": 2},)}, [0, (1, [2, 3]), {}], (), 4]
+)
+@pytest.mark.parametrize("include_derived", [None, True])
+def test_tree_flatten(nest, include_derived):
+    leaves, treedef = ivy.tree_flatten(nest, include_derived=include_derived)
+    assert leaves == [ivy.index_nest(nest, path) for path in treedef.paths]
+    assert treedef.num_leaves == len(leaves)
+    # nests of the same structure share their treedef
+    _, treedef_copy = ivy.tree_flatten(
+        ivy.copy_nest(nest), include_derived=include_derived
+    )
+    assert treedef_copy is treedef
+    assert ivy.tree_unflatten(treedef, leaves) == nest
+
+
+# tree_unflatten
+def test_tree_unflatten():
+    nest = [{"a": 0, "b": (1, 2)}, [3]]
+    leaves, treedef = ivy.tree_flatten(nest)
+    ret = ivy.tree_unflatten(treedef, [x + 1 for x in leaves])
+    assert ret == [{"a": 1, "b": (2, 3)}, [4]]
+    assert ret[0] is not nest[0]
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.tree_unflatten(treedef, leaves[1:])
+
+
+def test_tree_flatten_w_equal_keys():
+    # keys which are equal but of different types have distinct structures
+    treedefs = [ivy.tree_flatten({k: 2})[1] for k in [1, 1.0, True]]
+    assert len(set(map(id, treedefs))) == 3
+    for key in [1, True, 1.0]:
+        ret = ivy.nested_map({key: 2}, lambda x: x, shallow=False)
+        assert type(next(iter(ret))) is type(key)
+        ret = ivy.copy_nest({key: [3]})
+        assert type(next(iter(ret))) is type(key)
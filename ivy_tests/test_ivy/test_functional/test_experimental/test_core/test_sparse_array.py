@@ -355,3 +355,88 @@ def test_sparse_bsr(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+@st.composite
+def _sparse_csr_and_dense_operand(draw):
+    crow_indices, col_indices, value_dtype, values, shape = draw(
+        _sparse_csr_indices_values_shape()
+    )
+    dense_shape = draw(st.sampled_from([(shape[1],), (shape[1], 3)]))
+    dense = draw(helpers.array_values(dtype=value_dtype, shape=dense_shape))
+    return crow_indices, col_indices, value_dtype, values, shape, dense
+
+
+# csr - matmul
+@handle_method(
+    method_tree="SparseArray.matmul",
+    sparse_data=_sparse_csr_and_dense_operand(),
+    method_num_positional_args=st.just(1),  # TODO should not be hardcoded
+    init_num_positional_args=st.just(0),  # TODO should not be hardcoded
+)
+def test_sparse_csr_matmul(
+    sparse_data,
+    class_name,
+    method_name,
+    ground_truth_backend,
+    init_flags,
+    on_device,
+    method_flags,
+):
+    crow_indices, col_indices, value_dtype, values, shape, other = sparse_data
+    helpers.test_method(
+        ground_truth_backend=ground_truth_backend,
+        init_flags=init_flags,
+        method_flags=method_flags,
+        on_device=on_device,
+        init_input_dtypes=["int64", "int64", value_dtype],
+        init_all_as_kwargs_np={
+            "crow_indices": crow_indices,
+            "col_indices": col_indices,
+            "values": values,
+            "dense_shape": shape,
+            "format": "csr",
+        },
+        method_input_dtypes=[value_dtype],
+        method_all_as_kwargs_np={"other": other},
+        class_name=class_name,
+        method_name=method_name,
+    )
+
+
+# coo - sum
+@handle_method(
+    method_tree="SparseArray.sum",
+    sparse_data=_sparse_coo_indices_values_shape(),
+    axis=st.sampled_from([None, 0, 1]),
+    method_num_positional_args=st.just(0),  # TODO should not be hardcoded
+    init_num_positional_args=st.just(0),  # TODO should not be hardcoded
+)
+def test_sparse_coo_sum(
+    sparse_data,
+    axis,
+    class_name,
+    method_name,
+    ground_truth_backend,
+    init_flags,
+    method_flags,
+    on_device,
+):
+    coo_ind, val_dtype, val, shp = sparse_data
+    helpers.test_method(
+        ground_truth_backend=ground_truth_backend,
+        init_flags=init_flags,
+        method_flags=method_flags,
+        on_device=on_device,
+        init_input_dtypes=["int64", val_dtype],
+        init_all_as_kwargs_np={
+            "coo_indices": coo_ind,
+            "values": val,
+            "dense_shape": shp,
+            "format": "coo",
+        },
+        method_input_dtypes=[],
+        method_all_as_kwargs_np={"axis": axis},
+        class_name=class_name,
+        method_name=method_name,
+    )
@@ -1,4 +1,7 @@
 # global
+import itertools
+import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
@@ -230,6 +233,70 @@ def test_avg_pool3d(
     )
 
 
+def _pool2d_reference(x, kernel, stride, padding, dilation, ceil_mode, reduce):
+    # reduces the in-bounds elements of every window of a NHWC input, with torch's
+    # output shapes: ceil_mode keeps a last partial window unless it would start in
+    # the right padding
+    out_shape, positions = [], []
+    for i in range(2):
+        n = x.shape[i + 1]
+        span = n + 2 * padding - (kernel - 1) * dilation - 1
+        size = (-(-span // stride) if ceil_mode else span // stride) + 1
+        if ceil_mode and (size - 1) * stride >= n + padding:
+            size -= 1
+        out_shape.append(size)
+        positions.append(
+            [
+                [p for p in range(j * stride - padding, n, dilation)[:kernel] if p >= 0]
+                for j in range(size)
+            ]
+        )
+    res = np.empty((x.shape[0], *out_shape, x.shape[-1]), dtype=x.dtype)
+    for a, b in itertools.product(range(out_shape[0]), range(out_shape[1])):
+        window = x[:, positions[0][a]][:, :, positions[1][b]]
+        res[:, a, b] = reduce(window, axis=(1, 2))
+    return res
+
+
+@pytest.mark.parametrize("ceil_mode", [False, True])
+@pytest.mark.parametrize("dilation", [1, 2, 3])
+@pytest.mark.parametrize(
+    ("kernel", "stride", "padding"), [(2, 2, 1), (3, 2, 1), (3, 3, 0)]
+)
+def test_numpy_max_pool2d_windows(kernel, stride, padding, dilation, ceil_mode):
+    numpy_layers = pytest.importorskip(
+        "ivy.functional.backends.numpy.experimental.layers"
+    )
+    x = np.random.default_rng(0).standard_normal((2, 11, 10, 3)).astype("float32")
+    expected = _pool2d_reference(
+        x, kernel, stride, padding, dilation, ceil_mode, np.max
+    )
+    # the dilated windows are strided views of the padded input
+    ret = numpy_layers.max_pool2d(
+        x, kernel, stride, padding, dilation=dilation, ceil_mode=ceil_mode
+    )
+    assert ret.shape == expected.shape
+    assert np.allclose(ret, expected)
+
+
+@pytest.mark.parametrize("ceil_mode", [False, True])
+@pytest.mark.parametrize(
+    ("kernel", "stride", "padding"), [(2, 2, 1), (3, 2, 1), (3, 3, 0)]
+)
+def test_numpy_avg_pool2d_windows(kernel, stride, padding, ceil_mode):
+    numpy_layers = pytest.importorskip(
+        "ivy.functional.backends.numpy.experimental.layers"
+    )
+    x = np.random.default_rng(0).standard_normal((2, 11, 10, 3)).astype("float32")
+    # the padding is left out of the averages, and so is the overhang of ceil_mode
+    expected = _pool2d_reference(x, kernel, stride, padding, 1, ceil_mode, np.mean)
+    ret = numpy_layers.avg_pool2d(
+        x, kernel, stride, [(padding, padding)] * 2, ceil_mode=ceil_mode
+    )
+    assert ret.shape == expected.shape
+    assert np.allclose(ret, expected, atol=1e-6)
+
+
 @st.composite
 def valid_dct(draw):
     dtype, x = draw(
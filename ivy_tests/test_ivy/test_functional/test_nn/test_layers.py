@@ -1,6 +1,8 @@
 """Collection of tests for unified neural network layers."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
@@ -187,27 +189,31 @@ def x_and_scaled_attention(draw, dtypes):
             safety_factor_scale="linear",
         )
     )
-    return dtype, q, k, v, mask, scale
+    is_causal = draw(st.booleans())
+    chunk_size = draw(st.sampled_from([None, 1, 2]))
+    return dtype, q, k, v, mask, scale, is_causal, chunk_size
 
 
 # scaled_dot_product_attention
 @handle_test(
     fn_tree="functional.ivy.scaled_dot_product_attention",
-    dtype_q_k_v_mask_scale=x_and_scaled_attention(
+    dtype_q_k_v_mask_scale_causal_chunk=x_and_scaled_attention(
         dtypes=helpers.get_dtypes("numeric", full=False),
     ),
     ground_truth_backend="jax",
 )
 def test_scaled_dot_product_attention(
     *,
-    dtype_q_k_v_mask_scale,
+    dtype_q_k_v_mask_scale_causal_chunk,
     test_flags,
     backend_fw,
     fn_name,
     on_device,
     ground_truth_backend,
 ):
-    dtype, q, k, v, mask, scale = dtype_q_k_v_mask_scale
+    dtype, q, k, v, mask, scale, is_causal, chunk_size = (
+        dtype_q_k_v_mask_scale_causal_chunk
+    )
     helpers.test_function(
         ground_truth_backend=ground_truth_backend,
         input_dtypes=dtype,
@@ -222,6 +228,8 @@ def test_scaled_dot_product_attention(
         v=v,
         scale=scale,
         mask=mask,
+        is_causal=is_causal,
+        chunk_size=chunk_size,
     )
 
 
@@ -846,6 +854,42 @@ def test_conv_general_transpose(
     )
 
 
+@pytest.mark.parametrize("dims", [1, 2, 3])
+@pytest.mark.parametrize(("strides", "dilations"), [(1, 1), (2, 1), (1, 2), (2, 3)])
+@pytest.mark.parametrize("feature_group_count", [1, 2, 4])
+@pytest.mark.parametrize("max_elements", [1, 150, 250])
+def test_numpy_conv_chunks(
+    dims, strides, dilations, feature_group_count, max_elements, monkeypatch
+):
+    numpy_layers = pytest.importorskip("ivy.functional.backends.numpy.layers")
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((3,) + (9,) * dims + (4,)).astype("float32")
+    # four groups of one input channel each take the depthwise path
+    filters = rng.standard_normal((3,) * dims + (4 // feature_group_count, 4))
+    filters = filters.astype("float32")
+
+    def conv(x, filters):
+        if feature_group_count == 1:
+            fn = getattr(numpy_layers, "conv{}d".format(dims))
+            return fn(x, filters, strides, "SAME", dilations=dilations)
+        return numpy_layers.conv_general_dilated(
+            x,
+            filters,
+            strides,
+            "SAME",
+            dims=dims,
+            feature_group_count=feature_group_count,
+            dilations=dilations,
+        )
+
+    expected = conv(x, filters)
+    # the patch matrices are gathered per batch item, or per output row
+    monkeypatch.setattr(numpy_layers, "_IM2COL_MAX_ELEMENTS", max_elements)
+    ret = conv(x, filters)
+    assert ret.shape == expected.shape
+    assert np.allclose(ret, expected, rtol=1e-5, atol=1e-5)
+
+
 # LSTM #
 # -----#
 
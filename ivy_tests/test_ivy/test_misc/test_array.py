@@ -1,4 +1,5 @@
 # global
+import pickle
 from hypothesis import assume, strategies as st
 import numpy as np
 
@@ -73,6 +74,50 @@ def test_array_function():
 # TODO: avoid using dummy fn_tree in property tests
 
 
+def test_array_lazy_attributes():
+    ivy.set_backend("numpy")
+    data = ivy.native_array([[1.0, 2.0], [3.0, 4.0]])
+    x = Array(data)
+    # metadata is only computed on first access
+    assert x._dtype is None and x._size is None
+    assert x.dtype == ivy.dtype(data)
+    assert x.size == 4
+    assert x.itemsize == ivy.itemsize(data)
+    assert x.strides == ivy.strides(data)
+    # view tracking attributes are only allocated once a view is created
+    assert x._view_refs == () and x._manipulation_stack == ()
+    y = ivy.reshape(x, (4,))
+    assert y._base is x
+    assert [ref() for ref in x._view_refs] == [y]
+    assert len(y._manipulation_stack) == 1
+    ivy.previous_backend()
+
+
+def test_array_pickle_out_of_band(backend_fw, monkeypatch):
+    ivy.set_backend(backend_fw.backend)
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    buffers = []
+    pickled = pickle.dumps(x, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    stack_len = len(ivy.backend_stack)
+
+    def _switch_backend(*args, **kwargs):
+        raise AssertionError("unpickling switched the global backend")
+
+    with monkeypatch.context() as m:
+        m.setattr(ivy, "set_backend", _switch_backend)
+        m.setattr(ivy, "previous_backend", _switch_backend)
+        y = pickle.loads(pickled, buffers=buffers)
+    assert len(ivy.backend_stack) == stack_len
+    assert isinstance(y, Array) and y.backend == x.backend
+    assert ivy.is_native_array(y.data)
+    assert np.array_equal(ivy.to_numpy(y), ivy.to_numpy(x))
+    # protocol 4 still pickles the native array in-band
+    z = pickle.loads(pickle.dumps(x, protocol=4))
+    assert np.array_equal(ivy.to_numpy(z), ivy.to_numpy(x))
+    ivy.previous_backend()
+
+
 @handle_test(
     fn_tree="functional.ivy.native_array",  # dummy fn_tree
     dtype_x=helpers.dtype_and_values(available_dtypes=helpers.get_dtypes("valid")),
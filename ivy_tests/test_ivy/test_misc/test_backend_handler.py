@@ -85,11 +85,15 @@ def test_set_backend(backend, array_type):
     stack_before = []
     func_address_before = id(ivy.sum)
     stack_before.extend(ivy.backend_stack)
+    backend_before = ivy.current_backend_str() if ivy.backend_stack else None
 
     ivy.set_backend(backend)
     stack_after = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.utils.assertions.check_equal(func_address_before, id(ivy.sum), inverse=True)
+    # check that the function id has changed as inverse=True, unless the same
+    # backend was already set, in which case its cached function is reused.
+    ivy.utils.assertions.check_equal(
+        func_address_before, id(ivy.sum), inverse=backend_before != backend
+    )
     # using ivy assertions to ensure the desired backend is set
     ivy.utils.assertions.check_less(len(stack_before), len(stack_after))
     ivy.utils.assertions.check_equal(ivy.current_backend_str(), backend)
@@ -111,10 +115,14 @@ def test_previous_backend(backend):
 
     previous_backend = ivy.previous_backend()
     stack_after_unset = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.utils.assertions.check_equal(
-        func_address_before_unset, id(ivy.sum), inverse=True
-    )
+    # check that the function id has changed as inverse=True, unless the same
+    # backend is still set, in which case its cached function is reused.
+    if not ivy.backend_stack or ivy.current_backend_str() != backend:
+        ivy.utils.assertions.check_equal(
+            func_address_before_unset, id(ivy.sum), inverse=True
+        )
+    else:
+        ivy.utils.assertions.check_equal(func_address_before_unset, id(ivy.sum))
     ivy.utils.assertions.check_equal(
         previous_backend, importlib.import_module(_backend_dict[backend])
     )
@@ -127,6 +135,23 @@ def test_previous_backend(backend):
     ivy.utils.assertions.check_equal(ivy.current_backend_str(), backend)
 
 
+@pytest.mark.parametrize("backend", available_frameworks())
+def test_cached_backend_namespace(backend):
+    ivy.set_backend(backend)
+    wrapped_sum = ivy.sum
+    ivy.previous_backend()
+
+    # the wrapped namespace is only built once, and reused on every later switch
+    with ivy.utils.backend.ContextManager(backend):
+        assert ivy.sum is wrapped_sum
+        assert ivy.current_backend_str() == backend
+    ivy.set_backend(backend)
+    ivy.set_backend("numpy")
+    ivy.previous_backend()
+    assert ivy.sum is wrapped_sum
+    ivy.previous_backend()
+
+
 def test_unset_backend():
     for backend_str in available_frameworks():
         ivy.set_backend(backend_str)
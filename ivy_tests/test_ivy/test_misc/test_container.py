@@ -1749,6 +1749,103 @@ def test_container_deep_copy(on_device):
     assert id(cont.b.d) != id(cont_deepcopy.b.d)
 
 
+def test_container_pack(on_device):
+    cont = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {
+                "c": ivy.array([[3.0], [4.0]], device=on_device),
+                "d": ivy.array([5, 6], device=on_device),
+            },
+        }
+    )
+    packed = cont.cont_pack()
+    assert cont.cont_packed_buffers is None
+    buffers = packed.cont_packed_buffers
+    assert len(buffers) == 2
+    assert np.allclose(ivy.to_numpy(buffers[0]), np.array([1.0, 2.0, 3.0, 4.0]))
+    assert packed.b.c.shape == (2, 1)
+    assert np.allclose(ivy.to_numpy(packed.b.d), np.array([5, 6]))
+
+    # elementwise operations between packed containers stay packed
+    ret = packed * 2 + packed
+    assert ret.cont_packed_buffers is not None
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([[9.0], [12.0]]))
+    ret = ivy.Container.static_add(packed, 1)
+    assert ret.cont_packed_buffers is not None
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([2.0, 3.0]))
+
+    # per-leaf norms broadcast back over the leaves
+    floats = Container(a=cont.a, c=cont.b.c).cont_pack()
+    norms = ivy.Container.static_vector_norm(floats)
+    assert np.allclose(ivy.to_numpy(norms.c), 5.0)
+    ret = floats / norms
+    assert ret.cont_packed_buffers is not None
+    assert np.allclose(ivy.to_numpy(ret.c), np.array([[0.6], [0.8]]))
+
+    # containers packed like another one can be combined with it
+    other = packed.cont_map(lambda x, kc: x + 1).cont_pack(like=packed)
+    assert (packed - other).cont_packed_buffers is not None
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        Container(a=cont.a).cont_pack(like=packed)
+
+    # replacing a leaf unpacks the container
+    packed.a = ivy.array([0.0, 0.0], device=on_device)
+    assert packed.cont_packed_buffers is None
+    assert np.allclose(ivy.to_numpy((packed * 2).a), np.array([0.0, 0.0]))
+
+
+def test_container_packed_inplace_operators(on_device):
+    packed = Container(
+        a=ivy.array([1.0, 2.0], device=on_device),
+        b=ivy.array([[3.0], [4.0]], device=on_device),
+        c=ivy.array([5, 6], device=on_device),
+    ).cont_pack()
+    alias_a, alias_c = packed.a, packed.c
+    packed_before = packed
+    packed += 1
+    packed *= 2
+    packed -= 1
+    packed **= 1
+    assert packed is packed_before
+    # the leaves are updated in place, so the arrays aliasing them see the update
+    assert np.allclose(ivy.to_numpy(alias_a), np.array([3.0, 5.0]))
+    assert np.allclose(ivy.to_numpy(alias_c), np.array([11, 13]))
+    assert np.allclose(ivy.to_numpy(packed.b), np.array([[7.0], [9.0]]))
+    if ivy.inplace_arrays_supported():
+        assert packed.cont_packed_buffers is not None
+
+    floats = Container(a=alias_a).cont_pack()
+    alias_a = floats.a
+    floats /= 2
+    assert np.allclose(ivy.to_numpy(alias_a), np.array([1.5, 2.5]))
+
+
+@pytest.mark.parametrize("optimizer_class", [ivy.SGD, ivy.Adam, ivy.LAMB, ivy.LARS])
+def test_container_packed_optimizer_step(optimizer_class, on_device):
+    v = Container(
+        {
+            "w": ivy.array([[1.0, -2.0], [3.0, 0.5]], device=on_device),
+            "b": ivy.array([0.25, -1.0], device=on_device),
+        }
+    )
+    grads = Container(
+        {
+            "w": ivy.array([[0.1, 0.2], [-0.3, 0.4]], device=on_device),
+            "b": ivy.array([0.5, -0.5], device=on_device),
+        }
+    )
+    optimizer = optimizer_class(lr=0.1)
+    packed_optimizer = optimizer_class(lr=0.1)
+    packed_v = v.cont_pack()
+    for _ in range(2):
+        v = optimizer.step(v, grads)
+        packed_v = packed_optimizer.step(packed_v, grads)
+        assert packed_v.cont_packed_buffers is not None
+    assert np.allclose(ivy.to_numpy(packed_v.w), ivy.to_numpy(v.w), atol=1e-6)
+    assert np.allclose(ivy.to_numpy(packed_v.b), ivy.to_numpy(v.b), atol=1e-6)
+
+
 def test_container_contains(on_device):
     arr0 = ivy.array([0.0], device=on_device)
     arr1 = ivy.array([1.0], device=on_device)
@@ -2541,6 +2638,47 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_from_disk_as_hdf5_lazy_and_iter(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    container = Container(
+        {
+            "a": ivy.array(np.arange(10, dtype=np.float32), device=on_device),
+            "b": {"c": ivy.array(np.arange(20).reshape(10, 2), device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    # lazy loading only reads the sliced rows
+    lazy_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(2, 8), lazy=True
+    )
+    assert lazy_container.b.c.shape == (6, 2)
+    sliced = lazy_container[1:3]
+    assert np.array_equal(ivy.to_numpy(sliced.a), np.array([3.0, 4.0]))
+    assert np.array_equal(ivy.to_numpy(sliced.b.c), np.array([[6, 7], [8, 9]]))
+    assert np.array_equal(
+        ivy.to_numpy(lazy_container.a[...]), np.arange(2, 8, dtype=np.float32)
+    )
+
+    # iterating in batches
+    batches = list(Container.cont_iter_from_disk_as_hdf5(save_filepath, 4))
+    assert [batch.a.shape[0] for batch in batches] == [4, 4, 2]
+    assert np.array_equal(
+        np.concatenate([ivy.to_numpy(batch.b.c) for batch in batches]),
+        ivy.to_numpy(container.b.c),
+    )
+    batches = list(
+        Container.cont_iter_from_disk_as_hdf5(save_filepath, 4, drop_last=True)
+    )
+    assert len(batches) == 2
+
+    del lazy_container, sliced
+    os.remove(save_filepath)
+
+
 def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2637,6 +2775,105 @@ def test_container_to_and_from_disk_as_pickled(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_flat(on_device):
+    save_filepath = "container_on_disk.flat"
+    dict_in = {
+        "a": ivy.array([np.float32(1.0)], device=on_device),
+        "b": {
+            "c": ivy.array([[1, 2], [3, 4]], dtype="int32", device=on_device),
+            "d": ivy.array(np.float64(3.0), device=on_device),
+        },
+    }
+    container = Container(dict_in)
+
+    # saving
+    container.cont_to_disk_as_flat(save_filepath)
+    assert os.path.exists(save_filepath)
+
+    # loading
+    for mmap in [True, False]:
+        loaded_container = Container.cont_from_disk_as_flat(save_filepath, mmap=mmap)
+        assert ivy.Container.cont_identical_structure([container, loaded_container])
+        for key_chain, value in container.cont_to_iterator():
+            loaded_value = ivy.to_numpy(loaded_container[key_chain])
+            assert loaded_value.dtype == ivy.to_numpy(value).dtype
+            assert np.array_equal(loaded_value, ivy.to_numpy(value))
+        del loaded_container
+
+    os.remove(save_filepath)
+
+
+def _data_loader_batch(index):
+    if index == 5:
+        raise ValueError("bad batch")
+    return {
+        "x": np.full((4, 3), index, dtype="float32"),
+        "y": {"z": np.arange(index + 1)},
+    }
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("slot_size", [2**16, 8])
+def test_container_data_loader(ordered, slot_size):
+    with ivy.ContainerDataLoader(
+        _data_loader_batch,
+        5,
+        num_workers=2,
+        prefetch=3,
+        ordered=ordered,
+        slot_size=slot_size,
+        copy=True,
+        timeout=60.0,
+    ) as loader:
+        batches = list(loader)
+        assert loader.stats["batches"] == 5
+        assert 0.0 <= loader.stall_fraction <= 1.0
+    indices = [int(ivy.to_numpy(batch.x)[0, 0]) for batch in batches]
+    if ordered:
+        assert indices == list(range(5))
+    else:
+        assert sorted(indices) == list(range(5))
+    for index, batch in zip(indices, batches):
+        assert isinstance(batch, ivy.Container)
+        assert np.array_equal(ivy.to_numpy(batch.y.z), np.arange(index + 1))
+
+    # errors of the workers are raised in the consumer
+    with ivy.ContainerDataLoader(_data_loader_batch, 6, timeout=60.0) as loader:
+        with pytest.raises(ivy.utils.exceptions.IvyException, match="bad batch"):
+            list(loader)
+
+    with pytest.raises(ivy.utils.exceptions.IvyException, match="timeout"):
+        ivy.ContainerDataLoader(_data_loader_batch, 5, timeout=0)
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_container_data_loader_w_shared_slots(num_workers):
+    # the batches are read in place, so they are checked before the next one
+    with ivy.ContainerDataLoader(
+        _data_loader_batch, 5, num_workers=num_workers, prefetch=1, timeout=60.0
+    ) as loader:
+        indices = []
+        for batch in loader:
+            index = int(ivy.to_numpy(batch.x)[0, 0])
+            assert np.array_equal(ivy.to_numpy(batch.y.z), np.arange(index + 1))
+            indices.append(index)
+        assert indices == list(range(5))
+
+        # an iteration left early does not leak its batches into the next one
+        for index, batch in enumerate(loader):
+            if index == 2:
+                break
+        assert [int(ivy.to_numpy(b.x)[0, 0]) for b in loader] == list(range(5))
+
+        # the loader is iterated once at a time
+        batches = iter(loader)
+        next(batches)
+        with pytest.raises(ivy.utils.exceptions.IvyException, match="in progress"):
+            next(iter(loader))
+        batches.close()
+        assert len(list(loader)) == 5
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -2787,7 +3024,8 @@ def test_container_from_queues(on_device):
                     "a": [
                         ivy.to_native(ivy.array([1.0, 2.0, 3.0], device=on_device))
                         * worker_id
-                    ] * load_size
+                    ]
+                    * load_size
                 }
             )
 
@@ -145,3 +145,42 @@ def test_views(array_to_update):
     assert np.allclose(c, c_copy + 1)
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
+
+
+@pytest.mark.parametrize(
+    ("fn_name", "x1", "x2"),
+    [
+        ("add", [1.0, 2.0], [3.0, 4.0]),
+        ("matmul", [[1.0, 2.0], [3.0, 4.0]], [[0.5], [1.0]]),
+    ],
+)
+def test_fast_dispatch(fn_name, x1, x2):
+    ivy.set_backend("numpy")
+    fn = ivy.__dict__[fn_name]
+    assert getattr(fn, "fast_dispatch", False)
+    full_fn = fn.__wrapped__
+    x1, x2 = ivy.array(x1), ivy.array(x2)
+    # plain arrays take the fast path, and match the full decorator chain
+    ret = fn(x1, x2)
+    assert type(ret) is ivy.Array
+    assert np.allclose(ret.data, full_fn(x1, x2).data)
+    # native arrays in the inputs still give ivy arrays back
+    assert type(fn(x1.data, x2)) is ivy.Array
+    # containers fall back to the container implementation
+    cont_ret = fn(ivy.Container(a=x1), x2)
+    assert isinstance(cont_ret, ivy.Container)
+    assert np.allclose(cont_ret.a.data, ret.data)
+    # out falls back to the inplace update handling
+    out = ivy.zeros_like(ret)
+    assert fn(x1, x2, out=out) is out
+    assert np.allclose(out.data, ret.data)
+    ivy.previous_backend()
+
+
+def test_fast_dispatch_array_like():
+    ivy.set_backend("numpy")
+    # array-likes passed for array arguments are converted by the full chain
+    ret = ivy.abs([-1.0, 2.0])
+    assert type(ret) is ivy.Array
+    assert np.allclose(ret.data, [1.0, 2.0])
+    ivy.previous_backend()
@@ -0,0 +1,84 @@
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+
+
+def _rows():
+    return [
+        np.arange(6, dtype=np.float32).reshape(3, 2),
+        np.arange(2, dtype=np.float32).reshape(1, 2) + 10,
+        np.arange(8, dtype=np.float32).reshape(4, 2) - 5,
+    ]
+
+
+# Tests #
+# ------#
+
+
+def test_nested_array_rows():
+    rows = _rows()
+    x = ivy.NestedArray.nested_array([ivy.array(row) for row in rows])
+    assert x.shape == [3, None, 2]
+    assert len(x) == 3
+    assert np.array_equal(ivy.to_numpy(x.row_offsets), [0, 6, 8, 16])
+    assert np.array_equal(ivy.to_numpy(x.row_lengths), [3, 1, 4])
+    for i, row in enumerate(rows):
+        assert np.array_equal(ivy.to_numpy(x[i]), row)
+    assert np.array_equal(ivy.to_numpy(x[-1]), rows[-1])
+    sliced = x[1:]
+    assert sliced.shape == [2, None, 2]
+    assert np.array_equal(ivy.to_numpy(sliced[0]), rows[1])
+    with pytest.raises(IndexError):
+        x[3]
+
+
+def test_nested_array_from_row_lengths():
+    x = ivy.NestedArray.from_row_lengths(ivy.arange(10), [4, 0, 6])
+    assert x.shape == [3, None]
+    assert x[1].shape == (0,)
+    assert np.array_equal(ivy.to_numpy(x[2]), np.arange(4, 10))
+    y = ivy.NestedArray.from_row_split(ivy.arange(10), [0, 4, 4, 10])
+    assert np.array_equal(ivy.to_numpy(y.values), ivy.to_numpy(x.values))
+
+
+def test_nested_array_padded_round_trip():
+    rows = _rows()
+    x = ivy.NestedArray.nested_array([ivy.array(row) for row in rows])
+    padded = x.to_padded(pad_value=-1)
+    assert tuple(padded.shape) == (3, 4, 2)
+    for i, row in enumerate(rows):
+        assert np.array_equal(ivy.to_numpy(padded[i, : len(row)]), row)
+        assert np.all(ivy.to_numpy(padded[i, len(row) :]) == -1)
+    y = ivy.NestedArray.from_padded(padded, x.row_lengths)
+    assert np.array_equal(ivy.to_numpy(y.values), ivy.to_numpy(x.values))
+
+
+def test_nested_array_row_reductions():
+    rows = _rows()
+    x = ivy.NestedArray.nested_array([ivy.array(row) for row in rows])
+    assert np.allclose(ivy.to_numpy(x.row_sum()), [row.sum() for row in rows])
+    assert np.allclose(ivy.to_numpy(x.row_mean()), [row.mean() for row in rows])
+    assert np.allclose(ivy.to_numpy(x.row_max()), [row.max() for row in rows])
+    assert np.allclose(ivy.to_numpy(x.row_min()), [row.min() for row in rows])
+
+
+def test_nested_array_elementwise():
+    rows = _rows()
+    x = ivy.NestedArray.nested_array([ivy.array(row) for row in rows])
+    y = 2 * x + x - 1
+    for i, row in enumerate(rows):
+        assert np.allclose(ivy.to_numpy(y[i]), 3 * row - 1)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        x + x[1:]
+
+
+def test_nested_array_reshape():
+    x = ivy.NestedArray.nested_array([ivy.array(row) for row in _rows()])
+    x.reshape([3, -1, 1, 2])
+    assert x.shape == [3, None, 1, 2]
+    assert x[0].shape == (3, 1, 2)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        x.reshape([3, 2, 1, 2])
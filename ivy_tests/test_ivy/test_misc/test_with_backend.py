@@ -6,6 +6,7 @@ from hypothesis import strategies as st, given, settings, HealthCheck
 # Local
 import ivy
 import numpy as np
+from ivy.utils.backend import ast_helpers
 from ivy.utils.backend.handler import _backend_dict
 
 
@@ -51,6 +52,29 @@ def test_with_backend_cached(backend_fw):
     assert non_cached_local_ivy == cached_local_ivy
 
 
+def test_with_backend_compiled_code_cache(backend_fw, tmp_path, monkeypatch):
+    ast_helpers._clear_compiled_modules_cache()
+    ast_helpers.set_compiled_modules_cache_dir(str(tmp_path))
+    try:
+        first_local_ivy = ivy.with_backend(backend_fw.backend)
+        assert len(list(tmp_path.glob("*.ivyc"))) > 0
+
+        def _parse(*args, **kwargs):
+            raise AssertionError("cached module was parsed again")
+
+        monkeypatch.setattr(ast_helpers, "parse", _parse)
+        # code objects are reused from memory, then loaded from disk
+        second_local_ivy = ivy.with_backend(backend_fw.backend)
+        ast_helpers._clear_compiled_modules_cache()
+        third_local_ivy = ivy.with_backend(backend_fw.backend)
+    finally:
+        ast_helpers.set_compiled_modules_cache_dir(None)
+    assert first_local_ivy is not second_local_ivy
+    assert second_local_ivy.add is not third_local_ivy.add
+    x = third_local_ivy.array([1.0, 2.0])
+    assert np.allclose(third_local_ivy.to_numpy(third_local_ivy.add(x, x)), [2, 4])
+
+
 def test_is_local(backend_fw):
     local_ivy = ivy.with_backend(backend_fw.backend, cached=True)
     assert local_ivy.is_local()
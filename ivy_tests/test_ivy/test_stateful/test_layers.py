@@ -186,6 +186,7 @@ def x_and_mha(draw):
     dropout_rate = draw(st.floats(min_value=0.0, max_value=0.9))
     context_dim = draw(st.integers(min_value=1, max_value=3))
     scale = draw(st.integers(min_value=1, max_value=3))
+    chunk_size = draw(st.sampled_from([None, 1, 2]))
 
     num_queries = draw(st.integers(min_value=1, max_value=3))
     # x_feats = draw(st.integers(min_value=1, max_value=3))
@@ -238,6 +239,7 @@ def x_and_mha(draw):
         with_to_q_fn,
         with_to_kv_fn,
         with_to_out_fn,
+        chunk_size,
     )
 
 
@@ -278,6 +280,7 @@ def test_multi_head_attention_layer(
         with_to_q_fn,
         with_to_kv_fn,
         with_to_out_fn,
+        chunk_size,
     ) = dtype_mha
     ret_np_flat, ret_np_from_gt_flat = helpers.test_method(
         ground_truth_backend=ground_truth_backend,
@@ -292,6 +295,7 @@ def test_multi_head_attention_layer(
             "with_to_q_fn": with_to_q_fn,
             "with_to_kv_fn": with_to_kv_fn,
             "with_to_out_fn": with_to_out_fn,
+            "chunk_size": chunk_size,
             "build_mode": build_mode,
             "device": on_device,
             "dtype": input_dtype[0],
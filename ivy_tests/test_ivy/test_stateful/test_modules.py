@@ -3,6 +3,7 @@
 # global
 from hypothesis import given, strategies as st
 import numpy as np
+from unittest.mock import patch
 
 # local
 import ivy
@@ -1009,3 +1010,50 @@ def test_module_track_submod_call_order(
             module._dl0._l0.v.cont_flatten_key_chains().to_numpy(),
         ]
     )
+
+
+# forward without tracking
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_call_without_tracking(
+    batch_shape, input_channels, output_channels, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = WithNestedModules(input_channels, output_channels, device=on_device)
+
+    # the forward pass never switches the backend
+    with patch("ivy.utils.backend.handler.set_backend") as set_backend:
+        ret = module(x)
+        assert not set_backend.called
+    assert ret.shape == tuple(list(batch_shape) + [64])
+
+    # the tracking containers are only created when accessed
+    assert module._submod_rets is None
+    assert module._submod_call_order is None
+    assert module.submod_rets.cont_to_flat_list() == []
+    assert module.submod_call_order.cont_to_flat_list() == []
+
+
+# save and load weights
+@given(flat=st.booleans())
+def test_module_save_and_load_weights(flat, on_device, tmp_path_factory):
+    weights_path = str(tmp_path_factory.mktemp("weights") / "weights")
+    module = TrainableModule(3, 2, device=on_device)
+    module.save_weights(weights_path, flat=flat)
+    loaded = TrainableModule(3, 2, device=on_device)
+    loaded.load_weights(weights_path, flat=flat)
+    assert ivy.Container.cont_identical_structure([module.v, loaded.v])
+    for saved_v, loaded_v in zip(
+        module.v.cont_to_flat_list(), loaded.v.cont_to_flat_list()
+    ):
+        assert np.array_equal(ivy.to_numpy(saved_v), ivy.to_numpy(loaded_v))
+    x = ivy.ones((1, 3), dtype="float32")
+    assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(loaded(x)))
@@ -0,0 +1,49 @@
+"""
+Report how many `ivy.Array` instances can be constructed per second, and the
+memory each one takes on top of the native array it wraps.
+
+Usage::
+
+    python scripts/benchmarks/array_allocation.py --backend numpy --number 100000
+"""
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+import ivy
+
+
+def array_allocation(backend="numpy", number=100000):
+    ivy.set_backend(backend)
+    native = ivy.native_array([1.0, 2.0, 3.0])
+    per_call = (
+        min(timeit.repeat(lambda: ivy.Array(native), repeat=5, number=number)) / number
+    )
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    arrays = [ivy.Array(native) for _ in range(number)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # exclude the list holding the arrays
+    bytes_per_array = (end - start - arrays.__sizeof__()) / number
+    # include the first metadata access, which is no longer done on construction
+    with_metadata = min(
+        timeit.repeat(lambda: ivy.Array(native).dtype, repeat=5, number=number // 10)
+    ) / (number // 10)
+    ivy.previous_backend()
+    return {
+        "arrays/sec": 1 / per_call,
+        "arrays/sec (with .dtype)": 1 / with_metadata,
+        "bytes/array": bytes_per_array,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=100000)
+    parsed = parser.parse_args()
+    for name, value in array_allocation(parsed.backend, parsed.number).items():
+        print("{:<28}{:>14.1f}".format(name, value))
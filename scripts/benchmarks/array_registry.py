@@ -0,0 +1,44 @@
+"""
+Report the time of counting the live ivy arrays on a device and of a dynamic backend
+switch, with and without the array registry, while the process holds many other
+Python objects.
+
+Usage::
+
+    python scripts/benchmarks/array_registry.py --arrays 1000 --objects 1000000
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def array_registry(arrays=1000, objects=1_000_000):
+    ivy.set_backend("numpy")
+    heap = [[i] for i in range(objects)]
+    xs = [ivy.array([float(i)]) for i in range(arrays)]
+    results = dict()
+    for mode in (False, True):
+        name = "registry" if mode else "gc scan"
+        ivy.set_array_registry_mode(mode)
+        start = time.perf_counter()
+        ivy.num_ivy_arrays_on_dev("cpu")
+        results[f"{name} query ms"] = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        ivy.set_backend("numpy", dynamic=True)
+        results[f"{name} dynamic switch ms"] = (time.perf_counter() - start) * 1e3
+        ivy.previous_backend()
+        ivy.unset_array_registry_mode()
+    del heap, xs
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--arrays", type=int, default=1000)
+    parser.add_argument("--objects", type=int, default=1_000_000)
+    parsed = parser.parse_args()
+    for name, value in array_registry(parsed.arrays, parsed.objects).items():
+        print("{:<28}{:>12.3f}".format(name, value))
@@ -0,0 +1,56 @@
+"""
+Report the time of a cache hit of ivy.cache_fn with an array argument, keying the
+array by identity against formatting its contents into the key.
+
+Usage::
+
+    python scripts/benchmarks/cache_fn.py --size 100000 --calls 100
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def _str_keyed(func):
+    # the previous implementation, formatting every argument into the key
+    cache = dict()
+
+    def cached_fn(*args, **kwargs):
+        key = "".join(
+            [str(i) + ", " for i in args]
+            + [" kw, "]
+            + [str(i) + ", " for i in sorted(kwargs.items())]
+        )
+        if key not in cache:
+            cache[key] = func(*args, **kwargs)
+        return cache[key]
+
+    return cached_fn
+
+
+def cache_fn(size=100000, calls=100):
+    ivy.set_backend("numpy")
+    x = ivy.random_uniform(shape=(size,))
+    results = dict()
+    for name, fn in (
+        ("str key us", _str_keyed(ivy.sum)),
+        ("identity key us", ivy.cache_fn(ivy.sum)),
+    ):
+        fn(x)
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn(x)
+        results[name] = (time.perf_counter() - start) / calls * 1e6
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--calls", type=int, default=100)
+    parsed = parser.parse_args()
+    for name, value in cache_fn(parsed.size, parsed.calls).items():
+        print("{:<24}{:>12.2f}".format(name, value))
@@ -0,0 +1,49 @@
+"""
+Report the peak memory and time of ivy.scaled_dot_product_attention on the NumPy
+backend against sequence length, processing all keys at once and in chunks.
+
+Usage::
+
+    python scripts/benchmarks/chunked_attention.py --lengths 512 1024 2048
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def chunked_attention(lengths=(512, 1024, 2048), features=64, chunk_size=128):
+    ivy.set_backend("numpy")
+    results = dict()
+    for length in lengths:
+        q, k, v = (
+            np.random.rand(1, length, features).astype(np.float32) for _ in range(3)
+        )
+        for name, size in (("full", None), ("chunked", chunk_size)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            ivy.scaled_dot_product_attention(
+                q, k, v, features**-0.5, is_causal=True, chunk_size=size
+            )
+            elapsed = (time.perf_counter() - start) * 1e3
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+            results["{} {} MB".format(name, length)] = peak
+            results["{} {} ms".format(name, length)] = elapsed
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[512, 1024, 2048])
+    parser.add_argument("--features", type=int, default=64)
+    parser.add_argument("--chunk_size", type=int, default=128)
+    parsed = parser.parse_args()
+    results = chunked_attention(parsed.lengths, parsed.features, parsed.chunk_size)
+    for name, value in results.items():
+        print("{:<24}{:>12.2f}".format(name, value))
@@ -0,0 +1,73 @@
+"""
+Report the runtime and peak memory of the NumPy backend convolutions.
+
+Usage::
+
+    python scripts/benchmarks/conv.py --batch 8 --size 32 --channels 16 --number 5
+"""
+import argparse
+import timeit
+import tracemalloc
+
+import numpy as np
+
+import ivy.functional.backends.numpy as ivy_np
+
+
+def _cases(batch, size, channels):
+    rng = np.random.default_rng(0)
+
+    def arr(*shape):
+        return rng.standard_normal(shape).astype(np.float32)
+
+    x1, x2, x3 = (
+        arr(batch, size * size, channels),
+        arr(batch, size, size, channels),
+        arr(batch, size // 4, size // 2, size // 2, channels),
+    )
+    f1, f2, f3 = (
+        arr(3, channels, 2 * channels),
+        arr(3, 3, channels, 2 * channels),
+        arr(3, 3, 3, channels, 2 * channels),
+    )
+    return {
+        "conv1d": lambda: ivy_np.conv1d(x1, f1, 1, "SAME"),
+        "conv2d": lambda: ivy_np.conv2d(x2, f2, 1, "SAME"),
+        "conv2d (strided)": lambda: ivy_np.conv2d(x2, f2, 2, "SAME"),
+        "conv3d": lambda: ivy_np.conv3d(x3, f3, 1, "SAME"),
+        "depthwise_conv2d": lambda: ivy_np.depthwise_conv2d(
+            x2, arr(3, 3, channels), 1, "SAME"
+        ),
+        "conv_general_dilated (groups=4)": lambda: ivy_np.conv_general_dilated(
+            x2, arr(3, 3, channels // 4, 2 * channels), 1, "SAME", feature_group_count=4
+        ),
+        "conv2d_transpose": lambda: ivy_np.conv2d_transpose(
+            x2, arr(3, 3, channels, 2 * channels), 2, "SAME"
+        ),
+    }
+
+
+def conv(batch=8, size=32, channels=16, number=5):
+    rows = []
+    for name, fn in _cases(batch, size, channels).items():
+        per_call = min(timeit.repeat(fn, repeat=3, number=number)) / number
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rows.append((name, per_call * 1e3, peak / 2**20))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--batch", type=int, default=8)
+    parser.add_argument("--size", type=int, default=32)
+    parser.add_argument("--channels", type=int, default=16)
+    parser.add_argument("--number", type=int, default=5)
+    parsed = parser.parse_args()
+    print("{:<34}{:>12}{:>14}".format("op", "ms/call", "peak MiB"))
+    for name, ms, mib in conv(
+        parsed.batch, parsed.size, parsed.channels, parsed.number
+    ):
+        print("{:<34}{:>12.2f}{:>14.1f}".format(name, ms, mib))
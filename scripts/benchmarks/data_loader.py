@@ -0,0 +1,67 @@
+"""
+Report the time of an epoch over batches produced by a slow loading function, when
+loaded serially and through ivy.ContainerDataLoader, with the stall fraction.
+
+Usage::
+
+    python scripts/benchmarks/data_loader.py --batches 64 --workers 4 --load-ms 20
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+class _Loader:
+    def __init__(self, load_ms, batch_size):
+        self.load_ms = load_ms
+        self.batch_size = batch_size
+
+    def __call__(self, index):
+        time.sleep(self.load_ms / 1e3)
+        return {
+            "images": np.full((self.batch_size, 3, 64, 64), index, dtype=np.float32),
+            "labels": np.arange(self.batch_size),
+        }
+
+
+def data_loader(batches=64, workers=4, load_ms=20.0, step_ms=5.0, batch_size=32):
+    ivy.set_backend("numpy")
+    batch_fn = _Loader(load_ms, batch_size)
+    results = dict()
+    start = time.perf_counter()
+    for index in range(batches):
+        ivy.Container(batch_fn(index)).to_ivy()
+        time.sleep(step_ms / 1e3)
+    results["serial epoch ms"] = (time.perf_counter() - start) * 1e3
+    for ordered in [True, False]:
+        name = "ordered" if ordered else "unordered"
+        with ivy.ContainerDataLoader(
+            batch_fn, batches, num_workers=workers, ordered=ordered
+        ) as loader:
+            start = time.perf_counter()
+            for _ in loader:
+                time.sleep(step_ms / 1e3)
+            results["{} epoch ms".format(name)] = (time.perf_counter() - start) * 1e3
+            results["{} stall fraction".format(name)] = loader.stall_fraction
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--batches", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--load-ms", type=float, default=20.0)
+    parser.add_argument("--step-ms", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parsed = parser.parse_args()
+    for name, value in data_loader(
+        parsed.batches,
+        parsed.workers,
+        parsed.load_ms,
+        parsed.step_ms,
+        parsed.batch_size,
+    ).items():
+        print("{:<24}{:>12.3f}".format(name, value))
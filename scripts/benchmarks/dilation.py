@@ -0,0 +1,43 @@
+"""
+Report the runtime of dilated NumPy backend convolutions and max pools.
+
+Usage::
+
+    python scripts/benchmarks/dilation.py --size 64 --channels 16 --number 5
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+import ivy.functional.backends.numpy as ivy_np
+
+
+def dilation(size=64, channels=16, number=5, max_dilation=8):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((4, size, size, channels)).astype(np.float32)
+    filters = rng.standard_normal((3, 3, channels, channels)).astype(np.float32)
+    rows = []
+    for d in range(1, max_dilation + 1):
+        row = [d]
+        for fn in (
+            lambda: ivy_np.conv2d(x, filters, 1, "SAME", dilations=d),
+            lambda: ivy_np.max_pool2d(x, 3, 1, "SAME", dilation=d),
+        ):
+            row.append(min(timeit.repeat(fn, repeat=3, number=number)) / number)
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--channels", type=int, default=16)
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--max_dilation", type=int, default=8)
+    parsed = parser.parse_args()
+    print("{:<10}{:>16}{:>20}".format("dilation", "conv2d ms", "max_pool2d ms"))
+    for d, conv, pool in dilation(
+        parsed.size, parsed.channels, parsed.number, parsed.max_dilation
+    ):
+        print("{:<10}{:>16.2f}{:>20.2f}".format(d, conv * 1e3, pool * 1e3))
@@ -0,0 +1,55 @@
+"""
+Report the per-call overhead of wrapped ivy functions on tiny inputs.
+
+Each function is timed through the fast path dispatcher, through the full
+decorator chain which the dispatcher falls back to, and as the raw backend call.
+
+Usage::
+
+    python scripts/benchmarks/dispatch_overhead.py --backend numpy --number 20000
+"""
+import argparse
+import timeit
+
+import ivy
+
+
+def _per_call_us(fn, args, number):
+    timer = timeit.Timer(lambda: fn(*args))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def dispatch_overhead(backend="numpy", number=20000):
+    ivy.set_backend(backend)
+    vec = ivy.array([1.0, 2.0, 3.0])
+    mat = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    cases = {
+        "add": (vec, vec),
+        "matmul": (mat, mat),
+    }
+    backend_module = ivy.current_backend()
+    rows = []
+    for name, args in cases.items():
+        fn = ivy.__dict__[name]
+        full_fn = fn.__wrapped__ if getattr(fn, "fast_dispatch", False) else fn
+        native_args = [arg.data for arg in args]
+        rows.append(
+            (
+                name,
+                _per_call_us(fn, args, number),
+                _per_call_us(full_fn, args, number),
+                _per_call_us(backend_module.__dict__[name], native_args, number),
+            )
+        )
+    ivy.previous_backend()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=20000)
+    parsed = parser.parse_args()
+    print("{:<8}{:>14}{:>14}{:>14}".format("fn", "fast (us)", "full (us)", "raw (us)"))
+    for name, fast, full, raw in dispatch_overhead(parsed.backend, parsed.number):
+        print("{:<8}{:>14.2f}{:>14.2f}{:>14.2f}".format(name, fast, full, raw))
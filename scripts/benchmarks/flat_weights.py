@@ -0,0 +1,56 @@
+"""
+Report the time of loading the weights of a large container saved as hdf5, as a flat
+file read into memory, and as a memory mapped flat file.
+
+Usage::
+
+    python scripts/benchmarks/flat_weights.py --leaves 64 --leaf-size 262144
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import ivy
+
+
+def flat_weights(leaves=64, leaf_size=262144):
+    ivy.set_backend("numpy")
+    container = ivy.Container(
+        {
+            "layer{}".format(i): {
+                "w": ivy.array(np.random.rand(leaf_size).astype(np.float32))
+            }
+            for i in range(leaves)
+        }
+    )
+    directory = tempfile.mkdtemp()
+    h5_filepath = os.path.join(directory, "weights.hdf5")
+    flat_filepath = os.path.join(directory, "weights.flat")
+    container.cont_to_disk_as_hdf5(h5_filepath)
+    container.cont_to_disk_as_flat(flat_filepath)
+    results = dict()
+    start = time.perf_counter()
+    ivy.Container.cont_from_disk_as_hdf5(h5_filepath)
+    results["hdf5 load ms"] = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    ivy.Container.cont_from_disk_as_flat(flat_filepath, mmap=False)
+    results["flat read ms"] = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    ivy.Container.cont_from_disk_as_flat(flat_filepath)
+    results["flat mmap ms"] = (time.perf_counter() - start) * 1e3
+    os.remove(h5_filepath)
+    os.remove(flat_filepath)
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--leaves", type=int, default=64)
+    parser.add_argument("--leaf-size", type=int, default=262144)
+    parsed = parser.parse_args()
+    for name, value in flat_weights(parsed.leaves, parsed.leaf_size).items():
+        print("{:<24}{:>12.3f}".format(name, value))
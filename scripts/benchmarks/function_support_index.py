@@ -0,0 +1,40 @@
+"""
+Report the time of querying the unsupported dtypes of ivy functions on the NumPy
+backend, parsing the functions on the first query and reading the index after it.
+
+Usage::
+
+    python scripts/benchmarks/function_support_index.py --queries 100
+"""
+
+import argparse
+import time
+
+import ivy
+
+
+def function_support_index(queries=100):
+    ivy.set_backend("numpy")
+    fns = (ivy.layer_norm, ivy.multi_head_attention, ivy.lstm_update, ivy.vmap)
+    results = dict()
+    start = time.perf_counter()
+    for fn in fns:
+        ivy.function_unsupported_dtypes(fn)
+    results["first query ms"] = (time.perf_counter() - start) / len(fns) * 1e3
+    start = time.perf_counter()
+    for _ in range(queries):
+        for fn in fns:
+            ivy.function_unsupported_dtypes(fn)
+    results["indexed query ms"] = (
+        (time.perf_counter() - start) / queries / len(fns) * 1e3
+    )
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--queries", type=int, default=100)
+    parsed = parser.parse_args()
+    for name, value in function_support_index(parsed.queries).items():
+        print("{:<24}{:>12.3f}".format(name, value))
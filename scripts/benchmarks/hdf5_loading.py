@@ -0,0 +1,53 @@
+"""
+Report how fast a container saved as hdf5 can be loaded back, in full and in
+batches.
+
+Usage::
+
+    python scripts/benchmarks/hdf5_loading.py --rows 1000000 --features 16
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import ivy
+
+
+def hdf5_loading(rows=1000000, features=16, batch_size=4096):
+    ivy.set_backend("numpy")
+    container = ivy.Container(
+        {
+            "features": ivy.array(np.random.rand(rows, features).astype(np.float32)),
+            "labels": ivy.array(np.random.randint(0, 10, rows)),
+        }
+    )
+    filepath = os.path.join(tempfile.mkdtemp(), "container.hdf5")
+    container.cont_to_disk_as_hdf5(filepath)
+    nbytes = os.path.getsize(filepath)
+    results = dict()
+    start = time.perf_counter()
+    ivy.Container.cont_from_disk_as_hdf5(filepath)
+    results["full load MB/s"] = nbytes / 2**20 / (time.perf_counter() - start)
+    if hasattr(ivy.Container, "cont_iter_from_disk_as_hdf5"):
+        start = time.perf_counter()
+        for _ in ivy.Container.cont_iter_from_disk_as_hdf5(filepath, batch_size):
+            pass
+        results["batched load MB/s"] = nbytes / 2**20 / (time.perf_counter() - start)
+    os.remove(filepath)
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--features", type=int, default=16)
+    parser.add_argument("--batch_size", type=int, default=4096)
+    parsed = parser.parse_args()
+    for name, value in hdf5_loading(
+        parsed.rows, parsed.features, parsed.batch_size
+    ).items():
+        print("{:<24}{:>12.1f}".format(name, value))
@@ -0,0 +1,51 @@
+"""
+Report the time of ivy.lstm_update on the NumPy backend over a long sequence, using
+the backend kernel against the ivy composition.
+
+Usage::
+
+    python scripts/benchmarks/lstm.py --timesteps 1000 --hidden 64
+"""
+
+import argparse
+import inspect
+import time
+
+import numpy as np
+
+import ivy
+
+
+def lstm(batch_size=8, timesteps=1000, hidden=64, repeats=5):
+    ivy.set_backend("numpy")
+    x = np.random.rand(batch_size, timesteps, hidden).astype(np.float32)
+    init_h = np.zeros((batch_size, hidden), dtype=np.float32)
+    init_c = np.zeros((batch_size, hidden), dtype=np.float32)
+    kernel = np.random.rand(hidden, 4 * hidden).astype(np.float32) * 0.1
+    recurrent_kernel = np.random.rand(hidden, 4 * hidden).astype(np.float32) * 0.1
+    bias = np.random.rand(4 * hidden).astype(np.float32)
+    results = dict()
+    for name, fn in (
+        # the composition in ivy.functional.ivy, bypassing the backend kernel
+        ("composition ms", inspect.unwrap(ivy.functional.ivy.layers.lstm_update)),
+        ("backend ms", ivy.lstm_update),
+    ):
+        fn(x, init_h, init_c, kernel, recurrent_kernel, bias=bias)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            fn(x, init_h, init_c, kernel, recurrent_kernel, bias=bias)
+        results[name] = (time.perf_counter() - start) / repeats * 1e3
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--batch_size", type=int, default=8)
+    parser.add_argument("--timesteps", type=int, default=1000)
+    parser.add_argument("--hidden", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=5)
+    parsed = parser.parse_args()
+    results = lstm(parsed.batch_size, parsed.timesteps, parsed.hidden, parsed.repeats)
+    for name, value in results.items():
+        print("{:<24}{:>12.2f}".format(name, value))
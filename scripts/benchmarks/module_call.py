@@ -0,0 +1,54 @@
+"""
+Report the per-call latency of a small `ivy.Sequential` of `ivy.Linear` layers.
+
+The forward pass is timed with and without submodule return tracking, the
+untracked pass does not create any tracking containers nor switch the backend.
+
+Usage::
+
+    python scripts/benchmarks/module_call.py --backend numpy --num-layers 4
+"""
+import argparse
+import timeit
+
+import ivy
+
+
+def _per_call_us(fn, number):
+    return min(timeit.repeat(fn, repeat=5, number=number)) / number * 1e6
+
+
+def module_call(backend="numpy", num_layers=4, width=8, batch_size=2, number=300):
+    ivy.set_backend(backend)
+    module = ivy.Sequential(*[ivy.Linear(width, width) for _ in range(num_layers)])
+    x = ivy.random_uniform(shape=(batch_size, width))
+    # build the module before timing
+    module(x)
+    rows = [
+        ("forward", _per_call_us(lambda: module(x), number)),
+        (
+            "forward (tracked)",
+            _per_call_us(lambda: module(x, track_submod_rets=True), number),
+        ),
+    ]
+    ivy.previous_backend()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--num-layers", type=int, default=4)
+    parser.add_argument("--width", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=2)
+    parser.add_argument("--number", type=int, default=300)
+    parsed = parser.parse_args()
+    print("{:<20}{:>14}".format("call", "latency (us)"))
+    for name, latency in module_call(
+        parsed.backend,
+        parsed.num_layers,
+        parsed.width,
+        parsed.batch_size,
+        parsed.number,
+    ):
+        print("{:<20}{:>14.2f}".format(name, latency))
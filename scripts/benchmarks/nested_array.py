@@ -0,0 +1,68 @@
+"""
+Report the time of the ivy.NestedArray operations on variable length rows, against
+the same operations on a list of row arrays.
+
+Usage::
+
+    python scripts/benchmarks/nested_array.py --backend numpy --rows 4000 --width 8
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e3
+
+
+def _pad_rows(rows, max_length):
+    return ivy.stack(
+        [ivy.pad(row, [(0, max_length - row.shape[0]), (0, 0)]) for row in rows]
+    )
+
+
+def nested_array(backend="numpy", rows=4000, width=8, repeats=5):
+    ivy.set_backend(backend)
+    rng = np.random.default_rng(0)
+    row_lengths = rng.integers(1, 64, rows)
+    values = ivy.array(rng.standard_normal((int(row_lengths.sum()), width)))
+    row_list = [
+        ivy.array(row)
+        for row in np.split(ivy.to_numpy(values), np.cumsum(row_lengths)[:-1])
+    ]
+    nested = ivy.NestedArray.nested_array(row_list)
+    max_length = int(row_lengths.max())
+    cases = {
+        "list construct ms": lambda: [ivy.asarray(row) for row in row_list],
+        "nested construct ms": lambda: ivy.NestedArray.nested_array(row_list),
+        "from_row_lengths ms": lambda: ivy.NestedArray.from_row_lengths(
+            values, row_lengths
+        ),
+        "list pad ms": lambda: _pad_rows(row_list, max_length),
+        "nested to_padded ms": lambda: nested.to_padded(),
+        "list row sums ms": lambda: ivy.stack([ivy.sum(row) for row in row_list]),
+        "nested row_sum ms": lambda: nested.row_sum(),
+        "list elementwise ms": lambda: [row * 2.0 + 1.0 for row in row_list],
+        "nested elementwise ms": lambda: nested * 2.0 + 1.0,
+    }
+    return {name: _time(fn, repeats) for name, fn in cases.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument("--rows", type=int, default=4000)
+    parser.add_argument("--width", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=5)
+    parsed = parser.parse_args()
+    for name, value in nested_array(
+        parsed.backend, parsed.rows, parsed.width, parsed.repeats
+    ).items():
+        print("{:<24}{:>12.3f}".format(name, value))
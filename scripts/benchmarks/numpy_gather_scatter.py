@@ -0,0 +1,76 @@
+"""
+Report the time of the numpy backend batched gather and scatter reductions on a
+graph style workload, against the per batch take and ufunc.at implementations they
+replace.
+
+Usage::
+
+    python scripts/benchmarks/numpy_gather_scatter.py --edges 2000000 --nodes 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+from ivy.functional.backends.numpy import general
+
+
+def _loop_gather(params, indices, axis, batch_dims):
+    zip_list = [(p, i) for p, i in zip(params, indices)]
+    for _ in range(1, batch_dims):
+        zip_list = [(p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z]
+    result = np.array([np.take(p, i, axis - batch_dims) for p, i in zip_list])
+    return result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
+
+
+def _time(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return (time.perf_counter() - start) * 1e3
+
+
+def numpy_gather_scatter(edges=2000000, nodes=100000, features=16, graphs=256):
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    results = dict()
+
+    # message passing, edge features summed (or max pooled) into their target nodes
+    receivers = rng.integers(0, nodes, edges)
+    messages = rng.random((edges, features), dtype=np.float32)
+    for reduction, ufunc in [("sum", np.add), ("max", np.maximum)]:
+        target = np.zeros((nodes, features), dtype=np.float32)
+        results["ufunc.at {} ms".format(reduction)] = _time(
+            ufunc.at, target, (receivers, Ellipsis), messages
+        )
+        target = np.zeros((nodes, features), dtype=np.float32)
+        results["scatter {} ms".format(reduction)] = _time(
+            general._scatter_reduce,
+            target,
+            receivers[:, None],
+            messages,
+            reduction,
+        )
+
+    # batch of graphs, gathering the node features of each graph's edge senders
+    nodes_per_graph = nodes // graphs
+    params = rng.random((graphs, nodes_per_graph, features), dtype=np.float32)
+    indices = rng.integers(0, nodes_per_graph, (graphs, edges // graphs))
+    results["loop gather ms"] = _time(_loop_gather, params, indices, 1, 1)
+    results["batched gather ms"] = _time(
+        general.gather, params, indices, axis=1, batch_dims=1
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--edges", type=int, default=2000000)
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--features", type=int, default=16)
+    parser.add_argument("--graphs", type=int, default=256)
+    parsed = parser.parse_args()
+    for name, value in numpy_gather_scatter(
+        parsed.edges, parsed.nodes, parsed.features, parsed.graphs
+    ).items():
+        print("{:<24}{:>12.3f}".format(name, value))
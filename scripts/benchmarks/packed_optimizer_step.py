@@ -0,0 +1,57 @@
+"""
+Report the time of an optimizer step over a container with many small leaves, with
+and without packing the container into flat buffers.
+
+Usage::
+
+    python scripts/benchmarks/packed_optimizer_step.py --leaves 1000 --steps 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def packed_optimizer_step(leaves=1000, steps=10):
+    ivy.set_backend("numpy")
+
+    def _random_container():
+        return ivy.Container(
+            {
+                "layer{}".format(i): {
+                    "w": ivy.array(np.random.rand(16, 16).astype(np.float32)),
+                    "b": ivy.array(np.random.rand(16).astype(np.float32)),
+                }
+                for i in range(leaves // 2)
+            }
+        )
+
+    v, grads = _random_container(), _random_container()
+    results = dict()
+    for optimizer_class in (ivy.SGD, ivy.Adam, ivy.LAMB, ivy.LARS):
+        for packed in (False, True):
+            optimizer = optimizer_class(lr=1e-3)
+            new_v = v.cont_pack() if packed else v
+            step_grads = grads.cont_pack(like=new_v) if packed else grads
+            new_v = optimizer.step(new_v, step_grads)
+            start = time.perf_counter()
+            for _ in range(steps):
+                new_v = optimizer.step(new_v, step_grads)
+            name = "{} {} ms".format(
+                optimizer_class.__name__, "packed" if packed else "leaf-wise"
+            )
+            results[name] = (time.perf_counter() - start) / steps * 1e3
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--leaves", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=10)
+    parsed = parser.parse_args()
+    for name, value in packed_optimizer_step(parsed.leaves, parsed.steps).items():
+        print("{:<24}{:>12.2f}".format(name, value))
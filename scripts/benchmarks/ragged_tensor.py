@@ -0,0 +1,67 @@
+"""
+Report the time to build a RaggedTensor of the TensorFlow frontend and convert it to
+dense batches, for rows of random lengths such as tokenized sentences.
+
+Usage::
+
+    python scripts/benchmarks/ragged_tensor.py --backend numpy --rows 4000 --batch 64
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+import ivy.functional.frontends.tensorflow as tf_frontend
+
+
+def _time(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e3
+
+
+def ragged_tensor(backend="numpy", rows=4000, batch=64, repeats=5):
+    ivy.set_backend(backend)
+    ragged = tf_frontend.ragged.RaggedTensor
+    rng = np.random.default_rng(0)
+    row_lengths = rng.integers(1, 128, rows)
+    row_splits = np.concatenate([[0], np.cumsum(row_lengths)])
+    value_rowids = np.repeat(np.arange(rows), row_lengths)
+    values = ivy.array(rng.integers(0, 30000, int(row_lengths.sum())))
+    rt = ragged.from_row_lengths(values, row_lengths)
+    dense = rt.to_tensor()
+    cases = {
+        "from_row_lengths ms": lambda: ragged.from_row_lengths(values, row_lengths),
+        "from_row_splits ms": lambda: ragged.from_row_splits(values, row_splits),
+        "from_value_rowids ms": lambda: ragged.from_value_rowids(values, value_rowids),
+        "to_tensor ms": lambda: rt.to_tensor(),
+        "from_tensor ms": lambda: ragged.from_tensor(dense, lengths=row_lengths),
+        "bucket_by_length ms": lambda: rt.bucket_by_length(batch),
+    }
+    results = {name: _time(fn, repeats) for name, fn in cases.items()}
+    # the fraction of padding of the batches, without and with the bucketing
+    num_values = int(row_lengths.sum())
+    padded = sum(
+        int(row_lengths[i : i + batch].max()) * len(row_lengths[i : i + batch])
+        for i in range(0, rows, batch)
+    )
+    bucketed = sum(int(np.prod(b.shape)) for _, b in rt.bucket_by_length(batch))
+    results["padding %"] = 100 * (1 - num_values / padded)
+    results["bucketed padding %"] = 100 * (1 - num_values / bucketed)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument("--rows", type=int, default=4000)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=5)
+    parsed = parser.parse_args()
+    for name, value in ragged_tensor(
+        parsed.backend, parsed.rows, parsed.batch, parsed.repeats
+    ).items():
+        print("{:<24}{:>12.3f}".format(name, value))
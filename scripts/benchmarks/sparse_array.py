@@ -0,0 +1,66 @@
+"""
+Report the time to densify and convert an ivy.SparseArray, and of the sparse kernels
+against their dense equivalents, for a random square matrix.
+
+Usage::
+
+    python scripts/benchmarks/sparse_array.py --backend numpy --size 4096 --nnz 200000
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e3
+
+
+def sparse_array(backend="numpy", size=4096, nnz=200000, repeats=5):
+    ivy.set_backend(backend)
+    # the backends without native sparse arrays warn on every construction
+    logging.disable(logging.WARNING)
+    rng = np.random.default_rng(0)
+    flat = np.sort(rng.choice(size * size, nnz, replace=False))
+    rows, cols = np.divmod(flat, size)
+    values = rng.standard_normal(nnz).astype(np.float32)
+    coo = ivy.SparseArray(
+        coo_indices=np.stack([rows, cols]),
+        values=values,
+        dense_shape=(size, size),
+        format="coo",
+    )
+    csr = coo.to_csr()
+    dense = csr.to_dense_array()
+    y = ivy.array(rng.standard_normal((size, 16)).astype(np.float32))
+    cases = {
+        "coo to_dense_array ms": lambda: coo.to_dense_array(),
+        "csr to_dense_array ms": lambda: csr.to_dense_array(),
+        "coo to_csr ms": lambda: coo.to_csr(),
+        "csr to_csc ms": lambda: csr.to_csc(),
+        "csr matmul ms": lambda: csr @ y,
+        "dense matmul ms": lambda: ivy.matmul(dense, y),
+        "csr row sums ms": lambda: csr.sum(axis=1),
+        "dense row sums ms": lambda: ivy.sum(dense, axis=1),
+    }
+    return {name: _time(fn, repeats) for name, fn in cases.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument("--size", type=int, default=4096)
+    parser.add_argument("--nnz", type=int, default=200000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parsed = parser.parse_args()
+    for name, value in sparse_array(
+        parsed.backend, parsed.size, parsed.nnz, parsed.repeats
+    ).items():
+        print("{:<24}{:>12.3f}".format(name, value))
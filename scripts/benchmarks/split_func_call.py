@@ -0,0 +1,51 @@
+"""
+Report the time of ivy.split_func_call on the NumPy backend, sequentially, on a
+thread pool, and with the chunk size picked from a memory budget.
+
+Usage::
+
+    python scripts/benchmarks/split_func_call.py --rows 8192 --workers 4
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def split_func_call(rows=8192, features=4096, workers=4, repeats=3):
+    ivy.set_backend("numpy")
+    x = ivy.array(np.random.rand(rows, features).astype(np.float32))
+
+    def func(t):
+        return ivy.sin(ivy.exp(t))
+
+    configs = {
+        "sequential ms": dict(chunk_size=rows // 16),
+        "threaded ms": dict(chunk_size=rows // 16, num_workers=workers),
+        "memory budget ms": dict(
+            memory_budget=x.size * x.itemsize // 4, num_workers=workers
+        ),
+    }
+    results = dict()
+    for name, kwargs in configs.items():
+        ivy.split_func_call(func, [x], "concat", **kwargs)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            ivy.split_func_call(func, [x], "concat", **kwargs)
+        results[name] = (time.perf_counter() - start) / repeats * 1e3
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=8192)
+    parser.add_argument("--features", type=int, default=4096)
+    parser.add_argument("--workers", type=int, default=4)
+    parsed = parser.parse_args()
+    for name, value in split_func_call(
+        parsed.rows, parsed.features, parsed.workers
+    ).items():
+        print("{:<24}{:>12.3f}".format(name, value))
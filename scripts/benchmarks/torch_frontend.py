@@ -0,0 +1,57 @@
+"""
+Report the overhead of the torch frontend over the backend, as the time per call of
+common Tensor methods on small tensors.
+
+Usage::
+
+    python scripts/benchmarks/torch_frontend.py --backend numpy --size 8 --calls 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time(fn, calls):
+    for _ in range(calls // 10):
+        fn()
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def torch_frontend(backend="numpy", size=8, calls=2000):
+    ivy.set_backend(backend)
+    import ivy.functional.frontends.torch as torch
+
+    x = torch.tensor(np.random.rand(size, size).astype(np.float32))
+    y = torch.tensor(np.random.rand(size, size).astype(np.float32))
+    native = x.ivy_array.data
+    backend_add = ivy.current_backend().add
+    cases = {
+        "Tensor.add us": lambda: x.add(y),
+        "Tensor.__mul__ us": lambda: x * y,
+        "Tensor.__mul__ scalar us": lambda: x * 2.0,
+        "Tensor.matmul us": lambda: x.matmul(y),
+        "Tensor.sum us": lambda: x.sum(),
+        "Tensor.relu us": lambda: x.relu(),
+        "Tensor.reshape us": lambda: x.reshape(size * size),
+        "torch.zeros us": lambda: torch.zeros(size, size),
+        "backend add us": lambda: backend_add(native, native),
+    }
+    return {name: _time(fn, calls) for name, fn in cases.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument("--size", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=2000)
+    parsed = parser.parse_args()
+    for name, value in torch_frontend(
+        parsed.backend, parsed.size, parsed.calls
+    ).items():
+        print("{:<24}{:>12.3f}".format(name, value))
@@ -0,0 +1,55 @@
+"""
+Report the time per call of the nest functions on a nest of arrays, such as the
+arguments and state dicts passed through the function wrappers.
+
+Usage::
+
+    python scripts/benchmarks/tree_flatten.py --backend numpy --leaves 64 --calls 2000
+"""
+import argparse
+import time
+
+import ivy
+
+
+def _time(fn, calls):
+    for _ in range(calls // 10):
+        fn()
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def tree_flatten(backend="numpy", leaves=64, calls=2000):
+    ivy.set_backend(backend)
+    x = ivy.array([1.0, 2.0])
+    groups = max(leaves // 4, 1)
+    nest = {
+        "layer{}".format(i): {"w": [x, x], "b": (x, {"scale": x})}
+        for i in range(groups)
+    }
+    args = ([x, 2], {"alpha": 0.5})
+    identity = lambda v: v  # noqa: E731
+    cases = {
+        "tree_flatten us": lambda: ivy.tree_flatten(nest),
+        "nested_map us": lambda: ivy.nested_map(nest, identity, shallow=False),
+        "nested_map shallow us": lambda: ivy.nested_map(nest, identity),
+        "copy_nest us": lambda: ivy.copy_nest(nest),
+        "nested_any us": lambda: ivy.nested_any(nest, lambda v: v is None),
+        "nested_argwhere us": lambda: ivy.nested_argwhere(nest, ivy.is_array),
+        "first array us": lambda: ivy.func_wrapper._get_first_array(*args),
+    }
+    return {name: _time(fn, calls) for name, fn in cases.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument("--leaves", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=2000)
+    parsed = parser.parse_args()
+    for name, value in tree_flatten(
+        parsed.backend, parsed.leaves, parsed.calls
+    ).items():
+        print("{:<24}{:>12.3f}".format(name, value))
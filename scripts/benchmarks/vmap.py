@@ -0,0 +1,53 @@
+"""
+Report the time of ivy.vmap on the NumPy backend, batching the function once over
+the whole batch against calling it once per example.
+
+Usage::
+
+    python scripts/benchmarks/vmap.py --batch_size 1000 --features 64
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _mlp(x, w1, w2):
+    return ivy.softmax(ivy.matmul(ivy.relu(ivy.matmul(x, w1) + 0.1), w2), axis=-1)
+
+
+def _loop(x, w1, w2):
+    # the previous implementation, mapping the function over the examples
+    return np.stack([_mlp(example, w1, w2) for example in x])
+
+
+def vmap(batch_size=1000, features=64, repeats=10):
+    ivy.set_backend("numpy")
+    x = np.random.rand(batch_size, features).astype(np.float32)
+    w1 = np.random.rand(features, features).astype(np.float32)
+    w2 = np.random.rand(features, 10).astype(np.float32)
+    results = dict()
+    for name, fn in (
+        ("loop ms", _loop),
+        ("vmap ms", ivy.vmap(_mlp, in_axes=(0, None, None))),
+    ):
+        fn(x, w1, w2)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            fn(x, w1, w2)
+        results[name] = (time.perf_counter() - start) / repeats * 1e3
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--batch_size", type=int, default=1000)
+    parser.add_argument("--features", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=10)
+    parsed = parser.parse_args()
+    for name, value in vmap(parsed.batch_size, parsed.features, parsed.repeats).items():
+        print("{:<24}{:>12.2f}".format(name, value))
@@ -0,0 +1,49 @@
+"""
+Report the time of instantiating a local backend with ivy.with_backend, transforming
+every module on the first call, loading the transformed code from the on-disk cache
+and reusing the code cached in memory.
+
+Usage::
+
+    python scripts/benchmarks/with_backend.py --backend numpy --repeats 5
+"""
+
+import argparse
+import tempfile
+import time
+
+import ivy
+from ivy.utils.backend import ast_helpers
+
+
+def _time_with_backend(backend, repeats, clear_memory_cache):
+    elapsed = 0.0
+    for _ in range(repeats):
+        if clear_memory_cache:
+            ast_helpers._clear_compiled_modules_cache()
+        start = time.perf_counter()
+        ivy.with_backend(backend)
+        elapsed += time.perf_counter() - start
+    return elapsed / repeats * 1e3
+
+
+def with_backend(backend="numpy", repeats=5):
+    results = dict()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ast_helpers._clear_compiled_modules_cache()
+        results["transformed ms"] = _time_with_backend(backend, 1, True)
+        ast_helpers.set_compiled_modules_cache_dir(cache_dir)
+        _time_with_backend(backend, 1, True)
+        results["disk cached ms"] = _time_with_backend(backend, repeats, True)
+        ast_helpers.set_compiled_modules_cache_dir(None)
+    results["memory cached ms"] = _time_with_backend(backend, repeats, False)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument("--repeats", type=int, default=5)
+    parsed = parser.parse_args()
+    for name, value in with_backend(parsed.backend, parsed.repeats).items():
+        print("{:<24}{:>12.3f}".format(name, value))